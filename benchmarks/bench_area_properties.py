@@ -0,0 +1,51 @@
+"""
+Times the enclosed area and the area properties of every path of a catalogue, one Path2 at a time and in a
+batch over PackedPath2s, as the material usage of a quote needs them.
+
+Run from the repository root:
+    python -m benchmarks.bench_area_properties
+    python -m benchmarks.bench_area_properties --fields 5000
+"""
+import argparse
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.two_d.area_properties import get_area_properties_of_paths
+from geometry_utils.two_d.packed_path2 import PackedPath2
+
+from benchmarks.corpus import INCLUDE_VARIABLES, generate_corpus
+
+
+def run(number_of_fields=2000):
+    interpreter = PathFieldInterpreter()
+    interpreter.variables = dict(INCLUDE_VARIABLES)
+    paths = []
+    for path_field in generate_corpus(number_of_fields):
+        paths.extend(interpreter.load_path(path_field))
+    packed_paths = [PackedPath2.from_path2(path) for path in paths]
+    edges = sum(path.path_length for path in paths)
+    arcs = sum(1 for path in paths for edge in path.list_of_edges if edge.is_arc())
+
+    def areas():
+        for path in paths:
+            path.invalidate()
+            path.get_enclosed_area()
+
+    def properties():
+        for path in paths:
+            path.invalidate()
+        get_area_properties_of_paths(paths)
+
+    area_seconds = min(timeit.repeat(areas, number=1, repeat=3))
+    properties_seconds = min(timeit.repeat(properties, number=1, repeat=3))
+    packed_seconds = min(timeit.repeat(lambda: get_area_properties_of_paths(packed_paths), number=1, repeat=3))
+    print('%d paths, %d edges, %d arcs' % (len(paths), edges, arcs))
+    print('get_enclosed_area %.1f ms, get_area_properties %.1f ms, PackedPath2 batch %.1f ms, %.2f us per edge'
+          % (area_seconds * 1000.0, properties_seconds * 1000.0, packed_seconds * 1000.0,
+             packed_seconds / edges * 1e6))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Area properties benchmark')
+    parser.add_argument('--fields', type=int, default=2000, help='the number of path fields in the catalogue')
+    run(parser.parse_args().fields)
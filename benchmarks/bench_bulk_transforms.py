@@ -0,0 +1,57 @@
+"""
+Times rotating, mirroring and offsetting a catalogue of paths edge by edge with the Path2 methods against the
+bulk transforms of geometry_utils.two_d.bulk_transforms, on Path2s and on PackedPath2s.
+
+Run from the repository root:
+    python -m benchmarks.bench_bulk_transforms
+    python -m benchmarks.bench_bulk_transforms --fields 500
+"""
+import argparse
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.two_d import bulk_transforms
+from geometry_utils.two_d.bulk_transforms import mirror_paths, offset_paths, rotate_paths
+from geometry_utils.two_d.packed_path2 import PackedPath2
+from geometry_utils.two_d.vector2 import Vector2
+
+from benchmarks.corpus import INCLUDE_VARIABLES, generate_corpus
+
+OPERATIONS = (('rotate', lambda path: path.rotate(30.0), lambda paths: rotate_paths(paths, 30.0)),
+              ('mirror_y', lambda path: path.mirror_y(), lambda paths: mirror_paths(paths, 'y')),
+              ('offset', lambda path: path.offset(Vector2(5.0, 5.0)),
+               lambda paths: offset_paths(paths, Vector2(5.0, 5.0))))
+
+
+def load_paths(number_of_fields):
+    interpreter = PathFieldInterpreter()
+    interpreter.variables = dict(INCLUDE_VARIABLES)
+    paths = []
+    for path_field in generate_corpus(number_of_fields):
+        paths.extend(interpreter.load_path(path_field))
+    return paths
+
+
+def best_time(function, repeat=3):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def run(number_of_fields=2000):
+    paths = load_paths(number_of_fields)
+    packed_paths = [PackedPath2.from_path2(path) for path in paths]
+    edges = sum(path.path_length for path in paths)
+    print('%d paths, %d edges, NumPy %s' % (len(paths), edges,
+                                           'installed' if bulk_transforms.numpy is not None else 'missing'))
+    for name, path_method, bulk_function in OPERATIONS:
+        loop_seconds = best_time(lambda: [path_method(path) for path in paths])
+        bulk_seconds = best_time(lambda: bulk_function(paths))
+        packed_seconds = best_time(lambda: bulk_function(packed_paths))
+        print('%-9s Path2 methods %7.3f s, bulk Path2 %7.3f s (%.1fx), bulk PackedPath2 %7.3f s (%.1fx)'
+              % (name, loop_seconds, bulk_seconds, loop_seconds / bulk_seconds,
+                 packed_seconds, loop_seconds / packed_seconds))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Bulk path transform benchmark')
+    parser.add_argument('--fields', type=int, default=2000, help='the number of path fields in the catalogue')
+    run(parser.parse_args().fields)
@@ -0,0 +1,53 @@
+"""
+Times Path2.get_convex_hull on outlines of increasing size, with and without the bulges of arcs.
+
+Run from the repository root:
+    python -m benchmarks.bench_convex_hull
+    python -m benchmarks.bench_convex_hull --vertices 1000000
+"""
+import argparse
+import math
+import random
+import timeit
+
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.path2 import Path2
+from geometry_utils.two_d.point2 import Point2
+
+
+def make_outline(number_of_vertices, arc_every=0):
+    """
+    Returns a closed, roughly elliptical outline with every vertex near its hull, the worst case for a hull,
+    with every arc_every-th edge an arc
+    """
+    random.seed(number_of_vertices)
+    points = [Point2(math.cos(math.pi * 2.0 * index / number_of_vertices) * 1000.0 + random.random(),
+                     math.sin(math.pi * 2.0 * index / number_of_vertices) * 500.0 + random.random())
+              for index in range(number_of_vertices)]
+    path = Path2()
+    for index, point in enumerate(points):
+        next_point = points[(index + 1) % number_of_vertices]
+        if arc_every and index % arc_every == 0:
+            edge = Edge2(point, next_point.clone(), 2.0 * point.distance_to(next_point), False)
+        else:
+            edge = Edge2(point, next_point.clone())
+        path.list_of_edges.append(edge)
+    return path
+
+
+def run(largest=100000):
+    number_of_vertices = 1000
+    while number_of_vertices <= largest:
+        path = make_outline(number_of_vertices)
+        arc_path = make_outline(number_of_vertices, 10)
+        seconds = min(timeit.repeat(path.get_convex_hull, number=1, repeat=3))
+        arc_seconds = min(timeit.repeat(lambda: arc_path.get_convex_hull(True), number=1, repeat=3))
+        print('%8d vertices: %8.1f ms, with arcs %8.1f ms, %d hull vertices'
+              % (number_of_vertices, seconds * 1000.0, arc_seconds * 1000.0, path.get_convex_hull().path_length))
+        number_of_vertices *= 10
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Convex hull benchmark')
+    parser.add_argument('--vertices', type=int, default=100000, help='the size of the largest outline')
+    run(parser.parse_args().vertices)
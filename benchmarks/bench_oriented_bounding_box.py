@@ -0,0 +1,55 @@
+"""
+Times the oriented bounding boxes of every part of a catalogue, as nesting needs them, one Path2 at a time and
+in a batch over PackedPath2s, and of single large outlines.
+
+Run from the repository root:
+    python -m benchmarks.bench_oriented_bounding_box
+    python -m benchmarks.bench_oriented_bounding_box --fields 5000
+"""
+import argparse
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.two_d.oriented_bounding_box import get_oriented_bounding_boxes
+from geometry_utils.two_d.packed_path2 import PackedPath2
+
+from benchmarks.bench_convex_hull import make_outline
+from benchmarks.corpus import INCLUDE_VARIABLES, generate_corpus
+
+
+def run(number_of_fields=2000):
+    interpreter = PathFieldInterpreter()
+    interpreter.variables = dict(INCLUDE_VARIABLES)
+    paths = []
+    for path_field in generate_corpus(number_of_fields):
+        paths.extend(path for path in interpreter.load_path(path_field) if path.path_length >= 3)
+    packed_paths = [PackedPath2.from_path2(path) for path in paths]
+
+    def each_path():
+        for path in paths:
+            path.invalidate()
+            path.get_oriented_bounding_box()
+
+    def batch():
+        for path in paths:
+            path.invalidate()
+        get_oriented_bounding_boxes(paths)
+
+    path_seconds = min(timeit.repeat(each_path, number=1, repeat=3))
+    batch_seconds = min(timeit.repeat(batch, number=1, repeat=3))
+    packed_seconds = min(timeit.repeat(lambda: get_oriented_bounding_boxes(packed_paths), number=1, repeat=3))
+    print('%d parts: Path2 %.1f ms, batch of Path2s %.1f ms, batch of PackedPath2s %.1f ms, %.1f us per part'
+          % (len(paths), path_seconds * 1000.0, batch_seconds * 1000.0, packed_seconds * 1000.0,
+             packed_seconds / len(paths) * 1e6))
+
+    for number_of_vertices in (1000, 10000, 100000):
+        outline = make_outline(number_of_vertices)
+        seconds = min(timeit.repeat(lambda: (outline.invalidate(), outline.get_oriented_bounding_box()),
+                                    number=1, repeat=3))
+        print('%8d vertex outline: %8.1f ms' % (number_of_vertices, seconds * 1000.0))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Oriented bounding box benchmark')
+    parser.add_argument('--fields', type=int, default=2000, help='the number of path fields in the catalogue')
+    run(parser.parse_args().fields)
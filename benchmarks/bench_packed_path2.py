@@ -0,0 +1,69 @@
+"""
+Compares the memory held by a catalogue of paths loaded as Path2s and packed as PackedPath2s, and times
+packing and unpacking them.
+
+Run from the repository root:
+    python -m benchmarks.bench_packed_path2
+    python -m benchmarks.bench_packed_path2 --edges 100000
+"""
+import argparse
+import gc
+import timeit
+import tracemalloc
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.two_d.packed_path2 import PackedPath2
+
+from benchmarks.corpus import INCLUDE_VARIABLES, generate_corpus
+
+
+def load_catalogue(number_of_edges):
+    """
+    Returns the Path2s of a corpus with at least number_of_edges edges, and the memory they hold
+    """
+    interpreter = PathFieldInterpreter()
+    interpreter.variables = dict(INCLUDE_VARIABLES)
+    path_fields = generate_corpus(number_of_edges // 8)
+    interpreter.load_path(path_fields[0])
+    gc.collect()
+    tracemalloc.start()
+    paths = []
+    edges = 0
+    for path_field in path_fields:
+        for path in interpreter.load_path(path_field):
+            paths.append(path)
+            edges += path.path_length
+        if edges >= number_of_edges:
+            break
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return paths, edges, size
+
+
+def run(number_of_edges=1000000):
+    paths, edges, path2_size = load_catalogue(number_of_edges)
+
+    gc.collect()
+    tracemalloc.start()
+    packed_paths = [PackedPath2.from_path2(path) for path in paths]
+    packed_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    sample = paths[:2000]
+    packed_sample = packed_paths[:2000]
+    sample_edges = sum(path.path_length for path in sample)
+    pack_seconds = min(timeit.repeat(lambda: [PackedPath2.from_path2(path) for path in sample], number=1, repeat=3))
+    unpack_seconds = min(timeit.repeat(lambda: [path.to_path2() for path in packed_sample], number=1, repeat=3))
+
+    print('%d paths, %d edges' % (len(paths), edges))
+    print('Path2       %8.1f MB, %6.1f bytes per edge' % (path2_size / 1e6, float(path2_size) / edges))
+    print('PackedPath2 %8.1f MB, %6.1f bytes per edge, %.1fx smaller'
+          % (packed_size / 1e6, float(packed_size) / edges, float(path2_size) / packed_size))
+    print('from_path2 %.2f us per edge, to_path2 %.2f us per edge'
+          % (pack_seconds / sample_edges * 1e6, unpack_seconds / sample_edges * 1e6))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='PackedPath2 memory benchmark')
+    parser.add_argument('--edges', type=int, default=1000000, help='the number of edges in the catalogue')
+    run(parser.parse_args().edges)
@@ -0,0 +1,58 @@
+"""
+Times repeated queries of the derived properties of unchanged Path2s, with cache_properties set so that they are
+cached against the version of the path, against the same queries made after invalidating the path each time.
+
+Run from the repository root:
+    python -m benchmarks.bench_path2_cache
+    python -m benchmarks.bench_path2_cache --queries 50
+"""
+import argparse
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+from benchmarks.corpus import INCLUDE_VARIABLES, generate_corpus
+
+QUERIES = (('is_closed', lambda path: path.is_closed),
+           ('is_continuous', lambda path: path.is_continuous),
+           ('get_bounds', lambda path: path.get_bounds()),
+           ('get_enclosed_area', lambda path: path.get_enclosed_area()),
+           ('get_list_of_points', lambda path: path.get_list_of_points()))
+
+
+def run(number_of_queries=20, number_of_fields=300):
+    interpreter = PathFieldInterpreter()
+    interpreter.variables = dict(INCLUDE_VARIABLES)
+    paths = []
+    for path_field in generate_corpus(number_of_fields):
+        paths.extend(interpreter.load_path(path_field))
+    for path in paths:
+        path.cache_properties = True
+    edges = sum(path.path_length for path in paths)
+    print('%d paths, %d edges, %d queries of each path' % (len(paths), edges, number_of_queries))
+
+    for name, query in QUERIES:
+        def uncached():
+            for path in paths:
+                for _ in range(number_of_queries):
+                    path.invalidate()
+                    query(path)
+
+        def cached():
+            for path in paths:
+                path.invalidate()
+                for _ in range(number_of_queries):
+                    query(path)
+
+        uncached_seconds = min(timeit.repeat(uncached, number=1, repeat=3))
+        cached_seconds = min(timeit.repeat(cached, number=1, repeat=3))
+        print('%-19s recalculated %7.3f s, cached %7.3f s, %.1fx faster'
+              % (name, uncached_seconds, cached_seconds, uncached_seconds / cached_seconds))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Path2 derived property cache benchmark')
+    parser.add_argument('--queries', type=int, default=20, help='the number of times each path is queried')
+    parser.add_argument('--fields', type=int, default=300, help='the number of path fields in the catalogue')
+    arguments = parser.parse_args()
+    run(arguments.queries, arguments.fields)
@@ -0,0 +1,54 @@
+"""
+Compares instantiating a compiled PathField template for a batch of bindings at once, as packed columns
+and as Path2s, against instantiating it for one binding at a time.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_batch
+"""
+import timeit
+
+from geometry_utils import path_field_batch
+from geometry_utils.path_field_batch import instantiate_batch
+from geometry_utils.path_field_template import compile_template
+
+from benchmarks.bench_path_field_template import PANEL
+
+
+def size_table(count):
+    """
+    Returns the sizes of a quote as columns, with some panels having square corners so the batch is split
+    """
+    return {'W': [300.0 + index % 500 for index in range(count)],
+            'H': [500.0 + (index * 7) % 900 for index in range(count)],
+            'R': [0.0 if index % 10 == 0 else 20.0 + index % 25 for index in range(count)],
+            'X': [40.0 + index % 60 for index in range(count)],
+            'Y': [250.0 + index % 100 for index in range(count)],
+            'M': [25.0] * count}
+
+
+def run(repeat=3):
+    print('NumPy %s' % ('installed' if path_field_batch.numpy is not None else 'not installed, pure Python fallback'))
+    template = compile_template(PANEL)
+    for count in (1000, 10000, 100000):
+        table = size_table(count)
+        rows = [dict((name, column[index]) for name, column in table.items()) for index in range(count)]
+
+        def one_at_a_time():
+            for bindings in rows:
+                template.instantiate(bindings)
+
+        def batch_packed():
+            instantiate_batch(template, table, packed=True)
+
+        def batch_paths():
+            instantiate_batch(template, table)
+
+        single_seconds = min(timeit.repeat(one_at_a_time, number=1, repeat=repeat))
+        print('%6d bindings: instantiate %8.2f us each' % (count, single_seconds / count * 1e6))
+        for label, function in (('batch packed', batch_packed), ('batch Path2', batch_paths)):
+            seconds = min(timeit.repeat(function, number=1, repeat=repeat))
+            print('    %-12s %8.2f us each, %6.1fx faster' % (label, seconds / count * 1e6, single_seconds / seconds))
+
+
+if __name__ == '__main__':
+    run()
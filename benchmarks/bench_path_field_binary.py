@@ -0,0 +1,51 @@
+"""
+Compares loading profiles from binary PathFields with parsing their text, and the size of each.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_binary
+"""
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+
+def closed_profile(number_of_points):
+    points = ['%d:%d' % (index * 10, (index * 7) % 50) for index in range(number_of_points)]
+    return 'profile@' + ';'.join(points) + ';#'
+
+
+def curved_profile(number_of_points):
+    points = []
+    for index in range(number_of_points):
+        point = '%.1f:%.1f' % (index * 12.5, (index * 3) % 40)
+        if index % 4 == 3:
+            point += ')%d' % (20 + index % 7)
+        points.append(point)
+    return 'curved@' + ';'.join(points) + ';#'
+
+
+def run(repeat=3):
+    interpreter = PathFieldInterpreter()
+    for label, path_field in (('rectangle', 'rect@;600;:400;0;#'),
+                              ('closed 50', closed_profile(50)),
+                              ('closed 500', closed_profile(500)),
+                              ('curved 500', curved_profile(500))):
+        text = PathFieldInterpreter().add_paths(interpreter.load_path(path_field))
+        data = interpreter.path_field_to_binary(path_field)
+        number = max(10, 20000 // len(path_field))
+
+        def parse_text():
+            interpreter.load_path(text)
+
+        def decode_binary():
+            interpreter.load_binary(data)
+
+        parse_seconds = min(timeit.repeat(parse_text, number=number, repeat=repeat)) / number
+        decode_seconds = min(timeit.repeat(decode_binary, number=number, repeat=repeat)) / number
+        print('%-10s text %6d bytes %8.3f ms, binary %6d bytes %8.3f ms, %4.1fx faster, %3.0f%% of the size' %
+              (label, len(text), parse_seconds * 1000, len(data), decode_seconds * 1000,
+               parse_seconds / decode_seconds, 100.0 * len(data) / len(text)))
+
+
+if __name__ == '__main__':
+    run()
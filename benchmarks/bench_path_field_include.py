@@ -0,0 +1,64 @@
+"""
+Measures the cost of one include, placed from its compiled template or parsed again from the
+variable and offset as before, and the load of a profile with many repeated includes.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_include
+"""
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.two_d.vector2 import Vector2
+
+VARIABLES = {'hinge': ';0:-5;35:-5{17.5;35:0',
+             'handle': ';0:10;8:10(4;8:-120(4;0:-120;0:-110',
+             'cut': ';5;5:5;0:5;'}
+
+
+def profile_with_includes(number_of_includes):
+    points = ['0:0']
+    for index in range(number_of_includes):
+        x = 100 * (index + 1)
+        points.append('%d:0' % x)
+        points.append('?%s,%s' % (('hinge', 'handle', 'cut')[index % 3], ('pp', 'mm', 'pm', 'mp')[index % 4]))
+    points.append('%d:500' % (100 * (number_of_includes + 1)))
+    return 'door@' + ';'.join(points) + ';0:500;#'
+
+
+def run(repeat=3):
+    interpreter = PathFieldInterpreter()
+    interpreter.variables = dict(VARIABLES)
+    offset_vector = Vector2(100, 0)
+    for variable_name in sorted(VARIABLES):
+        include_template = interpreter.get_include_template(variable_name)
+
+        def instantiate():
+            include_template.instantiate(offset_vector, 'mm')
+
+        def parse_and_offset():
+            path = interpreter.load_path(VARIABLES[variable_name], point_name_prefix=variable_name + '_')[0]
+            path.offset(offset_vector, 'mm')
+
+        template_seconds = min(timeit.repeat(instantiate, number=2000, repeat=repeat)) / 2000
+        parse_seconds = min(timeit.repeat(parse_and_offset, number=2000, repeat=repeat)) / 2000
+        print('include %-7s template %7.1f us, parse and offset %7.1f us, %5.1fx' %
+              (variable_name, template_seconds * 1e6, parse_seconds * 1e6, parse_seconds / template_seconds))
+
+    path_field = profile_with_includes(60)
+
+    def load_with_templates():
+        interpreter.load_path(path_field)
+
+    def load_recompiling():
+        interpreter.include_templates.clear()
+        interpreter.load_path(path_field)
+
+    number_of_edges = interpreter.load_path(path_field)[0].path_length
+    template_seconds = min(timeit.repeat(load_with_templates, number=20, repeat=repeat)) / 20
+    recompile_seconds = min(timeit.repeat(load_recompiling, number=20, repeat=repeat)) / 20
+    print('60 includes, %d edges: templates reused %.2f ms/load, templates rebuilt %.2f ms/load' %
+          (number_of_edges, template_seconds * 1000, recompile_seconds * 1000))
+
+
+if __name__ == '__main__':
+    run()
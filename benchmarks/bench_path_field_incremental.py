@@ -0,0 +1,46 @@
+"""
+Measures typing into one point of a long profile with IncrementalPathField, against loading the whole
+PathField again as the shape editor did after every keystroke.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_incremental
+"""
+import random
+import timeit
+
+from geometry_utils.path_field_incremental import IncrementalPathField
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+
+def profile(number_of_points, seed=3):
+    rng = random.Random(seed)
+    points = ['%d:%d' % (index * 10, rng.randint(0, 500)) for index in range(number_of_points)]
+    for index in range(5, number_of_points, 7):
+        points[index] = '~10'
+    return 'profile@' + ';'.join(points) + ';#'
+
+
+def run(repeat=3):
+    interpreter = PathFieldInterpreter()
+    for number_of_points in (200, 2000, 20000):
+        path_field = profile(number_of_points)
+        incremental_path_field = IncrementalPathField(interpreter, path_field, edit_mode=True)
+        # the y of a point in the middle, followed by a relative point
+        offset = path_field.index(';~10', len(path_field) // 2) - 1
+
+        def type_and_delete():
+            incremental_path_field.apply_edit(offset, 0, '5')
+            incremental_path_field.apply_edit(offset, 1, '')
+
+        def load_path():
+            interpreter.load_path(path_field, edit_mode=True)
+
+        edit_seconds = min(timeit.repeat(type_and_delete, number=500, repeat=repeat)) / 1000
+        number = max(1, 2000 // number_of_points)
+        load_seconds = min(timeit.repeat(load_path, number=number, repeat=repeat)) / number
+        print('%5d points: edit %6.1f us, load_path %8.2f ms, %6.0fx' %
+              (number_of_points, edit_seconds * 1e6, load_seconds * 1000, load_seconds / edit_seconds))
+
+
+if __name__ == '__main__':
+    run()
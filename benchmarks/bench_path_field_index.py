@@ -0,0 +1,42 @@
+"""
+Compares requesting every path of a composite PathField by name through load_path(return_single=name),
+which parses only the named path, against parsing the paths before it as find_path does.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_index
+"""
+import timeit
+
+from geometry_utils.path_field_index import PathFieldIndex
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+from benchmarks.bench_path_field_validator import curved_profile
+
+
+def run(repeat=3):
+    for number_of_paths, number_of_points in ((12, 20), (48, 20), (48, 200)):
+        path_field = '|'.join(curved_profile('part%d' % index, number_of_points) for index in range(number_of_paths))
+        names = ['part%d' % index for index in range(number_of_paths)]
+        interpreter = PathFieldInterpreter()
+
+        def parse_before():
+            for name in names:
+                interpreter.find_path(path_field, name)
+
+        def indexed():
+            for name in names:
+                interpreter.load_path(path_field, return_single=name)
+
+        def build_index():
+            PathFieldIndex(path_field)
+
+        before_seconds = min(timeit.repeat(parse_before, number=1, repeat=repeat)) / number_of_paths
+        indexed_seconds = min(timeit.repeat(indexed, number=1, repeat=repeat)) / number_of_paths
+        index_seconds = min(timeit.repeat(build_index, number=10, repeat=repeat)) / 10
+        print('%2d paths x %3d points: parse before %8.3f ms, indexed %7.3f ms, %5.1fx faster, index built in %.3f ms'
+              % (number_of_paths, number_of_points, before_seconds * 1000, indexed_seconds * 1000,
+                 before_seconds / indexed_seconds, index_seconds * 1000))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,101 @@
+"""
+Measures the memory held by the paths of a catalogue of 100k PathFields, with the names, styles and layers
+shared between paths by load_path, against every path holding its own copies as before.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_memory
+"""
+import random
+import sys
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+EDGE_NAMES = ['', '', '', 'top', 'bottom', 'left', 'right', 'rebate', 'hinge_side']
+STYLES = ['', '', '', '', 'dash', 'hidden', 'centre_line']
+LAYERS = ['', '', 'front&', 'front,back&', 'carcass,panels&']
+TYPES = ['', '', '"extrude"', '"profile"']
+PATH_NAMES = ['outer', 'inner', 'panel', 'door', 'handle_cutout', 'glazing_bead']
+FILLS = ['', '', 'oak', 'white_gloss', 'anthracite_grey']
+
+
+def catalogue(number_of_paths, seed=14):
+    rng = random.Random(seed)
+    path_fields = []
+    for _ in range(number_of_paths):
+        points = []
+        for index in range(rng.randint(4, 12)):
+            point = '%d:%d' % (rng.randint(0, 2000), rng.randint(0, 2000))
+            if rng.random() < 0.2:
+                point += ')%d' % rng.randint(5, 100)
+            edge_name = rng.choice(EDGE_NAMES)
+            style = rng.choice(STYLES)
+            if edge_name or style:
+                point += ',p%d,%s' % (index, edge_name)
+                if style:
+                    point += '%' + style
+            points.append(point)
+        header = rng.choice(LAYERS) + rng.choice(TYPES) + rng.choice(PATH_NAMES) + '@'
+        fill = rng.choice(FILLS)
+        path_fields.append(header + ';'.join(points) + ';#' + ('#' + fill if fill else ''))
+    return path_fields
+
+
+def copy_string(string):
+    # slicing makes a new string, as splitting the PathField did, apart from the shared single characters
+    return (string + '.')[:-1]
+
+
+def unshare_strings(paths):
+    """
+    Gives each path, edge and point its own copy of its names, as load_path did before they were shared
+    """
+    for path in paths:
+        path.name = copy_string(path.name)
+        path.type = copy_string(path.type)
+        path.fill = copy_string(path.fill)
+        path.layers = [copy_string(layer) for layer in path.layers]
+        for edge in path.list_of_edges:
+            edge.name = copy_string(edge.name)
+            edge.style = copy_string(edge.style)
+            edge.p1.name = copy_string(edge.p1.name)
+            edge.p2.name = copy_string(edge.p2.name)
+
+
+def deep_size(paths):
+    """
+    Returns the bytes held by the objects the paths refer to, counting each shared object once
+    """
+    seen = set()
+    size = 0
+    pending = [paths]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            pending.extend(obj)
+        elif hasattr(obj, '__dict__'):
+            pending.append(obj.__dict__)
+    return size
+
+
+def run(number_of_paths=100000):
+    interpreter = PathFieldInterpreter()
+    paths = []
+    for path_field in catalogue(number_of_paths):
+        paths.extend(interpreter.load_path(path_field))
+    shared_size = deep_size(paths)
+    unshare_strings(paths)
+    unshared_size = deep_size(paths)
+    print('%d paths: own copies %.1f MB, shared %.1f MB, %.1f%% less, %.0f bytes per path saved' %
+          (len(paths), unshared_size / 1e6, shared_size / 1e6, 100.0 * (unshared_size - shared_size) / unshared_size,
+           float(unshared_size - shared_size) / len(paths)))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,69 @@
+"""
+Measures the throughput of PathFieldInterpreter.load_path (tokenizing parser) against tokenizing alone.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_parser
+"""
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter, tokenize_path_points
+
+
+def rectangle(width, height):
+    return 'rect@;%d;:%d;0;#' % (width, height)
+
+
+def curved_top(width, height, radius):
+    return 'top@;%d,p1,bottom%%solid;:%d,p2,right;0)%d,p3,top;#,left' % (width, height, radius)
+
+
+def relative_profile(number_of_points):
+    points = ['0:0']
+    for index in range(number_of_points):
+        points.append('~%d:~%d' % (5 + index % 3, 2 - index % 5))
+    return 'profile@' + ';'.join(points) + ';#'
+
+
+def mirrored(number_of_points):
+    points = ['0:0']
+    for index in range(1, number_of_points):
+        points.append('%d:%d' % (index * 10, (index * 7) % 40))
+    points[number_of_points // 2] = '*' + points[number_of_points // 2]
+    return 'mirror@' + ';'.join(points) + '^'
+
+
+CORPUS = [
+    rectangle(600, 400),
+    curved_top(500, 700, 300),
+    '<grain:v;edge>"extrude"front,back&door@;800;:2000;0;#)1200,top%bead#oak',
+    relative_profile(20),
+    relative_profile(100),
+    mirrored(12),
+    '|'.join(rectangle(100 + index, 50 + index) for index in range(5)),
+]
+
+
+def run(number=200, repeat=5):
+    interpreter = PathFieldInterpreter()
+    number_of_points = sum(field.count(';') + 1 for field in CORPUS)
+
+    def best(statement):
+        return min(timeit.repeat(statement, number=number, repeat=repeat))
+
+    tokenize_time = best(lambda: [list(tokenize_path_points(field)) for field in CORPUS])
+    load_time = best(lambda: [interpreter.load_path(field) for field in CORPUS])
+
+    total_points = number_of_points * number
+    print('points per run:             %d' % number_of_points)
+    print('tokenize only:              %10.0f points/s' % (total_points / tokenize_time))
+    print('load_path:                  %10.0f points/s' % (total_points / load_time))
+
+    # load_path should stay linear, so points/s should not drop as the profile grows
+    for profile_points in (500, 5000):
+        field = relative_profile(profile_points)
+        profile_time = min(timeit.repeat(lambda: interpreter.load_path(field), number=1, repeat=repeat))
+        print('load_path %5d points:       %10.0f points/s' % (profile_points, profile_points / profile_time))
+
+
+if __name__ == '__main__':
+    run()
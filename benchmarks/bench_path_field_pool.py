@@ -0,0 +1,40 @@
+"""
+Measures PathFieldInterpreter.load_paths_many throughput against worker count.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_pool
+"""
+import multiprocessing
+import time
+
+from benchmarks.bench_path_field_parser import CORPUS
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+
+def run(number_of_fields=4000):
+    path_fields = [CORPUS[index % len(CORPUS)] for index in range(number_of_fields)]
+    number_of_points = sum(path_field.count(';') + 1 for path_field in path_fields)
+    interpreter = PathFieldInterpreter()
+
+    start = time.time()
+    interpreter.load_paths_many(path_fields, workers=1)
+    serial_time = time.time() - start
+    print('workers  1 (in process):    %10.0f points/s' % (number_of_points / serial_time))
+
+    workers = 2
+    while workers <= multiprocessing.cpu_count():
+        pool = multiprocessing.Pool(workers)
+        try:
+            start = time.time()
+            interpreter.load_paths_many(path_fields, workers=workers, pool=pool)
+            pool_time = time.time() - start
+        finally:
+            pool.close()
+            pool.join()
+        print('workers %2d:                 %10.0f points/s  (%.2fx)' %
+              (workers, number_of_points / pool_time, serial_time / pool_time))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,43 @@
+"""
+Compares the peak memory of PathFieldInterpreter.load_path and PathFieldInterpreter.iter_paths
+on a large multi-path PathField read from a file object.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_streaming
+"""
+import io
+import tracemalloc
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+
+def multi_path_field(number_of_paths):
+    return '|'.join('part%d@;%d;:%d)%d;0;#' % (index, 100 + index % 50, 200 + index % 70, 150 + index % 30)
+                    for index in range(number_of_paths))
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run(number_of_paths=5000):
+    path_field = multi_path_field(number_of_paths)
+    interpreter = PathFieldInterpreter()
+
+    def load_all():
+        return len(interpreter.load_path(io.StringIO(path_field).read()))
+
+    def stream_all():
+        return sum(1 for _ in interpreter.iter_paths(io.StringIO(path_field)))
+
+    print('paths:                      %d' % number_of_paths)
+    print('load_path peak:             %10.1f KiB' % (peak_memory(load_all) / 1024.0))
+    print('iter_paths peak:            %10.1f KiB' % (peak_memory(stream_all) / 1024.0))
+
+
+if __name__ == '__main__':
+    run()
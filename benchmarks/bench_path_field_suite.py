@@ -0,0 +1,130 @@
+"""
+Measures load_path and add_path throughput on the realistic corpora of benchmarks.corpus, in points per second,
+and the memory blocks and bytes the loaded paths hold per point. The results are compared with a stored baseline,
+which only means something when it was saved on the same machine.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_suite
+    python -m benchmarks.bench_path_field_suite --save-baseline
+"""
+import argparse
+import gc
+import json
+import os
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+from benchmarks.corpus import INCLUDE_VARIABLES, count_points, generate_corpus, generate_multi_path_corpus
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# name, description and corpus of each case
+CASES = (('mixed', '2000 mixed PathFields', lambda: generate_corpus(2000)),
+         ('large_profiles', '40 profiles of about 1000 points', lambda: generate_corpus(40, number_of_points=1000)),
+         ('multi_path', '100 PathFields of 24 paths', lambda: generate_multi_path_corpus(100, 24)))
+
+# metrics where a larger value is better
+HIGHER_IS_BETTER = ('load_points_per_second', 'add_points_per_second')
+
+
+def make_interpreter():
+    interpreter = PathFieldInterpreter()
+    interpreter.variables = dict(INCLUDE_VARIABLES)
+    return interpreter
+
+
+def measure_memory(path_fields, number_of_points):
+    """
+    Returns the memory blocks and bytes held by the loaded paths per point
+    """
+    interpreter = make_interpreter()
+    interpreter.load_path(path_fields[0])
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        results = [interpreter.load_path(path_field) for path_field in path_fields]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    statistics = after.compare_to(before, 'filename')
+    blocks = sum(statistic.count_diff for statistic in statistics)
+    size = sum(statistic.size_diff for statistic in statistics)
+    del results
+    return float(blocks) / number_of_points, float(size) / number_of_points
+
+
+def measure(path_fields, repeat):
+    number_of_points = count_points(path_fields)
+    interpreter = make_interpreter()
+    loaded = [interpreter.load_path(path_field) for path_field in path_fields]
+
+    def load():
+        for path_field in path_fields:
+            interpreter.load_path(path_field)
+
+    def add():
+        for paths in loaded:
+            PathFieldInterpreter().add_paths(paths)
+
+    results = {'points': number_of_points,
+               'load_points_per_second': number_of_points / min(timeit.repeat(load, number=1, repeat=repeat)),
+               'add_points_per_second': number_of_points / min(timeit.repeat(add, number=1, repeat=repeat))}
+    if tracemalloc is not None:
+        results['blocks_per_point'], results['bytes_per_point'] = measure_memory(path_fields, number_of_points)
+    return results
+
+
+def compare(value, baseline_value, metric):
+    """
+    Returns how much better a result is than the baseline, 1.0 being the same
+    """
+    if not baseline_value or not value:
+        return None
+    if metric in HIGHER_IS_BETTER:
+        return value / baseline_value
+    return baseline_value / value
+
+
+def run(repeat=3, baseline_path=BASELINE_PATH, save_baseline=False):
+    baseline = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    results = {}
+    for name, description, make_corpus in CASES:
+        case_results = measure(make_corpus(), repeat)
+        results[name] = case_results
+        print('%s: %s, %d points' % (name, description, case_results['points']))
+        for metric in ('load_points_per_second', 'add_points_per_second', 'blocks_per_point', 'bytes_per_point'):
+            if metric not in case_results:
+                continue
+            line = '    %-24s %12.1f' % (metric, case_results[metric])
+            ratio = compare(case_results[metric], baseline.get(name, {}).get(metric), metric)
+            if ratio is not None:
+                line += '   %5.2fx %s baseline' % (ratio if ratio >= 1 else 1 / ratio,
+                                                   'better than' if ratio >= 1 else 'worse than')
+            print(line)
+
+    if save_baseline:
+        with open(baseline_path, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+        print('baseline saved to %s' % baseline_path)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='PathField parser benchmark suite')
+    parser.add_argument('--repeat', type=int, default=3, help='timing runs of each case, the best is kept')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline file to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the baseline')
+    arguments = parser.parse_args()
+    run(arguments.repeat, arguments.baseline, arguments.save_baseline)
@@ -0,0 +1,44 @@
+"""
+Compares reading PathFields into syntax trees for the shape editor against building their geometry with
+load_path, and building the geometry of one path of a tree against loading the whole PathField.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_syntax
+"""
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+from benchmarks.corpus import INCLUDE_VARIABLES, count_points, generate_corpus, generate_multi_path_corpus
+
+
+def run(repeat=3):
+    interpreter = PathFieldInterpreter()
+    interpreter.variables = dict(INCLUDE_VARIABLES)
+    for description, path_fields in (('mixed', generate_corpus(2000)),
+                                     ('large profiles', generate_corpus(20, number_of_points=1000)),
+                                     ('24 paths', generate_multi_path_corpus(100, 24))):
+        def load():
+            for path_field in path_fields:
+                interpreter.load_path(path_field)
+
+        def syntax_tree():
+            for path_field in path_fields:
+                interpreter.load_syntax_tree(path_field)
+
+        def first_path():
+            for path_field in path_fields:
+                interpreter.load_syntax_tree(path_field).get_paths(0)
+
+        number_of_points = count_points(path_fields)
+        load_seconds = min(timeit.repeat(load, number=1, repeat=repeat))
+        tree_seconds = min(timeit.repeat(syntax_tree, number=1, repeat=repeat))
+        first_seconds = min(timeit.repeat(first_path, number=1, repeat=repeat))
+        print('%-14s %6d points: load_path %7.1f ms, syntax tree %6.1f ms, %4.1fx faster, '
+              'tree and first path %6.1f ms'
+              % (description, number_of_points, load_seconds * 1000, tree_seconds * 1000,
+                 load_seconds / tree_seconds, first_seconds * 1000))
+
+
+if __name__ == '__main__':
+    run()
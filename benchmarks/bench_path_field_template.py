@@ -0,0 +1,56 @@
+"""
+Compares instantiating a compiled PathField template against load_path on the PathField with the values
+written in.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_template
+"""
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.path_field_template import compile_template
+
+# a cabinet door panel with a shaped top rail, a handle cut-out and a mitred corner
+PANEL = ('"panel"front&door@0:0;W:0;W:H-R;W-R:H)R;R:H(R*2;0:H-R)R;#|'
+         'handle@X:Y;X+40:Y;X+40:Y+12)6;X:Y+12;#)6|'
+         'mitre@0:0;M:0;0:M;#')
+
+
+def values(index):
+    return {'W': 400.0 + index % 200, 'H': 700.0 + index % 300, 'R': 40.0 + index % 20,
+            'X': 60.0 + index % 30, 'Y': 320.0, 'M': 25.0}
+
+
+def run(count=100000, repeat=3):
+    template = compile_template(PANEL)
+    all_bindings = [values(index) for index in range(count)]
+
+    def instantiate():
+        for bindings in all_bindings:
+            template.instantiate(bindings)
+
+    seconds = min(timeit.repeat(instantiate, number=1, repeat=repeat))
+    print('instantiate %d times: %8.3f s, %6.1f us each' % (count, seconds, seconds / count * 1e6))
+
+    # load_path can not evaluate expressions, so it is timed on a sample of PathFields with the values worked out
+    interpreter = PathFieldInterpreter()
+    path_fields = [loaded_path_field(template, bindings) for bindings in all_bindings[:count // 10]]
+
+    def load_path():
+        for path_field in path_fields:
+            interpreter.load_path(path_field)
+
+    load_seconds = min(timeit.repeat(load_path, number=1, repeat=repeat)) / len(path_fields) * count
+    print('load_path   %d times: %8.3f s, %6.1f us each, %.1fx slower' %
+          (count, load_seconds, load_seconds / count * 1e6, load_seconds / seconds))
+
+
+def loaded_path_field(template, bindings):
+    """
+    Returns the PathField of the paths of a template, so load_path reads the same points
+    """
+    return PathFieldInterpreter().add_paths(template.instantiate(bindings))
+
+
+if __name__ == '__main__':
+    run()
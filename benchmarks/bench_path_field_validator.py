@@ -0,0 +1,51 @@
+"""
+Compares rejecting PathFields and reading their headers with the validator against a full load_path.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_validator
+"""
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.path_field_validator import find_path_field_error, scan_path_field_headers
+
+
+def curved_profile(name, number_of_points):
+    points = []
+    for index in range(number_of_points):
+        point = '%.1f:%.1f' % (index * 12.5, (index * 3) % 40)
+        if index % 4 == 3:
+            point += ')%d' % (20 + index % 7)
+        points.append(point)
+    return '<depth:18>"extrude"front,back&%s@' % name + ';'.join(points) + ';#'
+
+
+def run(repeat=3):
+    interpreter = PathFieldInterpreter()
+    for number_of_points in (10, 100, 1000):
+        path_field = '|'.join(curved_profile('profile%d' % index, number_of_points) for index in range(5))
+        # a bad value in the last point, so every parser reads the whole PathField
+        bad_path_field = path_field[:-3] + 'x;#'
+        number = max(5, 20000 // len(path_field))
+
+        def load_path():
+            interpreter.load_path(path_field)
+
+        def validate():
+            find_path_field_error(path_field)
+
+        def reject():
+            find_path_field_error(bad_path_field)
+
+        def scan_headers():
+            scan_path_field_headers(path_field)
+
+        load_seconds = min(timeit.repeat(load_path, number=number, repeat=repeat)) / number
+        print('5 x %4d points: load_path %8.3f ms' % (number_of_points, load_seconds * 1000))
+        for label, function in (('validate', validate), ('reject', reject), ('scan headers', scan_headers)):
+            seconds = min(timeit.repeat(function, number=number * 20, repeat=repeat)) / (number * 20)
+            print('    %-12s %8.3f ms, %6.0fx faster' % (label, seconds * 1000, load_seconds / seconds))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,48 @@
+"""
+Measures PathFieldInterpreter.add_path throughput for growing path sizes, to check the
+serializer stays linear in the number of edges, and add_paths / dump on many small paths.
+
+Run from the repository root:
+    python -m benchmarks.bench_path_field_writer
+"""
+import io
+import timeit
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+
+def closed_profile(number_of_points):
+    points = ['0:0']
+    for index in range(1, number_of_points):
+        points.append('%d:%d' % (index * 10, (index * 7) % 40 + 10))
+    return 'profile@' + ';'.join(points) + ';0:-10;#'
+
+
+def run(repeat=3):
+    interpreter = PathFieldInterpreter()
+    for number_of_points in (100, 1000, 5000):
+        path = interpreter.load_path(closed_profile(number_of_points))[0]
+
+        def add_path():
+            PathFieldInterpreter().add_path(path)
+
+        seconds = min(timeit.repeat(add_path, number=3, repeat=repeat)) / 3
+        print('add_path %5d edges:       %10.0f edges/s' % (path.path_length, path.path_length / seconds))
+
+    paths = interpreter.load_path('|'.join(closed_profile(8) for _ in range(2000)))
+    number_of_edges = sum(path.path_length for path in paths)
+
+    def add_paths():
+        PathFieldInterpreter().add_paths(paths)
+
+    def dump():
+        PathFieldInterpreter().dump(paths, io.StringIO())
+
+    print('add_paths %d paths:       %10.0f edges/s' %
+          (len(paths), number_of_edges / min(timeit.repeat(add_paths, number=1, repeat=repeat))))
+    print('dump %d paths:            %10.0f edges/s' %
+          (len(paths), number_of_edges / min(timeit.repeat(dump, number=1, repeat=repeat))))
+
+
+if __name__ == '__main__':
+    run()
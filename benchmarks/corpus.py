@@ -0,0 +1,151 @@
+"""
+A deterministic generator of realistic PathFields for benchmarks: rectangles with named edges and rounded
+corners, curved and arched tops, mirrored mouldings, relative profiles, shapes with includes, attributes,
+types, layers and fills, and multi-path fields of them. The same seed always gives the same corpus.
+"""
+import random
+
+# The variables the includes of the corpus refer to, to be set on the interpreter
+INCLUDE_VARIABLES = {'hinge': ';35:0;35:12)6;0:12',
+                     'handle': '0:0;128:0;128:12)6;0:12;#)6',
+                     'notch': ';10;10:10;0:10'}
+
+EDGE_NAMES = ['top', 'bottom', 'left', 'right', 'rebate', 'hinge_side', 'front']
+STYLES = ['dash', 'hidden', 'centre_line']
+LAYERS = ['front', 'back', 'carcass', 'panels', 'machining']
+TYPES = ['extrude', 'profile', 'panel']
+FILLS = ['oak', 'white_gloss', 'anthracite_grey', 'walnut']
+PATH_NAMES = ['outer', 'inner', 'panel', 'door', 'drawer_front', 'glazing_bead', 'cornice', 'plinth']
+
+
+def header(rng, name):
+    """
+    Returns a path header with the attributes, type and layers of a real part some of the time
+    """
+    text = ''
+    if rng.random() < 0.3:
+        text += '<grain:%s;edge_band>' % rng.choice('vh')
+    if rng.random() < 0.4:
+        text += '"%s"' % rng.choice(TYPES)
+    if rng.random() < 0.5:
+        text += ','.join(rng.sample(LAYERS, rng.randint(1, 3))) + '&'
+    return text + name + '@'
+
+
+def closing(rng):
+    fill = rng.choice(FILLS) if rng.random() < 0.3 else ''
+    return ';#' + ('#' + fill if fill else '')
+
+
+def rectangle(rng, name):
+    width = rng.randint(100, 1200)
+    height = rng.randint(100, 2400)
+    if rng.random() < 0.5:
+        return header(rng, name) + ';%d;:%d;0' % (width, height) + closing(rng)
+    # named edges and rounded corners
+    radius = rng.randint(3, 30)
+    points = ['0:%d' % radius, '%d:0(%d,c1,%s' % (radius, radius, rng.choice(EDGE_NAMES)),
+              '%d:0' % (width - radius),
+              '%d:%d(%d,c2,%s%%%s' % (width, radius, radius, rng.choice(EDGE_NAMES), rng.choice(STYLES)),
+              '%d:%d' % (width, height - radius), '%d:%d(%d,c3' % (width - radius, height, radius),
+              '%d:%d' % (radius, height), '0:%d(%d,c4,%s' % (height - radius, radius, rng.choice(EDGE_NAMES))]
+    return header(rng, name) + ';'.join(points) + closing(rng)
+
+
+def curved_top(rng, name):
+    width = rng.randint(300, 1000)
+    height = rng.randint(500, 2200)
+    rise = rng.randint(20, width // 3)
+    radius = (width * width / 4.0 + rise * rise) / (2.0 * rise)
+    return (header(rng, name) + ';%d,p1,bottom;:%d,p2,right;0:%d%s%.1f,p3,top;#,left' %
+            (width, height - rise, height - rise, rng.choice('()'), radius) + closing(rng)[2:])
+
+
+def mirrored(rng, name, number_of_points):
+    """
+    A moulding drawn to its centre line with a '*' point, mirrored by the '^' at its end
+    """
+    points = ['0:0']
+    x = 0
+    for index in range(1, number_of_points):
+        x += rng.randint(2, 15)
+        point = '%d:%d' % (x, rng.randint(0, 60))
+        if rng.random() < 0.2:
+            point += rng.choice('()') + str(rng.randint(5, 40))
+        points.append(point)
+    points[number_of_points // 2] = '*' + points[number_of_points // 2]
+    return header(rng, name) + ';'.join(points) + '^'
+
+
+def relative_profile(rng, name, number_of_points):
+    """
+    A profile drawn with relative '~' steps, as cornice and plinth sections are
+    """
+    points = ['0:0']
+    for _ in range(number_of_points - 1):
+        point = '~%d:~%d' % (rng.randint(1, 12), rng.randint(-8, 8))
+        if rng.random() < 0.15:
+            point += rng.choice('(){}') + str(rng.randint(10, 60))
+        points.append(point)
+    return header(rng, name) + ';'.join(points) + closing(rng)
+
+
+def with_includes(rng, name):
+    """
+    A door with hinge notches and a handle cut-out from the variables of INCLUDE_VARIABLES
+    """
+    width = rng.randint(300, 800)
+    height = rng.randint(600, 2200)
+    points = ['0:0', '%d:0' % width, '%d:%d' % (width, height), '0:%d' % height,
+              '?hinge,pm,0,%d' % (height - 100), '?hinge,pm,0,100?%d' % rng.randint(0, 1)]
+    return (header(rng, name) + ';'.join(points) + closing(rng) +
+            '|handle@?handle,pp,%d,%d' % (width - 150, height // 2))
+
+
+def path_field(rng, number_of_points=12):
+    """
+    Returns one PathField of a kind picked at random, the profiles having about number_of_points points
+    """
+    name = rng.choice(PATH_NAMES)
+    kind = rng.random()
+    if kind < 0.3:
+        return rectangle(rng, name)
+    if kind < 0.45:
+        return curved_top(rng, name)
+    if kind < 0.6:
+        return mirrored(rng, name, max(4, number_of_points))
+    if kind < 0.8:
+        return relative_profile(rng, name, max(2, number_of_points))
+    if kind < 0.9:
+        return with_includes(rng, name)
+    return '|'.join(path_field(rng, number_of_points) for _ in range(rng.randint(2, 6)))
+
+
+def generate_corpus(number_of_path_fields, number_of_points=12, seed=18):
+    """
+    Returns a list of realistic PathFields, the same for the same arguments
+
+    :param number_of_path_fields: the number of PathFields
+    :param number_of_points: the rough number of points of the profiles
+    :param seed: seed of the random choices
+    :return: list of PathField strings
+    :rtype: list
+    """
+    rng = random.Random(seed)
+    return [path_field(rng, number_of_points) for _ in range(number_of_path_fields)]
+
+
+def generate_multi_path_corpus(number_of_path_fields, number_of_paths, number_of_points=12, seed=18):
+    """
+    Returns PathFields of number_of_paths paths each, as composite parts are stored
+    """
+    rng = random.Random(seed)
+    return ['|'.join(path_field(rng, number_of_points).split('|')[0] for _ in range(number_of_paths))
+            for _ in range(number_of_path_fields)]
+
+
+def count_points(path_fields):
+    """
+    Returns the number of points in the path strings of PathFields
+    """
+    return sum(path_str.count(';') + 1 for field in path_fields for path_str in field.split('|') if path_str)
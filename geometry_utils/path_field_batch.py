@@ -0,0 +1,446 @@
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from geometry_utils.maths_utility import DOUBLE_EPSILON
+from geometry_utils.path_field_template import PathBuilder, TEMPLATE_FUNCTIONS, compile_evaluator, compile_template
+from geometry_utils.two_d.edge2 import Edge2, calculate_arc_centre
+from geometry_utils.two_d.path2 import Path2
+from geometry_utils.two_d.point2 import Point2
+
+# The packed columns of each edge
+PACKED_COLUMNS = ('p1_x', 'p1_y', 'p2_x', 'p2_y', 'centre_x', 'centre_y', 'radius', 'clockwise', 'large')
+
+
+class PackedEdges:
+    """
+    The edges of one path of a template for every binding of a batch, held in flat columns.
+    The columns are NumPy arrays, or arrays from the array module when NumPy is not installed.
+
+    Attributes:
+    ___________
+    name: str
+        the name of the path
+    offsets: array
+        the edges of binding i are offsets[i] to offsets[i + 1] of the columns
+    p1_x, p1_y, p2_x, p2_y: array
+        the start and end of each edge
+    centre_x, centre_y: array
+        the centre of each edge
+    radius: array
+        the radius of each edge, 0 for lines
+    clockwise, large: array
+        the arc flags of each edge
+
+    Methods:
+    ________
+    get_edge_range(int): tuple
+        Returns the first and last + 1 index of the edges of a binding
+    """
+
+    def __init__(self, name, offsets, columns):
+        self.name = name
+        self.offsets = offsets
+        for column_name, column in zip(PACKED_COLUMNS, columns):
+            setattr(self, column_name, column)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def get_edge_range(self, index):
+        return int(self.offsets[index]), int(self.offsets[index + 1])
+
+
+class BatchSplit(Exception):
+    """
+    Raised when the bindings of a group do not all take the same branch of the parser
+
+    Attributes:
+    ___________
+    mask: numpy.ndarray
+        True for the bindings that take the branch
+    """
+
+    def __init__(self, mask):
+        super(BatchSplit, self).__init__()
+        self.mask = mask
+
+
+def decide(mask):
+    """
+    Returns the branch taken by every binding of a group
+
+    :param mask: a bool, or a bool array with a value per binding
+    :rtype: bool
+    :raises: BatchSplit: the bindings take different branches
+    """
+    if numpy.all(mask):
+        return True
+    if not numpy.any(mask):
+        return False
+    raise BatchSplit(mask)
+
+
+def columns_are_close(a, b):
+    """
+    Same as floats_are_close for numbers or arrays
+    """
+    return numpy.abs(a - b) <= numpy.maximum(1e-9 * numpy.maximum(numpy.abs(a), numpy.abs(b)), DOUBLE_EPSILON)
+
+
+def points_are_close(x1, y1, x2, y2):
+    return columns_are_close(x1, x2) & columns_are_close(y1, y2)
+
+
+def round_column(values, round_value):
+    """
+    Rounds as round() does. numpy.round rounds the scaled value, which can fall on the other side of a half
+    than the exact value, so values close to a half are rounded again by round()
+    """
+    values = numpy.asarray(values, dtype=float)
+    if values.ndim == 0:
+        return round(float(values), round_value)
+    rounded = numpy.round(values, round_value)
+    with numpy.errstate(invalid='ignore'):
+        scaled = values * 10.0 ** round_value
+        near_half = numpy.abs(scaled - numpy.floor(scaled) - 0.5) < 1e-6 + numpy.abs(scaled) * 1e-15
+    for index in numpy.flatnonzero(near_half).tolist():
+        rounded[index] = round(float(values[index]), round_value)
+    return rounded
+
+
+def float_column(values):
+    return numpy.asarray(values, dtype=float)
+
+
+def get_edge_values(edge):
+    """
+    :return: the values of an Edge2, or a ColumnEdge, for the packed columns
+    :rtype: tuple
+    """
+    return (edge.p1.x, edge.p1.y, edge.p2.x, edge.p2.y, edge.centre.x, edge.centre.y, edge.radius, edge.clockwise,
+            edge.large)
+
+
+class ColumnPoint(object):
+    """
+    A point of a template path for a group of bindings, standing in for a Point2 while PathFieldTemplate.build_path
+    joins the edges. x and y are numbers, the same for every binding, or arrays with a value per binding.
+    Comparing two points decides whether they are the same point for every binding of the group.
+    """
+
+    def __init__(self, x=0.0, y=0.0, name=''):
+        self.x = x
+        self.y = y
+        self.name = name
+
+    def __eq__(self, other_point):
+        return decide(points_are_close(self.x, self.y, other_point.x, other_point.y))
+
+    def __ne__(self, other_point):
+        return not self.__eq__(other_point)
+
+    def clone(self):
+        return ColumnPoint(self.x, self.y, self.name)
+
+
+class ColumnEdge(object):
+    """
+    An edge of a template path for a group of bindings, standing in for an Edge2 of ColumnPoints. The radius is
+    a number or an array with a value per binding, the arc flags and names are the same for the whole group.
+    As with Edge2, the centre is p1 itself when the ends are the same point.
+    """
+
+    def __init__(self, p1, p2, radius=0.0, clockwise=False, large=False):
+        self.p1 = p1
+        self.p2 = p2
+        self.radius = radius
+        self.clockwise = clockwise
+        self.large = large
+        self.centre = self.calculate_centre()
+        self.name = ''
+        self.style = ''
+        self.type = ''
+        self.left_name = ''
+        self.right_name = ''
+
+    def is_arc(self):
+        return decide(self.radius > DOUBLE_EPSILON)
+
+    def calculate_centre(self):
+        """
+        Same as Edge2.calculate_centre for every binding of the group
+        """
+        if self.p1 == self.p2:
+            return self.p1
+
+        if not self.is_arc():
+            return ColumnPoint((self.p1.x + self.p2.x) * 0.5, (self.p1.y + self.p2.y) * 0.5)
+
+        with numpy.errstate(all='ignore'):
+            centre_x, centre_y = calculate_arc_centre(self.p1.x, self.p1.y, self.p2.x, self.p2.y, self.radius,
+                                                      self.clockwise, self.large, numpy.sqrt, numpy.fmax)
+        return ColumnPoint(centre_x, centre_y)
+
+
+class ColumnPathBuilder(PathBuilder):
+    """
+    Creates the points and edges of template paths for a group of bindings as ColumnPoints and ColumnEdges,
+    so that PathFieldTemplate.build_path joins them as it does for a single binding
+    """
+
+    round = staticmethod(round_column)
+    decide = staticmethod(decide)
+
+    @staticmethod
+    def new_point(x, y, name):
+        return ColumnPoint(x, y, name)
+
+    def new_edge(self, p1, radius, clockwise, large, edge_names):
+        edge_name, style, left_name, right_name = edge_names
+        edge = ColumnEdge.__new__(ColumnEdge)
+        edge.__dict__ = {'p1': p1, 'p2': ColumnPoint(), 'radius': radius, 'clockwise': clockwise, 'large': large,
+                         'centre': p1, 'name': edge_name, 'style': style, 'type': '', 'left_name': left_name,
+                         'right_name': right_name}
+        return edge
+
+    @staticmethod
+    def new_open_edge(x, y):
+        return ColumnEdge(ColumnPoint(x, y), ColumnPoint())
+
+    @staticmethod
+    def include(include_template, offset_x, offset_y, include_type):
+        """
+        Same as IncludeTemplate.instantiate for a group of bindings
+        """
+        edges = []
+        for (p1_x, p1_y, p1_name, p2_x, p2_y, p2_name, centre_x, centre_y, centre_is_p1, radius, clockwise, large,
+             name, style, edge_type, left_name, right_name) in include_template.transform_records(offset_x, offset_y,
+                                                                                                  include_type):
+            p1 = ColumnPoint(p1_x, p1_y, p1_name)
+            edge = ColumnEdge.__new__(ColumnEdge)
+            edge.__dict__ = {'p1': p1, 'p2': ColumnPoint(p2_x, p2_y, p2_name), 'radius': radius,
+                             'clockwise': clockwise, 'large': large,
+                             'centre': p1 if centre_is_p1 else ColumnPoint(centre_x, centre_y), 'name': name,
+                             'style': style, 'type': edge_type, 'left_name': left_name, 'right_name': right_name}
+            edges.append(edge)
+        return edges
+
+
+def get_column(value, count):
+    """
+    Returns the values of a number or array for every binding of a group, as a list
+    """
+    value = numpy.asarray(value)
+    if value.ndim == 0:
+        return [value.item()] * count
+    return value.tolist()
+
+
+def take_column(value, indices):
+    if isinstance(value, numpy.ndarray) and value.ndim == 1:
+        return value[indices]
+    return value
+
+
+def get_binding_columns(template, bindings):
+    """
+    Returns the column of each variable and the number of bindings. bindings is a mapping of each variable
+    name to a sequence of values, such as a dict of lists or a NumPy structured array, or a sequence of
+    mappings of each variable name to a value.
+    """
+    table_names = getattr(getattr(bindings, 'dtype', None), 'names', None)
+    if table_names is None and hasattr(bindings, 'keys'):
+        table_names = list(bindings.keys())
+    if table_names is not None:
+        lengths = set(len(bindings[name]) for name in template.variable_names or table_names)
+        if len(lengths) > 1:
+            raise ValueError('The binding columns are not the same length')
+        if not lengths:
+            raise ValueError('The number of bindings is not known from an empty table')
+        return dict((name, bindings[name]) for name in template.variable_names), lengths.pop()
+
+    bindings = list(bindings)
+    columns = dict((name, [row[name] for row in bindings]) for name in template.variable_names)
+    return columns, len(bindings)
+
+
+def evaluate_columns(template, evaluate, columns, count):
+    """
+    Evaluates the values of every binding in one pass. When NumPy finds a division by zero, or an invalid value
+    such as 0 / 0, the bindings are evaluated again one at a time, as PathFieldTemplate.evaluate does, so that
+    the same exception is raised with and without NumPy. Invalid values Python does not raise for are kept.
+    """
+    try:
+        with numpy.errstate(divide='raise', invalid='raise'):
+            return evaluate(columns)
+    except FloatingPointError:
+        for index in range(count):
+            template.evaluate(dict((name, float(column[index])) for name, column in columns.items()))
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        return evaluate(columns)
+
+
+def instantiate_groups(template, bindings):
+    """
+    Evaluates the values of every binding in one pass and builds the paths of the bindings that build the
+    same edges together, as paths of ColumnEdges
+
+    :return: a list of the binding indices and paths of each group
+    :rtype: list
+    """
+    columns, count = get_binding_columns(template, bindings)
+    columns = dict((name, float_column(column)) for name, column in columns.items())
+    evaluate = compile_evaluator(template.source, dict(TEMPLATE_FUNCTIONS, round=round_column, float=float_column))
+    values = evaluate_columns(template, evaluate, columns, count)
+
+    builder = ColumnPathBuilder()
+    groups = []
+    pending = [numpy.arange(count)]
+    while pending:
+        indices = pending.pop()
+        if len(indices) == 0:
+            continue
+        group_values = values if len(indices) == count else [take_column(value, indices) for value in values]
+        try:
+            paths = [template.build_path(path_plan, group_values, builder) for path_plan in template.paths]
+        except BatchSplit as split:
+            pending.append(indices[~split.mask])
+            pending.append(indices[split.mask])
+            continue
+        groups.append((indices, paths))
+    return groups, count
+
+
+def build_paths(indices, paths, instances):
+    """
+    Creates the Path2s of a group of bindings from its paths of ColumnEdges and stores them in instances
+    """
+    count = len(indices)
+    new_point = Point2.__new__
+    new_edge = Edge2.__new__
+    new_path = Path2.__new__
+    for column_path in paths:
+        edges = column_path.list_of_edges
+        edge_columns = [list(zip(*[get_column(value, count) for value in get_edge_values(edge)[:7]]))
+                        for edge in edges]
+
+        for row, binding_index in enumerate(indices.tolist()):
+            list_of_edges = []
+            for edge, edge_column in zip(edges, edge_columns):
+                p1_x, p1_y, p2_x, p2_y, centre_x, centre_y, radius = edge_column[row]
+                p1 = new_point(Point2)
+                p1.__dict__ = {'x': p1_x, 'y': p1_y, 'w': 1, 'name': edge.p1.name}
+                p2 = new_point(Point2)
+                p2.__dict__ = {'x': p2_x, 'y': p2_y, 'w': 1, 'name': edge.p2.name}
+                if edge.centre is edge.p1:
+                    centre = p1
+                else:
+                    centre = new_point(Point2)
+                    centre.__dict__ = {'x': centre_x, 'y': centre_y, 'w': 1, 'name': ''}
+                new = new_edge(Edge2)
+                new.__dict__ = {'p1': p1, 'p2': p2, 'radius': radius, 'clockwise': edge.clockwise,
+                                'large': edge.large, 'centre': centre, 'name': edge.name, 'style': edge.style,
+                                'type': edge.type, 'left_name': edge.left_name, 'right_name': edge.right_name}
+                list_of_edges.append(new)
+            path = new_path(Path2)
+            path.__dict__ = {'list_of_edges': list_of_edges, 'fill': column_path.fill, 'name': column_path.name,
+                             'type': column_path.type, 'layers': list(column_path.layers), 'closed': None,
+                             'attributes': dict(column_path.attributes)}
+            instances[binding_index].append(path)
+
+
+def pack_groups(template, groups, count):
+    """
+    Packs the edges of every group into the columns of a PackedEdges for each path of the template
+    """
+    packed_paths = []
+    for path_index, path in enumerate(template.paths):
+        edge_counts = numpy.zeros(count, dtype=numpy.int64)
+        for indices, paths in groups:
+            edge_counts[indices] = paths[path_index].path_length
+        offsets = numpy.zeros(count + 1, dtype=numpy.int64)
+        numpy.cumsum(edge_counts, out=offsets[1:])
+        columns = [numpy.empty(offsets[-1], dtype=bool if column_name in ('clockwise', 'large') else float)
+                   for column_name in PACKED_COLUMNS]
+
+        for indices, paths in groups:
+            edges = paths[path_index].list_of_edges
+            if not edges:
+                continue
+            positions = (offsets[indices][:, numpy.newaxis] + numpy.arange(len(edges))).ravel()
+            edge_values = [get_edge_values(edge) for edge in edges]
+            for column_index, column in enumerate(columns):
+                column[positions] = numpy.stack([numpy.broadcast_to(values[column_index], (len(indices),))
+                                                 for values in edge_values], axis=1).ravel()
+        packed_paths.append(PackedEdges(path[0], offsets, columns))
+    return packed_paths
+
+
+def pack_paths(template, instances):
+    """
+    Packs the Path2s of each binding into array module columns, when NumPy is not installed
+    """
+    packed_paths = []
+    for path_index, path in enumerate(template.paths):
+        offsets = array('l', [0])
+        columns = [array('b') if column_name in ('clockwise', 'large') else array('d')
+                   for column_name in PACKED_COLUMNS]
+        for paths in instances:
+            for edge in paths[path_index].list_of_edges:
+                for column, value in zip(columns, get_edge_values(edge)):
+                    column.append(value)
+            offsets.append(len(columns[0]))
+        packed_paths.append(PackedEdges(path[0], offsets, columns))
+    return packed_paths
+
+
+def instantiate_batch(template, bindings, packed=False):
+    """
+    Creates the paths of a template for many bindings at once. With NumPy every value, coordinate, radius and arc
+    centre is worked out for the whole batch in one pass over the template. Bindings that make the parser take
+    different branches, such as an include condition or a radius of 0, are worked out in separate groups.
+    Without NumPy each binding is instantiated in turn.
+    Division by zero in an expression raises ZeroDivisionError, as PathFieldTemplate.instantiate does.
+
+    :param template: PathFieldTemplate
+    :param bindings: a mapping of each variable name to a sequence of values, such as a dict of lists or
+                     a NumPy structured array, or a sequence of mappings of each variable name to a value
+    :param packed: True to return the edges in packed columns rather than as Path2s
+    :return: a list of the Path2s of each binding, as PathFieldTemplate.instantiate returns them,
+             or a PackedEdges for each path of the template
+    :rtype: list
+    """
+    if numpy is None:
+        columns, count = get_binding_columns(template, bindings)
+        instances = [template.instantiate(dict((name, column[index]) for name, column in columns.items()))
+                     for index in range(count)]
+        if packed:
+            return pack_paths(template, instances)
+        return instances
+
+    groups, count = instantiate_groups(template, bindings)
+    if packed:
+        return pack_groups(template, groups, count)
+    instances = [[] for _ in range(count)]
+    for indices, paths in groups:
+        build_paths(indices, paths, instances)
+    return instances
+
+
+def load_path_batch(path_field, bindings, path_field_interpreter=None, packed=False, override_data=None,
+                    point_name_prefix='', round_value=2):
+    """
+    Compiles a parametric PathField and creates its paths for many bindings, see instantiate_batch
+
+    :param path_field: PathField string with expressions of variables in place of numbers
+    :param bindings: the values of the variables, see instantiate_batch
+    :param path_field_interpreter: interpreter holding the variables of includes
+    :param packed: True to return the edges in packed columns rather than as Path2s
+    :rtype: list
+    """
+    template = compile_template(path_field, path_field_interpreter, override_data, point_name_prefix, round_value)
+    return instantiate_batch(template, bindings, packed)
@@ -0,0 +1,632 @@
+import math
+import struct
+
+from geometry_utils.path_field_names import get_default_point_names, intern
+from geometry_utils.two_d.edge2 import Edge2, is_edge2
+from geometry_utils.two_d.path2 import Path2, is_path2
+from geometry_utils.two_d.point2 import Point2
+
+# Binary PathField layout. Counts, lengths and string indices outside edge records are unsigned LEB128
+# varints, everything else is little-endian and fixed width.
+#   header         magic, version, string index size, string count, path count
+#   string table   for every string but '', its UTF-8 byte length then its bytes
+#   path           name, type, fill and point name prefix string indices, closed, decimal places of the scaled
+#                  values, layer count, layer string indices, attribute count, attributes, edge count, then
+#                  one record per edge
+#   attribute      key string index, value kind byte, then a string index, double or 64 bit integer for
+#                  string, float and int values
+#   edge           flag byte, a second flag byte when EXTENDED is set, then the struct from get_edge_layout
+# String index 0 is always ''.
+MAGIC = b'PFB'
+VERSION = 1
+
+HEADER = struct.Struct('<3sBB')
+
+# Path closed value
+CLOSED_NONE = 0
+CLOSED_FALSE = 1
+CLOSED_TRUE = 2
+
+# Attribute value kinds
+ATTRIBUTE_STRING = 0
+ATTRIBUTE_TRUE = 1
+ATTRIBUTE_FALSE = 2
+ATTRIBUTE_NONE = 3
+ATTRIBUTE_FLOAT = 4
+ATTRIBUTE_INT = 5
+
+ATTRIBUTE_FLOAT_VALUE = struct.Struct('<d')
+ATTRIBUTE_INT_VALUE = struct.Struct('<q')
+
+# Edge flags. The edge values are p1 x and y, then p2 x and y when p2 is stored and the radius when the edge
+# has one. Unless VALUES_DOUBLE or VALUES_STRING is set they are 8, 16 or 32 bit integers, scaled by
+# 10 ** the path's decimal places, and p1 is the change from the p1 of the last edge stored as integers.
+HAS_RADIUS = 0x01
+P2_IS_FIRST = 0x02          # p2 is a copy of the first edge's p1, closing the path
+CENTRE_STORED = 0x04        # otherwise the centre is the middle of p1 and p2
+P1_NAME_STORED = 0x08       # otherwise p1 is named by the path's point name prefix and the edge index
+VALUES_INT8 = 0x10
+VALUES_INT32 = 0x20         # with neither, the integers are 16 bit
+EXTENDED = 0x80
+CLOCKWISE = 0x0100
+LARGE = 0x0200
+P2_STORED = 0x0400          # otherwise p2 is a copy of the next edge's p1
+CENTRE_IS_P1 = 0x0800
+CENTRE_IS_P2 = 0x1000
+EDGE_NAMES = 0x2000
+WEIGHTS = 0x4000
+VALUES_DOUBLE = 0x8000
+VALUES_STRING = 0x0040      # the values and the centre are string indices, after a byte marking the strings
+
+INTEGER_SIZE_FLAGS = ((-0x80, 0x7f, VALUES_INT8), (-0x8000, 0x7fff, 0), (-0x80000000, 0x7fffffff, VALUES_INT32))
+
+STRING_INDEX_CODES = {1: 'B', 2: 'H', 4: 'I'}
+
+edge_layouts = {}
+
+
+def get_edge_layout(flags, string_index_size):
+    """
+    Returns the struct for the edge record after its flags, built once for each combination of flags
+    """
+    try:
+        return edge_layouts[flags, string_index_size]
+    except KeyError:
+        pass
+
+    string_index_code = STRING_INDEX_CODES[string_index_size]
+    number_of_values = 2
+    if flags & P2_STORED:
+        number_of_values += 2
+    if flags & HAS_RADIUS:
+        number_of_values += 1
+
+    if flags & VALUES_STRING:
+        if flags & CENTRE_STORED:
+            number_of_values += 2
+        layout = 'B' + string_index_code * number_of_values
+    else:
+        if flags & VALUES_DOUBLE:
+            layout = 'd' * number_of_values
+        elif flags & VALUES_INT32:
+            layout = 'i' * number_of_values
+        elif flags & VALUES_INT8:
+            layout = 'b' * number_of_values
+        else:
+            layout = 'h' * number_of_values
+        if flags & CENTRE_STORED:
+            layout += 'dd'
+    if flags & P2_STORED:
+        layout += string_index_code
+    if flags & P1_NAME_STORED:
+        layout += string_index_code
+    if flags & EDGE_NAMES:
+        layout += string_index_code * 5
+    if flags & WEIGHTS:
+        layout += 'ddd'
+
+    edge_layout = edge_layouts[flags, string_index_size] = struct.Struct('<' + layout)
+    return edge_layout
+
+
+def encode_varint(value):
+    encoded = bytearray()
+    while value > 0x7f:
+        encoded.append((value & 0x7f) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def read_varint(data, offset):
+    """
+    :param data: bytearray
+    :param offset: position of the varint
+    :return: the value and the position after it
+    :rtype: tuple
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def points_match(point, other_point):
+    """
+    Exact comparison, unlike Point2.__eq__, so a point rebuilt from the other loses nothing
+    """
+    return (point.x == other_point.x and point.y == other_point.y and point.name == other_point.name and
+            point.w == other_point.w and type(point.x) is type(other_point.x) and
+            type(point.y) is type(other_point.y))
+
+
+class BinaryPathFieldWriter:
+    """
+    Builds the string table and records of a binary PathField
+
+    Attributes:
+    ___________
+    decimal_places: int
+        the most decimal places values can have to be stored as scaled integers
+    strings: list
+        the string table
+    paths: list
+        the string indices, attributes and edge records of the added paths
+
+    Methods:
+    ________
+    add_path(Path2):
+        Encodes a path
+    get_bytes(): bytes
+        Returns the binary PathField of the added paths
+    """
+
+    def __init__(self, decimal_places=2):
+        self.decimal_places = decimal_places
+        self.scale = 10.0 ** decimal_places
+        self.strings = ['']
+        self.string_indices = {'': 0}
+        self.paths = []
+
+    def get_string_index(self, string):
+        try:
+            return self.string_indices[string]
+        except KeyError:
+            index = self.string_indices[string] = len(self.strings)
+            self.strings.append(string)
+            return index
+
+    def scale_values(self, values):
+        """
+        Returns the values as integers scaled by 10 ** decimal_places, or None if any of them would not come
+        back exactly
+        """
+        scale = self.scale
+        scaled_values = []
+        for value in values:
+            if not is_number(value) or value != value or value in (float('inf'), float('-inf')):
+                return None
+            scaled_value = int(round(value * scale))
+            if scaled_value / scale != value or (value == 0 and math.copysign(1.0, value) < 0):
+                return None
+            scaled_values.append(scaled_value)
+        return scaled_values
+
+    def add_path(self, path):
+        """
+        Encodes a path. The records are packed by get_bytes, once the size of the string indices is known.
+
+        :param path: the path to encode
+        :type  path: Path2
+        :raises: TypeError: the path is not a Path2, or has an attribute value that can not be stored
+        """
+        if not is_path2(path):
+            raise TypeError('Binary PathFields can only be made from Path2 objects')
+
+        get_string_index = self.get_string_index
+        list_of_edges = path.list_of_edges
+
+        point_name_prefix = ''
+        if list_of_edges:
+            first_name = list_of_edges[0].p1.name
+            if first_name.endswith('0'):
+                point_name_prefix = first_name[:-1]
+
+        if path.closed is None:
+            closed = CLOSED_NONE
+        elif path.closed:
+            closed = CLOSED_TRUE
+        else:
+            closed = CLOSED_FALSE
+
+        attributes = []
+        for key, value in path.attributes.items():
+            if value is True:
+                attributes.append((get_string_index(key), ATTRIBUTE_TRUE, None))
+            elif value is False:
+                attributes.append((get_string_index(key), ATTRIBUTE_FALSE, None))
+            elif value is None:
+                attributes.append((get_string_index(key), ATTRIBUTE_NONE, None))
+            elif isinstance(value, float):
+                attributes.append((get_string_index(key), ATTRIBUTE_FLOAT, value))
+            elif isinstance(value, int):
+                attributes.append((get_string_index(key), ATTRIBUTE_INT, value))
+            elif isinstance(value, str):
+                attributes.append((get_string_index(key), ATTRIBUTE_STRING, get_string_index(value)))
+            else:
+                raise TypeError('Path attribute values must be strings, numbers, booleans or None')
+
+        edges = []
+        for index, edge in enumerate(list_of_edges):
+            if not is_edge2(edge):
+                raise TypeError('Binary PathFields can only be made from Edge2 objects')
+            edges.append(self.encode_edge(list_of_edges, index, edge, point_name_prefix))
+        decimal_places = self.pack_integer_values(edges)
+
+        self.paths.append(((get_string_index(path.name), get_string_index(path.type), get_string_index(path.fill),
+                            get_string_index(point_name_prefix), closed, decimal_places),
+                           [get_string_index(layer) for layer in path.layers], attributes,
+                           [(flags, record) for flags, record, _ in edges]))
+
+    def pack_integer_values(self, edges):
+        """
+        Scales the integer values of a path's edges down to the fewest decimal places that keep them exact,
+        stores each p1 as the change from the last one and sets the size flags
+
+        :param edges: the flags, records and integer value counts from encode_edge, changed in place
+        :return: the decimal places of the path's integer values
+        :rtype: int
+        """
+        removed_places = self.decimal_places
+        for _, record, number_of_integers in edges:
+            for value in record[:number_of_integers]:
+                places = 0
+                while value and places < removed_places and value % 10 == 0:
+                    value //= 10
+                    places += 1
+                if value:
+                    removed_places = places
+            if removed_places == 0:
+                break
+        divisor = 10 ** removed_places
+
+        reference_x = reference_y = 0
+        for index, (flags, record, number_of_integers) in enumerate(edges):
+            if number_of_integers == 0:
+                continue
+            record[:number_of_integers] = [value // divisor for value in record[:number_of_integers]]
+            record[0], reference_x = record[0] - reference_x, record[0]
+            record[1], reference_y = record[1] - reference_y, record[1]
+            minimum = min(record[:number_of_integers])
+            maximum = max(record[:number_of_integers])
+            for low, high, size_flag in INTEGER_SIZE_FLAGS:
+                if low <= minimum and maximum <= high:
+                    break
+            else:
+                raise OverflowError('Edge values are too large to store as 32 bit integers')
+            edges[index] = (flags | size_flag, record, number_of_integers)
+        return self.decimal_places - removed_places
+
+    def encode_edge(self, list_of_edges, index, edge, point_name_prefix):
+        """
+        Returns the flags and record values of an edge, with the number of integer values at the start of the
+        record that pack_integer_values still has to scale and size
+
+        :rtype: tuple
+        """
+        p1 = edge.p1
+        p2 = edge.p2
+        centre = edge.centre
+        flags = 0
+        if edge.clockwise:
+            flags |= CLOCKWISE
+        if edge.large:
+            flags |= LARGE
+
+        values = [p1.x, p1.y]
+        if index + 1 < len(list_of_edges):
+            if not points_match(p2, list_of_edges[index + 1].p1):
+                flags |= P2_STORED
+        elif points_match(p2, list_of_edges[0].p1):
+            flags |= P2_IS_FIRST
+        else:
+            flags |= P2_STORED
+        if flags & P2_STORED:
+            values.append(p2.x)
+            values.append(p2.y)
+
+        if isinstance(edge.radius, str) or edge.radius != 0:
+            flags |= HAS_RADIUS
+            values.append(edge.radius)
+
+        scaled_values = self.scale_values(values)
+        if scaled_values is not None and (min(scaled_values) < INTEGER_SIZE_FLAGS[-1][0] // 2 or
+                                          max(scaled_values) > INTEGER_SIZE_FLAGS[-1][1] // 2):
+            # the change from the last p1 has to fit too
+            scaled_values = None
+        if scaled_values is None:
+            if all(is_number(value) for value in values):
+                flags |= VALUES_DOUBLE
+            else:
+                flags |= VALUES_STRING
+
+        if centre is p1:
+            flags |= CENTRE_IS_P1
+        elif centre is p2:
+            flags |= CENTRE_IS_P2
+        elif (flags & VALUES_STRING or centre.name != '' or centre.w != 1 or
+              not is_number(centre.x) or not is_number(centre.y) or
+              centre.x != (p1.x + p2.x) * 0.5 or centre.y != (p1.y + p2.y) * 0.5):
+            flags |= CENTRE_STORED
+            if not (is_number(centre.x) and is_number(centre.y)):
+                flags = (flags & ~VALUES_DOUBLE) | VALUES_STRING
+                scaled_values = None
+
+        if p1.name != '%s%d' % (point_name_prefix, index):
+            flags |= P1_NAME_STORED
+        if edge.name or edge.style or edge.type or edge.left_name or edge.right_name:
+            flags |= EDGE_NAMES
+        if p1.w != 1 or p2.w != 1 or centre.w != 1:
+            flags |= WEIGHTS
+        if flags & ~0xff:
+            flags |= EXTENDED
+        number_of_integers = 0
+
+        get_string_index = self.get_string_index
+        if flags & VALUES_STRING:
+            if flags & CENTRE_STORED:
+                values.append(centre.x)
+                values.append(centre.y)
+            string_value_mask = 0
+            record = [0]
+            for value_index, value in enumerate(values):
+                if isinstance(value, str):
+                    string_value_mask |= 1 << value_index
+                    record.append(get_string_index(value))
+                else:
+                    record.append(get_string_index(repr(float(value))))
+            record[0] = string_value_mask
+        else:
+            if scaled_values is not None:
+                record = scaled_values
+                number_of_integers = len(scaled_values)
+            else:
+                record = values
+            if flags & CENTRE_STORED:
+                record.append(float(centre.x))
+                record.append(float(centre.y))
+        if flags & P2_STORED:
+            record.append(get_string_index(p2.name))
+        if flags & P1_NAME_STORED:
+            record.append(get_string_index(p1.name))
+        if flags & EDGE_NAMES:
+            record.extend((get_string_index(edge.name), get_string_index(edge.style), get_string_index(edge.type),
+                           get_string_index(edge.left_name), get_string_index(edge.right_name)))
+        if flags & WEIGHTS:
+            record.extend((p1.w, p2.w, centre.w))
+        return flags, record, number_of_integers
+
+    def get_bytes(self):
+        number_of_strings = len(self.strings)
+        if number_of_strings <= 0x100:
+            string_index_size = 1
+        elif number_of_strings <= 0x10000:
+            string_index_size = 2
+        else:
+            string_index_size = 4
+
+        chunks = [HEADER.pack(MAGIC, VERSION, string_index_size),
+                  encode_varint(number_of_strings - 1)]
+        for string in self.strings[1:]:
+            encoded_string = string.encode('utf-8')
+            chunks.append(encode_varint(len(encoded_string)))
+            chunks.append(encoded_string)
+
+        chunks.append(encode_varint(len(self.paths)))
+        for path_indices, layers, attributes, edges in self.paths:
+            chunks.extend(encode_varint(value) for value in path_indices)
+            chunks.append(encode_varint(len(layers)))
+            chunks.extend(encode_varint(layer) for layer in layers)
+            chunks.append(encode_varint(len(attributes)))
+            for key_index, kind, value in attributes:
+                chunks.append(encode_varint(key_index))
+                chunks.append(struct.pack('<B', kind))
+                if kind == ATTRIBUTE_STRING:
+                    chunks.append(encode_varint(value))
+                elif kind == ATTRIBUTE_FLOAT:
+                    chunks.append(ATTRIBUTE_FLOAT_VALUE.pack(value))
+                elif kind == ATTRIBUTE_INT:
+                    chunks.append(ATTRIBUTE_INT_VALUE.pack(value))
+
+            chunks.append(encode_varint(len(edges)))
+            for flags, record in edges:
+                if flags & EXTENDED:
+                    chunks.append(struct.pack('<H', flags))
+                else:
+                    chunks.append(struct.pack('<B', flags))
+                chunks.append(get_edge_layout(flags, string_index_size).pack(*record))
+        return b''.join(chunks)
+
+
+def encode(paths, decimal_places=2):
+    """
+    Encodes paths as a binary PathField
+
+    :param paths: list of Path2 objects
+    :param decimal_places: values with no more decimal places than this are stored as 16 or 32 bit
+                           integers, others as doubles. load_path rounds to 2 places by default.
+    :return: the binary PathField
+    :rtype: bytes
+    :raises: TypeError: a path is not a Path2, or an attribute value can not be stored
+    """
+    writer = BinaryPathFieldWriter(decimal_places)
+    for path in paths:
+        writer.add_path(path)
+    return writer.get_bytes()
+
+
+def decode(data):
+    """
+    Rebuilds the paths of a binary PathField. Numbers come back as floats, everything else as it was encoded.
+
+    :param data: the binary PathField from encode
+    :return: list of Path2 objects
+    :rtype: list
+    :raises: ValueError: the data is not a binary PathField of this version
+    """
+    data = bytearray(data)
+    if len(data) < HEADER.size:
+        raise ValueError('Data is too short to be a binary PathField')
+    magic, version, string_index_size = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Data is not a version %d binary PathField' % VERSION)
+
+    number_of_strings, offset = read_varint(data, HEADER.size)
+    strings = ['']
+    for _ in range(number_of_strings):
+        string_length, offset = read_varint(data, offset)
+        strings.append(intern(data[offset:offset + string_length].decode('utf-8')))
+        offset += string_length
+
+    new_point = Point2.__new__
+    new_edge = Edge2.__new__
+    paths = []
+    number_of_paths, offset = read_varint(data, offset)
+    for _ in range(number_of_paths):
+        path = Path2()
+        name_index, offset = read_varint(data, offset)
+        type_index, offset = read_varint(data, offset)
+        fill_index, offset = read_varint(data, offset)
+        prefix_index, offset = read_varint(data, offset)
+        closed, offset = read_varint(data, offset)
+        decimal_places, offset = read_varint(data, offset)
+        scale = 10.0 ** decimal_places
+        path.name = strings[name_index]
+        path.type = strings[type_index]
+        path.fill = strings[fill_index]
+        path.closed = (None, False, True)[closed]
+        default_point_names = get_default_point_names(strings[prefix_index])
+
+        number_of_layers, offset = read_varint(data, offset)
+        for _ in range(number_of_layers):
+            layer_index, offset = read_varint(data, offset)
+            path.layers.append(strings[layer_index])
+
+        number_of_attributes, offset = read_varint(data, offset)
+        for _ in range(number_of_attributes):
+            key_index, offset = read_varint(data, offset)
+            kind = data[offset]
+            offset += 1
+            if kind == ATTRIBUTE_TRUE:
+                value = True
+            elif kind == ATTRIBUTE_FALSE:
+                value = False
+            elif kind == ATTRIBUTE_NONE:
+                value = None
+            elif kind == ATTRIBUTE_STRING:
+                value_index, offset = read_varint(data, offset)
+                value = strings[value_index]
+            elif kind == ATTRIBUTE_FLOAT:
+                value = ATTRIBUTE_FLOAT_VALUE.unpack_from(data, offset)[0]
+                offset += ATTRIBUTE_FLOAT_VALUE.size
+            elif kind == ATTRIBUTE_INT:
+                value = ATTRIBUTE_INT_VALUE.unpack_from(data, offset)[0]
+                offset += ATTRIBUTE_INT_VALUE.size
+            else:
+                raise ValueError('Unknown attribute value kind %d' % kind)
+            path.attributes[strings[key_index]] = value
+
+        number_of_edges, offset = read_varint(data, offset)
+        list_of_edges = path.list_of_edges
+        reference_x = reference_y = 0
+        for index in range(number_of_edges):
+            flags = data[offset]
+            if flags & EXTENDED:
+                flags |= data[offset + 1] << 8
+                offset += 2
+            else:
+                offset += 1
+            edge_layout = get_edge_layout(flags, string_index_size)
+            record = edge_layout.unpack_from(data, offset)
+            offset += edge_layout.size
+
+            number_of_values = 2
+            if flags & P2_STORED:
+                number_of_values += 2
+            if flags & HAS_RADIUS:
+                number_of_values += 1
+            if flags & VALUES_STRING:
+                if flags & CENTRE_STORED:
+                    number_of_values += 2
+                string_value_mask = record[0]
+                values = []
+                for value_index in range(number_of_values):
+                    value = strings[record[1 + value_index]]
+                    if not string_value_mask & (1 << value_index):
+                        value = float(value)
+                    values.append(value)
+                position = 1 + number_of_values
+            else:
+                if flags & VALUES_DOUBLE:
+                    values = list(record[:number_of_values])
+                else:
+                    reference_x += record[0]
+                    reference_y += record[1]
+                    values = [reference_x / scale, reference_y / scale]
+                    values.extend(value / scale for value in record[2:number_of_values])
+                position = number_of_values
+                if flags & CENTRE_STORED:
+                    values.extend(record[position:position + 2])
+                    position += 2
+
+            p1 = new_point(Point2)
+            p1.__dict__ = {'x': values[0], 'y': values[1], 'w': 1, 'name': ''}
+            value_index = 2
+            p2 = new_point(Point2)
+            if flags & P2_STORED:
+                p2.__dict__ = {'x': values[2], 'y': values[3], 'w': 1, 'name': strings[record[position]]}
+                position += 1
+                value_index = 4
+            if flags & HAS_RADIUS:
+                radius = values[value_index]
+                value_index += 1
+            else:
+                radius = 0
+
+            if flags & P1_NAME_STORED:
+                p1.name = strings[record[position]]
+                position += 1
+            else:
+                p1.name = default_point_names[index]
+
+            edge = new_edge(Edge2)
+            edge.__dict__ = {'p1': p1, 'p2': p2, 'radius': radius, 'clockwise': bool(flags & CLOCKWISE),
+                             'large': bool(flags & LARGE), 'centre': None, 'name': '', 'style': '', 'type': '',
+                             'left_name': '', 'right_name': ''}
+            if flags & EDGE_NAMES:
+                (edge.name, edge.style, edge.type, edge.left_name,
+                 edge.right_name) = [strings[string_index] for string_index in record[position:position + 5]]
+                position += 5
+
+            if flags & CENTRE_IS_P1:
+                edge.centre = p1
+            elif flags & CENTRE_IS_P2:
+                edge.centre = p2
+            else:
+                centre = edge.centre = new_point(Point2)
+                centre.__dict__ = {'w': 1, 'name': ''}
+                if flags & CENTRE_STORED:
+                    centre.x = values[value_index]
+                    centre.y = values[value_index + 1]
+            if flags & WEIGHTS:
+                p1.w, p2.w, centre_w = record[position:position + 3]
+                if edge.centre is not p1 and edge.centre is not p2:
+                    edge.centre.w = centre_w
+            list_of_edges.append(edge)
+
+        # copied p2s and middle centres need the next and first points, so they are filled in once all are read
+        for index, edge in enumerate(list_of_edges):
+            p2 = edge.p2
+            if 'x' not in p2.__dict__:
+                if index + 1 < number_of_edges:
+                    p2.__dict__.update(list_of_edges[index + 1].p1.__dict__)
+                else:
+                    p2.__dict__.update(list_of_edges[0].p1.__dict__)
+            centre = edge.centre
+            if 'x' not in centre.__dict__:
+                centre.x = (edge.p1.x + p2.x) * 0.5
+                centre.y = (edge.p1.y + p2.y) * 0.5
+        paths.append(path)
+
+    if offset != len(data):
+        raise ValueError('Binary PathField has %d unexpected trailing bytes' % (len(data) - offset))
+    return paths
@@ -0,0 +1,169 @@
+from collections import OrderedDict
+
+from geometry_utils.two_d.path2 import is_path2
+
+# Rough resident sizes, in bytes, of the objects a parsed PathField is made of
+APPROXIMATE_PATH_SIZE = 300
+APPROXIMATE_EDGE_SIZE = 850
+
+
+def freeze(value):
+    """
+    Converts dicts, lists and sets into nested tuples so the value can be used in a cache key
+
+    :param value: the value to convert
+    :return: a hashable version of the value
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(freeze(item) for item in value))
+    return value
+
+
+def clone_result(result):
+    """
+    Copies a load_path result, which is a list of Path2s, a single Path2 or None
+    """
+    if result is None:
+        return None
+    if is_path2(result):
+        return result.clone()
+    return [path.clone() for path in result]
+
+
+def approximate_result_size(path_field, result):
+    """
+    Estimates the memory held by a cache entry for a load_path result
+    """
+    if result is None:
+        paths = []
+    elif is_path2(result):
+        paths = [result]
+    else:
+        paths = result
+    size = len(path_field)
+    for path in paths:
+        size += APPROXIMATE_PATH_SIZE + APPROXIMATE_EDGE_SIZE * path.path_length
+    return size
+
+
+class PathFieldCache:
+    """
+    A bounded least recently used cache of PathFieldInterpreter.load_path results
+
+    Attributes:
+    ___________
+    max_entries: int
+        the maximum number of cached results
+    max_size: int
+        the maximum approximate memory, in bytes, held by the cached results
+    size: int
+        the approximate memory, in bytes, currently held by the cached results
+    hits: int
+        the number of lookups answered from the cache
+    misses: int
+        the number of lookups not found in the cache
+    evictions: int
+        the number of results dropped to stay within max_entries and max_size
+
+    Methods:
+    ________
+    make_key(str, dict, str, str, int, int, dict, bool): tuple
+        Returns the cache key for a load_path call
+    get(tuple): list/Path2/None
+        Returns a copy of the cached result, raises KeyError if the key is not cached
+    put(tuple, str, list/Path2/None):
+        Stores a load_path result, evicting the least recently used results when over the limits
+    clear():
+        Removes all the cached results
+    get_stats(): dict
+        Returns the entry count, size, hit, miss and eviction counters
+    """
+
+    def __init__(self, max_entries=1024, max_size=16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    @staticmethod
+    def make_key(path_field, override_data, return_single, point_name_prefix, round_value, enlarge_offset,
+                 variables, edit_mode=False):
+        """
+        Builds the key of a load_path call. The variables only affect paths with includes,
+        so they are left out of the key when the PathField has none.
+        """
+        if override_data:
+            override_data = freeze(override_data)
+        else:
+            override_data = None
+        if variables and '?' in path_field:
+            variables = freeze(variables)
+        else:
+            variables = None
+        return (path_field, override_data, return_single, point_name_prefix, round_value, enlarge_offset,
+                variables, edit_mode)
+
+    def get(self, key):
+        """
+        Looks up a load_path result, marking it as the most recently used
+
+        :param key: key from make_key
+        :return: a copy of the cached result that the caller is free to change
+        :raises: KeyError: the key is not cached
+        """
+        try:
+            result, size = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.entries.pop(key)
+        self.entries[key] = (result, size)
+        self.hits += 1
+        return clone_result(result)
+
+    def put(self, key, path_field, result):
+        """
+        Stores a copy of a load_path result
+
+        :param key: key from make_key
+        :param path_field: the parsed PathField string, used to estimate the entry size
+        :param result: the load_path result
+        """
+        size = approximate_result_size(path_field, result)
+        if size > self.max_size:
+            return
+
+        if key in self.entries:
+            self.size -= self.entries.pop(key)[1]
+
+        self.entries[key] = (clone_result(result), size)
+        self.size += size
+
+        while len(self.entries) > self.max_entries or self.size > self.max_size:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+    def get_stats(self):
+        return {'entries': len(self.entries),
+                'size': self.size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions}
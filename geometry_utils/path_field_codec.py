@@ -0,0 +1,166 @@
+import threading
+from collections import OrderedDict
+
+from geometry_utils import path_field_binary
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+LOAD_OPTIONS = ('edit_mode', 'override_data', 'return_single', 'point_name_prefix', 'round_value', 'enlarge_offset')
+# The most sets of call variables that keep their compiled includes, the least recently used is dropped first
+MAX_INCLUDE_BINDINGS = 64
+
+
+class PathFieldCodec:
+    """
+    A PathField reader and writer that can be shared between threads and asynchronous tasks.
+    Each thread loads with its own PathFieldInterpreter, kept by the codec so that the index of return_single
+    is reused between calls; the variables of each call are set on it before it is used. iter_paths, dump and
+    dumps work on a new interpreter each call, so no buffer is left over between calls. Compiled includes
+    are shared between calls made with the same variables, as they are never changed once compiled.
+
+    Attributes:
+    ___________
+    interpreter_class: class
+        the PathFieldInterpreter class used for each call
+    variables: dict
+        the default variables for includes, updated by the variables of each call
+    options: dict
+        the default load_path options, replaced by the options of each call
+    include_templates: OrderedDict
+        the compiled includes of the most recently used call variables, by those variables
+    include_templates_lock: threading.Lock
+        held while include_templates is reordered, as threads share it
+
+    Methods:
+    ________
+    load(str, dict, **options): list/Path2/None
+        Reads a PathField, as PathFieldInterpreter.load_path
+    iter_paths(str/file, dict, **options): generator
+        Reads a PathField one path at a time, as PathFieldInterpreter.iter_paths
+    dumps(list): str
+        Returns the PathField string of Path2s
+    dump(list, file):
+        Writes the PathField string of Path2s to a file-like object
+    load_binary(bytes): list
+        Decodes a binary PathField
+    dump_binary(list, int): bytes
+        Encodes Path2s as a binary PathField
+    """
+
+    def __init__(self, interpreter_class=PathFieldInterpreter, variables=None, **options):
+        """
+        :param interpreter_class: PathFieldInterpreter or a subclass of it
+        :param variables: default variables for includes
+        :param options: default load_path options
+        """
+        for option in options:
+            if option not in LOAD_OPTIONS:
+                raise TypeError('Unknown load_path option %s' % option)
+        self.interpreter_class = interpreter_class
+        self.variables = dict(variables or {})
+        self.options = options
+        self.include_templates = OrderedDict()
+        self.include_templates_lock = threading.Lock()
+        self.local = threading.local()
+
+    def get_include_templates(self, variables=None):
+        """
+        Returns the compiled includes shared by the calls made with the same variables
+
+        :param variables: variables of the call
+        :return: dict of IncludeTemplate by variable name
+        """
+        key = tuple(sorted(variables.items())) if variables else ()
+        with self.include_templates_lock:
+            include_templates = self.include_templates.pop(key, None)
+            if include_templates is None:
+                include_templates = {}
+                while len(self.include_templates) >= MAX_INCLUDE_BINDINGS:
+                    self.include_templates.popitem(last=False)
+            self.include_templates[key] = include_templates
+        return include_templates
+
+    def set_variables(self, path_field_interpreter, variables=None):
+        path_field_interpreter.variables = self.variables
+        if variables:
+            path_field_interpreter.variables = dict(self.variables)
+            path_field_interpreter.variables.update(variables)
+        path_field_interpreter.include_templates = self.get_include_templates(variables)
+        return path_field_interpreter
+
+    def make_interpreter(self, variables=None):
+        """
+        Returns a new interpreter for a single call
+
+        :param variables: variables of the call, added to the default variables
+        :return: PathFieldInterpreter
+        """
+        return self.set_variables(self.interpreter_class(), variables)
+
+    def get_interpreter(self, variables=None):
+        """
+        Returns the interpreter of the calling thread, made on its first call, set up for a call
+
+        :param variables: variables of the call, added to the default variables
+        :return: PathFieldInterpreter
+        """
+        path_field_interpreter = getattr(self.local, 'interpreter', None)
+        if path_field_interpreter is None:
+            path_field_interpreter = self.local.interpreter = self.interpreter_class()
+        return self.set_variables(path_field_interpreter, variables)
+
+    def get_options(self, options):
+        if not options:
+            return self.options
+        merged_options = dict(self.options)
+        merged_options.update(options)
+        return merged_options
+
+    def load(self, path_field, variables=None, **options):
+        """
+        Reads a PathField string
+
+        :param path_field: PathField string
+        :param variables: variables for includes, added to the default variables
+        :param options: load_path options, replacing the default options
+        :return: list of Path2, or the path named by return_single
+        """
+        return self.get_interpreter(variables).load_path(path_field, **self.get_options(options))
+
+    def iter_paths(self, source, variables=None, **options):
+        """
+        Reads a PathField string or text file object one path at a time
+
+        :param source: PathField string or text file object
+        :param variables: variables for includes, added to the default variables
+        :param options: iter_paths options, replacing the default load_path options
+        :return: generator of Path2
+        """
+        options = dict(self.get_options(options))
+        options.pop('return_single', None)
+        return self.make_interpreter(variables).iter_paths(source, **options)
+
+    def dumps(self, paths):
+        """
+        Returns the PathField string of Path2s
+
+        :param paths: iterable of Path2
+        :return: PathField string
+        """
+        return self.interpreter_class().add_paths(paths)
+
+    def dump(self, paths, fp):
+        """
+        Writes the PathField string of Path2s to a file-like object
+
+        :param paths: iterable of Path2
+        :param fp: object with a write method
+        """
+        self.interpreter_class().dump(paths, fp)
+
+    @staticmethod
+    def load_binary(data):
+        return path_field_binary.decode(data)
+
+    @staticmethod
+    def dump_binary(paths, decimal_places=2):
+        return path_field_binary.encode(paths, decimal_places)
@@ -0,0 +1,150 @@
+from geometry_utils.maths_utility import DOUBLE_EPSILON
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.point2 import Point2
+
+# x and y multipliers of the include edge types, as applied by Path2.offset
+INCLUDE_MIRROR_SIGNS = {'pp': (1, 1),
+                        'mm': (-1, -1),
+                        'pm': (-1, 1),
+                        'mp': (1, -1)}
+
+
+def find_include_names(path_string, include_start='?', include_delimiter=',', condition_delimiter='?'):
+    """
+    Returns the variable names of the include tags in a PathField string
+
+    :param path_string: PathField string
+    :return: list of variable names
+    :rtype: list
+    """
+    names = []
+    for path_str in path_string.split('|'):
+        for point in path_str.split(';'):
+            if point.startswith(include_start):
+                include_data = point.lstrip(include_start).split(condition_delimiter)[0]
+                names.append(include_data.split(include_delimiter)[0])
+    return names
+
+
+class IncludeTemplate:
+    """
+    A parsed include variable, ready to be offset and mirrored into a path without re-parsing its text
+
+    Attributes:
+    ___________
+    variable_name: str
+        the name of the included variable
+    dependencies: dict
+        the variable strings the template was compiled from, including those of nested includes
+    records: list
+        one tuple of coordinates, arc values and names per edge
+
+    Methods:
+    ________
+    compile(PathFieldInterpreter, str): IncludeTemplate
+        Parses a variable into a template
+    is_current(dict): bool
+        Tests if the template was compiled from the current variable strings
+    transform_records(float, float, str): generator
+        Yields the records offset and mirrored by the include type
+    instantiate(Vector2, str): list
+        Returns new edges offset by the vector and mirrored by the include type
+    """
+
+    def __init__(self, variable_name, dependencies, records):
+        self.variable_name = variable_name
+        self.dependencies = dependencies
+        self.records = records
+
+    @classmethod
+    def compile(cls, path_field_interpreter, variable_name):
+        """
+        Parses an include variable of the interpreter into a template.
+        Nested includes are compiled first so that the template depends on their strings too.
+
+        :param path_field_interpreter: the PathFieldInterpreter holding the variables
+        :param variable_name: name of the variable to compile
+        :return: the compiled template
+        :rtype: IncludeTemplate
+        """
+        variables = path_field_interpreter.variables
+        path_string = variables.get(variable_name, ';')
+        dependencies = {variable_name: path_string}
+        for include_name in find_include_names(path_string, path_field_interpreter.INCLUDE_START,
+                                               path_field_interpreter.INCLUDE_DELIMITER,
+                                               path_field_interpreter.INCLUDE_CONDITION_DELIMITER):
+            if include_name != variable_name:
+                include_template = path_field_interpreter.get_include_template(include_name)
+                dependencies.update(include_template.dependencies)
+
+        path = path_field_interpreter.load_path(path_string, point_name_prefix=variable_name + '_')[0]
+        path.update_path()
+
+        records = []
+        for edge in path.list_of_edges:
+            records.append((edge.p1.x, edge.p1.y, edge.p1.name, edge.p2.x, edge.p2.y, edge.p2.name,
+                            edge.centre.x, edge.centre.y, edge.centre is edge.p1, edge.radius, edge.clockwise,
+                            edge.large, edge.name, edge.style, edge.type, edge.left_name, edge.right_name))
+        return cls(variable_name, dependencies, records)
+
+    def is_current(self, variables):
+        for variable_name, path_string in self.dependencies.items():
+            if variables.get(variable_name, ';') != path_string:
+                return False
+        return True
+
+    def transform_records(self, offset_x, offset_y, point_type='pp'):
+        """
+        Yields the records of the template offset, mirrored first according to the point type in the same way as
+        Path2.offset: 'pp' no mirror, 'mm' about the origin, 'pm' about the y axis and 'mp' about the x axis.
+        Arcs mirrored about one axis change direction. The offset may be NumPy arrays, as path_field_batch gives.
+
+        :param offset_x: x to offset by
+        :param offset_y: y to offset by
+        :param point_type: include type, unknown types are treated as 'pp'
+        :return: generator of records
+        """
+        x_sign, y_sign = INCLUDE_MIRROR_SIGNS.get(point_type.lower(), (1, 1))
+        # mirroring about one axis reverses arcs, while 'mm' mirrors about both, a half turn that keeps their direction
+        flip_arcs = x_sign * y_sign == -1
+        for (p1_x, p1_y, p1_name, p2_x, p2_y, p2_name, centre_x, centre_y, centre_is_p1, radius, clockwise, large,
+             name, style, edge_type, left_name, right_name) in self.records:
+            if flip_arcs and radius > DOUBLE_EPSILON:
+                clockwise = not clockwise
+            yield (x_sign * p1_x + offset_x, y_sign * p1_y + offset_y, p1_name,
+                   x_sign * p2_x + offset_x, y_sign * p2_y + offset_y, p2_name,
+                   x_sign * centre_x + offset_x, y_sign * centre_y + offset_y, centre_is_p1, radius, clockwise, large,
+                   name, style, edge_type, left_name, right_name)
+
+    def instantiate(self, offset_vector, point_type='pp'):
+        """
+        Creates the edges of the template offset by a vector and mirrored according to the point type,
+        see transform_records. Arc centres are moved with the edges rather than solved again.
+
+        :param offset_vector: Vector2 to offset by
+        :param point_type: include type, unknown types are treated as 'pp'
+        :return: list of new edges
+        :rtype: list
+        """
+        new_point = Point2.__new__
+        new_edge = Edge2.__new__
+        edges = []
+        for (p1_x, p1_y, p1_name, p2_x, p2_y, p2_name, centre_x, centre_y, centre_is_p1, radius, clockwise, large,
+             name, style, edge_type, left_name, right_name) in self.transform_records(offset_vector.x, offset_vector.y,
+                                                                                      point_type):
+            p1 = new_point(Point2)
+            p1.__dict__ = {'x': p1_x, 'y': p1_y, 'w': 1, 'name': p1_name}
+            p2 = new_point(Point2)
+            p2.__dict__ = {'x': p2_x, 'y': p2_y, 'w': 1, 'name': p2_name}
+            if centre_is_p1:
+                centre = p1
+            else:
+                centre = new_point(Point2)
+                centre.__dict__ = {'x': centre_x, 'y': centre_y, 'w': 1, 'name': ''}
+
+            edge = new_edge(Edge2)
+            edge.__dict__ = {'p1': p1, 'p2': p2, 'radius': radius, 'clockwise': clockwise, 'large': large,
+                             'centre': centre, 'name': name, 'style': style, 'type': edge_type,
+                             'left_name': left_name, 'right_name': right_name}
+            edges.append(edge)
+        return edges
@@ -0,0 +1,431 @@
+import bisect
+
+from geometry_utils.path_field_interpreter import POINT_TOKEN_GROUPS, POINT_TOKEN_REGEX
+from geometry_utils.path_field_names import get_default_point_names
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.path2 import Path2
+from geometry_utils.two_d.point2 import Point2
+
+
+class PathSegment:
+    """
+    One path string of an IncrementalPathField, with the point tokens and parser state kept when the path is
+    made of plain points
+
+    Attributes:
+    ___________
+    start: int
+        position of the path string in the PathField
+    text: str
+        the path string
+    path: Path2 or None
+        the path parsed from the text, None for an empty path string
+    points_start: int or None
+        position of the points in the text, None when the path is parsed again on every edit
+    token_starts: list
+        position of each point token in the points, see token_start
+    token_texts: list
+        the text of each point token
+    token_values: list
+        the x, y, curve, radius and names of each plain point
+    states: list
+        for each plain point, what the parser passes on to the next point: x, y, last arc radius and the arc
+        of the point's open edge
+    number_of_points: int
+        the number of plain points, which is the number of point tokens less the closing one
+    closed_point: str or None
+        the closing point token of a closed path
+
+    Methods:
+    ________
+    token_start(int): int
+        Returns the position of a point token in the points
+    find_token(int): int
+        Returns the index of the point token at a position in the points
+    shift_tokens(int, int):
+        Moves the point tokens after an index
+    """
+
+    def __init__(self, start, text, path):
+        self.start = start
+        self.text = text
+        self.path = path
+        self.points_start = None
+        self.token_starts = []
+        self.token_texts = []
+        self.token_values = []
+        self.states = []
+        self.number_of_points = 0
+        self.closed_point = None
+        # token_starts from shift_index on are shift short of their position, so that typing into a point
+        # does not move every point after it
+        self.shift_index = 0
+        self.shift = 0
+
+    def token_start(self, index):
+        if index >= self.shift_index:
+            return self.token_starts[index] + self.shift
+        return self.token_starts[index]
+
+    def find_token(self, position):
+        token_starts = self.token_starts
+        shift_index = self.shift_index
+        if shift_index < len(token_starts) and position >= token_starts[shift_index] + self.shift:
+            return bisect.bisect_right(token_starts, position - self.shift, shift_index) - 1
+        return bisect.bisect_right(token_starts, position, 0, shift_index) - 1
+
+    def shift_tokens(self, index, shift):
+        """
+        Moves the point tokens after index by shift characters
+        """
+        if self.shift and self.shift_index != index + 1:
+            token_starts = self.token_starts
+            token_starts[self.shift_index:] = [token_start + self.shift
+                                               for token_start in token_starts[self.shift_index:]]
+            self.shift = 0
+        self.shift_index = index + 1
+        self.shift += shift
+
+
+class IncrementalPathField:
+    """
+    A PathField loaded for the shape editor, which takes text edits and only parses again what they change.
+    An edit within one point of a path of plain points runs the parser again on that point, and on the points
+    after it only while their positions or arc radii follow from it, then patches the path's edges in place.
+    Other edits parse the path string they are in again, or the whole PathField when they add or remove path
+    strings or it has special shapes.
+
+    Attributes:
+    ___________
+    interpreter: PathFieldInterpreter
+        parses the points and holds the variables
+    path_field: str
+        the PathField string
+    paths: list
+        the Path2s of the PathField, the same as load_path gives for path_field
+    segments: list or None
+        a PathSegment for each path string, None when every edit parses the whole PathField again
+
+    Methods:
+    ________
+    load(str): list
+        Parses a whole PathField
+    apply_edit(int, int, str): list
+        Replaces part of the PathField string and updates the paths to match
+    """
+
+    def __init__(self, interpreter, path_field, edit_mode=False, override_data=None, point_name_prefix='',
+                 round_value=2, enlarge_offset=0):
+        self.interpreter = interpreter
+        self.edit_mode = edit_mode
+        self.override_data = {} if override_data is None else override_data
+        self.point_name_prefix = point_name_prefix
+        self.round_value = round_value
+        self.enlarge_offset = enlarge_offset
+        self.path_field = ''
+        self.paths = []
+        self.segments = None
+        self.segment_starts = []
+        self.load(path_field)
+
+    def load(self, path_field):
+        """
+        Parses a whole PathField
+        @param path_field: PathField string
+        @return: list of Path2
+        """
+        interpreter = self.interpreter
+        segments = []
+        start = 0
+        for path_str in interpreter.split_into_paths(path_field):
+            segment = self.parse_segment(start, path_str)
+            if segment is None:
+                segments = None
+                break
+            segments.append(segment)
+            start += len(path_str) + 1
+
+        if segments is None:
+            self.paths = interpreter.load_path(path_field, edit_mode=self.edit_mode,
+                                               override_data=self.override_data,
+                                               point_name_prefix=self.point_name_prefix,
+                                               round_value=self.round_value, enlarge_offset=self.enlarge_offset)
+            self.segment_starts = []
+        else:
+            self.paths = [segment.path for segment in segments if segment.path is not None]
+            self.segment_starts = [segment.start for segment in segments]
+        self.segments = segments
+        self.path_field = interpreter.read_buffer = path_field
+        return self.paths
+
+    def apply_edit(self, offset, removed_length, inserted_text):
+        """
+        Replaces removed_length characters at offset in the PathField string with inserted_text and updates
+        the paths. Paths that are still there afterwards are patched in place, so references to them stay valid.
+        @param offset: position of the edit in the PathField string
+        @param removed_length: number of characters removed
+        @param inserted_text: text inserted in their place
+        @return: list of Path2
+        """
+        path_field = self.path_field
+        if offset < 0 or removed_length < 0 or offset + removed_length > len(path_field):
+            raise ValueError('The edit is outside the PathField')
+        new_path_field = path_field[:offset] + inserted_text + path_field[offset + removed_length:]
+
+        segments = self.segments
+        if segments is not None and self.interpreter.NEW_PATH_CHAR not in inserted_text:
+            segment_index = bisect.bisect_right(self.segment_starts, offset) - 1
+            segment = segments[segment_index]
+            position = offset - segment.start
+            if position + removed_length <= len(segment.text) and \
+                    self.edit_segment(segment_index, position, removed_length, inserted_text):
+                shift = len(inserted_text) - removed_length
+                if shift:
+                    segment_starts = self.segment_starts
+                    for index in range(segment_index + 1, len(segments)):
+                        segments[index].start += shift
+                        segment_starts[index] += shift
+                self.path_field = self.interpreter.read_buffer = new_path_field
+                return self.paths
+
+        return self.load(new_path_field)
+
+    def edit_segment(self, segment_index, position, removed_length, inserted_text):
+        """
+        Applies an edit within a path string, to its points when it is inside one plain point and otherwise by
+        parsing the path string again
+        @return: False if the path string now has special shapes, and the whole PathField has to be parsed
+        """
+        segment = self.segments[segment_index]
+        text = segment.text
+        new_text = text[:position] + inserted_text + text[position + removed_length:]
+
+        interpreter = self.interpreter
+        points_start = segment.points_start
+        # the first name and layer characters end the header wherever they are in the path string
+        if (points_start is not None and position >= points_start and
+                interpreter.POINT_SEPARATOR not in inserted_text and interpreter.NAME_CHAR not in inserted_text and
+                interpreter.LAYER_CHAR not in inserted_text):
+            position -= points_start
+            index = segment.find_token(position)
+            token_start = segment.token_start(index)
+            token_text = segment.token_texts[index]
+            position -= token_start
+            if index < segment.number_of_points and position + removed_length <= len(token_text):
+                new_token_text = token_text[:position] + inserted_text + token_text[position + removed_length:]
+                if self.edit_point(segment, index, new_token_text):
+                    segment.text = new_text
+                    segment.shift_tokens(index, len(new_token_text) - len(token_text))
+                    return True
+
+        new_segment = self.parse_segment(segment.start, new_text)
+        if new_segment is None:
+            return False
+        self.segments[segment_index] = new_segment
+        if segment.path is not None and new_segment.path is not None:
+            # the path keeps counting its versions up, so a caller holding one sees that it changed
+            version = segment.path.version
+            segment.path.__dict__ = new_segment.path.__dict__
+            segment.path.version = version
+            segment.path.invalidate()
+            new_segment.path = segment.path
+        else:
+            self.paths = [segment.path for segment in self.segments if segment.path is not None]
+        return True
+
+    def parse_segment(self, start, text):
+        """
+        Parses a path string, keeping its point tokens and parser state when it is made of plain points
+        @return: PathSegment, or None if the path string has special shapes
+        """
+        if text == '':
+            return PathSegment(start, text, None)
+
+        interpreter = self.interpreter
+        path = Path2()
+        points = interpreter.process_path_header(text, path, self.override_data)
+        if points.startswith(interpreter.SPECIAL_SHAPES):
+            return None
+
+        segment = PathSegment(start, text, path)
+        if self.read_point_tokens(segment, points):
+            segment.points_start = len(text) - len(points)
+            segment.states = [None] * segment.number_of_points
+            last_edge = self.process_point_tokens(segment, path, 0, Edge2(), 0.0)
+            is_closed = segment.closed_point is not None
+            if is_closed:
+                interpreter.process_closed_point(segment.closed_point, path, last_edge, segment.states[-1][2],
+                                                 self.edit_mode)
+        else:
+            is_closed = interpreter.process_path_points(points, path, self.edit_mode, self.point_name_prefix,
+                                                        self.round_value)
+        interpreter.finish_path(path, is_closed)
+        return segment
+
+    def read_point_tokens(self, segment, points):
+        """
+        Splits the points of a path string into tokens for the segment
+        @return: False if the path has points other than plain ones, or too few to be edited in place
+        """
+        interpreter = self.interpreter
+        match = POINT_TOKEN_REGEX.match
+        token_starts = []
+        token_texts = []
+        token_values = []
+        position = 0
+        while True:
+            token = match(points, position)
+            text, x, y, curve, radius, names, rest, end = token.group(*POINT_TOKEN_GROUPS)
+            token_starts.append(position)
+            token_texts.append(text)
+            token_values.append(None if rest else (x, y or '', curve, radius, names))
+            if not end:
+                break
+            position = token.end()
+
+        last_text = token_texts[-1]
+        if interpreter.MIRRORED_PATH_INDICATOR in last_text:
+            return False
+        number_of_points = len(token_texts)
+        if interpreter.CLOSED_PATH_INDICATOR in last_text:
+            if not last_text.startswith(interpreter.CLOSED_PATH_INDICATOR):
+                return False
+            segment.closed_point = last_text
+            number_of_points -= 1
+        # a path of one edge may be completed into a circle, which is left to the parser
+        if number_of_points < 3:
+            return False
+        for index in range(number_of_points):
+            if not self.is_plain_point(token_texts[index], token_values[index]):
+                return False
+
+        segment.token_starts = token_starts
+        segment.shift_index = len(token_starts)
+        segment.token_texts = token_texts
+        segment.token_values = token_values
+        segment.number_of_points = number_of_points
+        return True
+
+    def is_plain_point(self, text, token_values):
+        """
+        Tests if a point token is a position with an optional arc and names, which process_point_token turns
+        into a single edge
+        """
+        interpreter = self.interpreter
+        if token_values is None or text[:1] in (interpreter.INCLUDE_START, interpreter.FUNCTION_CHAR):
+            return False
+        x, y, curve, radius, names = token_values
+        if not (self.is_number(x) and self.is_number(y)):
+            return False
+        if curve is not None:
+            # edit mode keeps radii as text
+            if self.edit_mode:
+                return False
+            if radius != '' and not self.is_number(radius, False):
+                return False
+        return True
+
+    def is_number(self, value, relative=True):
+        if value == '':
+            return True
+        if relative and value.startswith(self.interpreter.RELATIVE_CHAR):
+            value = value[1:]
+        try:
+            float(value)
+        except ValueError:
+            return False
+        return True
+
+    def process_point_tokens(self, segment, path, first_index, last_edge, last_r, edited_index=None):
+        """
+        Runs the point loop of process_path_points over the plain points of a segment from first_index,
+        appending their edges to path and keeping the state each point passes on in segment.states.
+        With edited_index, the loop stops at the point after the first one from edited_index on whose state
+        has not changed, as the points from there on parse as they did before.
+        @return: the open edge of the last point processed
+        """
+        interpreter = self.interpreter
+        edit_mode = self.edit_mode
+        default_point_names = get_default_point_names(self.point_name_prefix)
+        round_value = self.round_value
+        token_values = segment.token_values
+        states = segment.states
+        list_of_edges = path.list_of_edges
+        new_states = []
+        stop_index = None
+
+        for index in range(first_index, segment.number_of_points):
+            x, y, curve, radius, names = token_values[index]
+            edge_d = Edge2(Point2(), Point2(), 0, False, False)
+            interpreter.process_point_token(x, y, curve, radius, names, edge_d, path, last_edge, last_r, edit_mode,
+                                            default_point_names[index], round_value)
+            if last_edge.is_arc():
+                last_r = last_edge.radius
+            last_edge = list_of_edges[-1]
+            if index == stop_index:
+                break
+
+            state = (last_edge.p1.x, last_edge.p1.y, last_r, last_edge.radius, last_edge.clockwise,
+                     last_edge.large)
+            if edited_index is not None and index >= edited_index and state == states[index]:
+                stop_index = index + 1
+            new_states.append(state)
+        states[first_index:first_index + len(new_states)] = new_states
+        return last_edge
+
+    def edit_point(self, segment, index, text):
+        """
+        Replaces the text of a plain point and patches the edges of the segment's path that it changes
+        @return: False, changing nothing, if the new text is not a plain point
+        """
+        interpreter = self.interpreter
+        token = POINT_TOKEN_REGEX.match(text)
+        _, x, y, curve, radius, names, rest, _ = token.group(*POINT_TOKEN_GROUPS)
+        token_values = None if rest else (x, y or '', curve, radius, names)
+        if not self.is_plain_point(text, token_values):
+            return False
+        last_point = index == segment.number_of_points - 1 and segment.closed_point is None
+        if last_point and (interpreter.CLOSED_PATH_INDICATOR in text or interpreter.MIRRORED_PATH_INDICATOR in text):
+            return False
+
+        old_text = segment.token_texts[index]
+        old_token_values = segment.token_values[index]
+        segment.token_texts[index] = text
+        segment.token_values[index] = token_values
+
+        # The point before is parsed again too, so that its open edge is joined to the edited point the way
+        # the parser joins it. It is appended after an edge standing in for the one before it.
+        first_index = max(index - 1, 0)
+        edges = Path2()
+        if first_index == 0:
+            last_edge = Edge2()
+            last_r = 0.0
+        else:
+            p1_x, p1_y, last_r, radius, clockwise, large = segment.states[first_index - 1]
+            last_edge = Edge2(Point2(p1_x, p1_y), Point2())
+            last_edge.radius = radius
+            last_edge.clockwise = clockwise
+            last_edge.large = large
+            edges.list_of_edges.append(last_edge)
+        try:
+            self.process_point_tokens(segment, edges, first_index, last_edge, last_r, index)
+        except Exception:
+            segment.token_texts[index] = old_text
+            segment.token_values[index] = old_token_values
+            raise
+
+        new_edges = edges.list_of_edges[1:] if first_index else edges.list_of_edges
+        last_index = first_index + len(new_edges) - 1
+        path = segment.path
+        list_of_edges = path.list_of_edges
+        if last_index < segment.number_of_points - 1 or segment.closed_point is None:
+            # the edge of the last point parsed is as it was
+            list_of_edges[first_index:last_index] = new_edges[:-1]
+        else:
+            list_of_edges[first_index:] = new_edges
+        if segment.closed_point is not None and (index == 0 or last_index == segment.number_of_points - 1):
+            interpreter.process_closed_point(segment.closed_point, path, list_of_edges[-1], segment.states[-1][2],
+                                             self.edit_mode)
+        # the edges were replaced in place, which the cached properties of the path do not notice
+        path.invalidate()
+        return True
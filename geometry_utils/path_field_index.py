@@ -0,0 +1,132 @@
+from collections import OrderedDict
+
+from geometry_utils.path_field_validator import SPECIAL_SHAPES, PathFieldSyntaxError, scan_header
+
+# Returned by PathFieldIndex.find when the paths before the named path have to be parsed to find it
+SEARCH_ALL = 'search all'
+
+
+def get_renamed(name, override_data):
+    """
+    Returns the name load_path gives a path called name in its header
+    """
+    if override_data and name in override_data and 'rename' in override_data[name]:
+        return override_data[name]['rename']
+    return name
+
+
+class PathFieldIndex:
+    """
+    The name and span of each path string of a PathField, so that a path can be found by its name
+    without parsing the paths before it.
+    Special shapes, and path strings whose header load_path does not read in the usual way, are not indexed
+    by name, as the names of the paths they give are only known once they have been parsed. A name that
+    comes after one of them is found by parsing every path before it, as load_path does.
+
+    Attributes:
+    ___________
+    path_field: str
+        the PathField that was indexed
+    spans: list
+        the name, start and end of each non-empty path string, the name is None when it is not known
+    names: dict
+        the index in spans of the first path string with each name
+    first_unnamed: int
+        the index in spans of the first path string without a known name, None if there is none
+
+    Methods:
+    ________
+    find(str, dict): tuple/None/SEARCH_ALL
+        Returns the span of the path string load_path would return for a name
+    """
+
+    def __init__(self, path_field):
+        self.path_field = path_field
+        self.spans = []
+        self.names = {}
+        self.first_unnamed = None
+
+        start = 0
+        for path_str in path_field.split('|'):
+            if path_str:
+                try:
+                    header, position = scan_header(path_str, start)
+                    name = None if path_str.startswith(SPECIAL_SHAPES, position) else header.name
+                except PathFieldSyntaxError:
+                    name = None
+                if name is None:
+                    if self.first_unnamed is None:
+                        self.first_unnamed = len(self.spans)
+                elif name not in self.names:
+                    self.names[name] = len(self.spans)
+                self.spans.append((name, start, start + len(path_str)))
+            start += len(path_str) + 1
+
+    def __len__(self):
+        return len(self.spans)
+
+    def find(self, name, override_data=None):
+        """
+        Finds the path string load_path(return_single=name) would return the path of
+
+        :param name: the name of the path, after any rename in override_data
+        :param override_data: the override data of the load_path call
+        :return: the start and end of the path string, None if no path has the name, or SEARCH_ALL
+                 if the paths before it have to be parsed to find it
+        """
+        header_names = []
+        if get_renamed(name, override_data) == name:
+            header_names.append(name)
+        if override_data:
+            header_names.extend(header_name for header_name in override_data
+                                if header_name != name and get_renamed(header_name, override_data) == name)
+
+        found = None
+        for header_name in header_names:
+            index = self.names.get(header_name)
+            if index is not None and (found is None or index < found):
+                found = index
+
+        if self.first_unnamed is not None and (found is None or self.first_unnamed < found):
+            return SEARCH_ALL
+        if found is None:
+            return None
+        return self.spans[found][1:]
+
+
+class PathFieldIndexCache:
+    """
+    A bounded least recently used cache of PathFieldIndexes, each built the first time its PathField is used
+
+    Attributes:
+    ___________
+    max_entries: int
+        the maximum number of cached indexes
+
+    Methods:
+    ________
+    get_index(str): PathFieldIndex
+        Returns the index of a PathField
+    clear():
+        Removes all the cached indexes
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_index(self, path_field):
+        path_field_index = self.entries.pop(path_field, None)
+        if path_field_index is None:
+            path_field_index = PathFieldIndex(path_field)
+            while len(self.entries) >= self.max_entries > 0:
+                self.entries.popitem(last=False)
+        if self.max_entries > 0:
+            self.entries[path_field] = path_field_index
+        return path_field_index
+
+    def clear(self):
+        self.entries.clear()
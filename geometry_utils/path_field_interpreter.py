@@ -1,5 +1,10 @@
 import copy
+import re
 
+from geometry_utils import path_field_binary, path_field_pool, path_field_syntax
+from geometry_utils.path_field_include import IncludeTemplate
+from geometry_utils.path_field_index import SEARCH_ALL, PathFieldIndexCache
+from geometry_utils.path_field_names import get_default_point_names, intern
 from geometry_utils.three_d.point3 import is_point3
 from geometry_utils.two_d.path2 import Path2
 from geometry_utils.three_d.path3 import is_path3
@@ -7,6 +12,66 @@ from geometry_utils.two_d.edge2 import Edge2
 from geometry_utils.two_d.point2 import Point2, is_point2
 
 
+# A single PathField point: x[:y[:z]] position, an optional curve definition and optional comma
+# separated names, terminated by ';' or the end of the path.  Anything the simple grammar cannot
+# account for is captured by 'rest', and the point is then handed to process_normal_point as text.
+POINT_TOKEN_REGEX = re.compile(r'(?P<point>'
+                               r'(?P<x>[^;:(){},]*)(?::(?P<y>[^;:(){},]*)(?::[^;(){},]*)?)?'
+                               r'(?:(?P<curve>[(){}])(?P<radius>[^;(){},]*))?'
+                               r'(?:,(?P<names>[^;(){}]*))?'
+                               r'(?P<rest>[^;]*))'
+                               r'(?P<end>;?)')
+
+POINT_TOKEN_GROUPS = ('point', 'x', 'y', 'curve', 'radius', 'names', 'rest', 'end')
+
+# clockwise, large for each curve character
+CURVE_FLAGS = {'{': (True, True),
+               '}': (False, True),
+               '(': (True, False),
+               ')': (False, False)}
+
+
+def tokenize_path_points(path_str):
+    """
+    Splits the points part of a path string into point tokens, scanning the string once.
+    Yields (text, x, y, curve, radius, names) tuples.  x is None when the point does not fit the
+    simple point grammar and has to be processed from its text.
+    @param path_str: points part of a single path, eg: ';1:1;2:2)5,name;#'
+    """
+    match = POINT_TOKEN_REGEX.match
+    position = 0
+    while True:
+        token = match(path_str, position)
+        text, x, y, curve, radius, names, rest, end = token.group(*POINT_TOKEN_GROUPS)
+        if rest:
+            yield text, None, None, None, None, None
+        else:
+            yield text, x, y or '', curve, radius, names
+        if not end:
+            break
+        position = token.end()
+
+
+def format_num(num):
+    """
+    Formats a number to PathField spec:
+     - Rounded to 2dp.
+     - Any trailing 0's and .'s removed.
+     - eg: 12.00003535 -> 12
+     - eg: 12.300 -> 12.3
+     - eg: 12.000000 -> 12
+    @param num: float or integer.
+    @return: formatted number as string
+    """
+    try:
+        str_num = "%.2f" % float(num)
+    except ValueError:
+        return "%s" % num
+    if str_num == '0.00':
+        return '0'
+    return str_num.rstrip('0').rstrip('.')
+
+
 class PathFieldInterpreter(Path2, object):
     # Symbols used in the PathField
     NEW_PATH_CHAR = '|'
@@ -34,11 +99,24 @@ class PathFieldInterpreter(Path2, object):
     TAG_START_CHAR = '<'
     TAG_END_CHAR = '>'
 
-    def __init__(self):
+    def __init__(self, cache=None, stats=None, path_field_indexes=None):
+        """
+        @param cache: optional PathFieldCache shared by load_path calls
+        @param stats: optional PathFieldStats that times the phases of each load_path call
+        @param path_field_indexes: optional PathFieldIndexCache used to find the path of return_single
+        """
         super(PathFieldInterpreter, self).__init__()
         self.write_buffer = ''
         self.read_buffer = ''
         self.variables = {}
+        self.cache = cache
+        self.include_templates = {}
+        if path_field_indexes is None:
+            path_field_indexes = PathFieldIndexCache()
+        self.path_field_indexes = path_field_indexes
+        self.stats = None
+        if stats is not None:
+            stats.instrument(self)
 
     def clear_path(self):
         self.write_buffer = ''
@@ -53,94 +131,147 @@ class PathFieldInterpreter(Path2, object):
         @param path: Path2() instance
         @return: PathField string
         """
-        def format_num(num):
-            """
-            Formats a number to PathField spec:
-             - Rounded to 2dp.
-             - Any trailing 0's and .'s removed.
-             - eg: 12.00003535 -> 12
-             - eg: 12.300 -> 12.3
-             - eg: 12.000000 -> 12
-            @param num: float or integer.
-            @return: formatted number as string
-            """
+        self.append_path_strings([self.format_path(path)])
+        return self.write_buffer
+
+    def add_paths(self, paths):
+        """
+        Add several Path2()s to the PathField and return the PathField string.
+        Number formatting is shared between the paths and the buffer is joined once.
+        @param paths: iterable of Path2() instances
+        @return: PathField string
+        """
+        format_cache = {}
+        self.append_path_strings([self.format_path(path, format_cache) for path in paths])
+        return self.write_buffer
+
+    def dump(self, paths, fp):
+        """
+        Write Path2()s as a PathField string straight to a file-like object.
+        The buffer is not used, so the output is the same as add_paths on a cleared interpreter.
+        @param paths: iterable of Path2() instances
+        @param fp: object with a write method
+        """
+        format_cache = {}
+        written = False
+        for path in paths:
+            path_string = self.format_path(path, format_cache)
+            if written:
+                fp.write(self.NEW_PATH_CHAR)
+                fp.write(path_string)
+            elif path_string != '':
+                fp.write(path_string)
+                written = True
+
+    def dump_binary(self, paths, decimal_places=2):
+        """
+        Encode Path2()s as a binary PathField, see path_field_binary for the layout.
+        @param paths: iterable of Path2() instances
+        @param decimal_places: values with no more decimal places than this are stored as integers
+        @return: bytes
+        """
+        return path_field_binary.encode(paths, decimal_places)
+
+    def load_binary(self, data):
+        """
+        Decode a binary PathField from dump_binary
+        @param data: bytes
+        @return: list of Path2() instances
+        """
+        return path_field_binary.decode(data)
+
+    def path_field_to_binary(self, path_field, edit_mode=False, override_data=None, point_name_prefix='',
+                             round_value=2, enlarge_offset=0):
+        """
+        Load a PathField string and encode its paths as a binary PathField.
+        Values are rounded to round_value places, so they are all stored as integers when they fit.
+        @return: bytes
+        """
+        paths = self.load_path(path_field, edit_mode=edit_mode, override_data=override_data,
+                               point_name_prefix=point_name_prefix, round_value=round_value,
+                               enlarge_offset=enlarge_offset)
+        return path_field_binary.encode(paths, round_value)
+
+    def binary_to_path_field(self, data):
+        """
+        Decode a binary PathField and return its paths as a PathField string, the same string add_paths
+        gives for the paths that were encoded. The buffer is not used.
+        @param data: bytes
+        @return: PathField string
+        """
+        return self.__class__().add_paths(path_field_binary.decode(data))
+
+    def append_path_strings(self, path_strings):
+        parts = [self.write_buffer] if self.write_buffer != '' else []
+        for path_string in path_strings:
+            # a path separator is only written once there is something in the buffer
+            if parts or path_string != '':
+                parts.append(path_string)
+        self.write_buffer = self.NEW_PATH_CHAR.join(parts)
+
+    def format_path(self, path, format_cache=None):
+        """
+        Returns the PathField string of a single path, in time linear in the number of edges.
+        @param path: Path2() instance
+        @param format_cache: optional dict of already formatted numbers, shared between calls
+        @return: PathField string
+        """
+        if format_cache is None:
+            format_cache = {}
+
+        def format_cached(num):
+            if not num:
+                # 0.0 and -0.0 are the same dict key but format differently
+                return format_num(num)
             try:
-                str_num = "%.2f" % float(num)
-            except ValueError:
-                return "%s" % num
-            if str_num == '0.00':
-                return '0'
-            return str_num.rstrip('0').rstrip('.')
+                return format_cache[num]
+            except KeyError:
+                str_num = format_cache[num] = format_num(num)
+                return str_num
+
+        out = []
+        write = out.append
 
-        def format_point(point):
+        # only repeat an unchanged first point when this interpreter itself holds a single edge
+        repeat_first_point = self.path_length == 1
+
+        def add_point(_index, point, _last):
             if is_point2(point):
-                point_string = [format_num(point.x), format_num(point.y)]
-                return point_string
+                str_z = None
             elif is_point3(point):
-                point_string = [format_num(point.x), format_num(point.y), format_num(point.z)]
-                return point_string
+                str_z = format_cached(point.z)
             else:
                 raise TypeError('Argument must be a type of Point2 or Point3')
-
-        def get_curve_indicator(_edge):
-            """
-            Retrieves the correct curve indicator given large and clockwise parameters
-            for a curve.
-            @param _edge:
-            @return:
-            """
-            if _edge.large and _edge.clockwise:
-                return self.CURVE_LARGE_CLOCK
-            elif _edge.large and not _edge.clockwise:
-                return self.CURVE_LARGE_ANTICLOCK
-            elif not _edge.large and _edge.clockwise:
-                return self.CURVE_SMALL_CLOCK
-            elif not _edge.large and not _edge.clockwise:
-                return self.CURVE_SMALL_ANTICLOCK
-
-        def add_point(_index, point, _last):
-            delimiter_buffer = ''
-            point_string = format_point(point)
-            if point_string[0] != _last[0]:
-                self.write_buffer += point_string[0]
-                _last[0] = point_string[0]
-            elif _index == 0 and self.path_length == 1:
-                self.write_buffer += _last[0]
-            delimiter_buffer += self.POINT_ELEMENT_SEPARATOR
-
-            if point_string[1] != _last[1]:
-                self.write_buffer += delimiter_buffer + point_string[1]
-                _last[1] = point_string[1]
-                delimiter_buffer = self.POINT_ELEMENT_SEPARATOR
-            elif _index == 0 and self.path_length == 1:
-                self.write_buffer += delimiter_buffer + _last[1]
-                delimiter_buffer = self.POINT_ELEMENT_SEPARATOR
+            str_x = format_cached(point.x)
+            str_y = format_cached(point.y)
+
+            if str_x != _last[0]:
+                write(str_x)
+                _last[0] = str_x
+            elif _index == 0 and repeat_first_point:
+                write(_last[0])
+
+            delimiter_buffer = self.POINT_ELEMENT_SEPARATOR
+            if str_y != _last[1]:
+                write(delimiter_buffer + str_y)
+                _last[1] = str_y
+            elif _index == 0 and repeat_first_point:
+                write(delimiter_buffer + _last[1])
             else:
                 delimiter_buffer += self.POINT_ELEMENT_SEPARATOR
 
-            if is_point3(point):
-                if point_string[2] != _last[2]:
-                    self.write_buffer += delimiter_buffer + point_string[2]
-                    _last[2] = format_num(point.z)
-            return _last
-
-        # If there is already a path in the buffer, append the path separator first
-        if self.write_buffer != '':
-            self.write_buffer += self.NEW_PATH_CHAR
+            if str_z is not None and str_z != _last[2]:
+                write(delimiter_buffer + str_z)
+                _last[2] = str_z
 
         # Write out layer names if given
         if path.layers:
-            first = True
-            for layer in path.layers:
-                if not first:
-                    self.write_buffer += ','
-                self.write_buffer += layer
-                first = False
-            self.write_buffer += self.LAYER_CHAR
+            write(','.join(path.layers))
+            write(self.LAYER_CHAR)
 
         # Write out path name if given
         if path.name != '':
-            self.write_buffer += path.name + self.NAME_CHAR
+            write(path.name + self.NAME_CHAR)
 
         # State variables, initialised to 0 so if first point is 0, 0, 0 the values wont be written
         # as required by the spec
@@ -148,65 +279,68 @@ class PathFieldInterpreter(Path2, object):
         last_r = '0'
 
         indicator_buffer = ''
-        path_length = path.path_length
-        last_index = path_length - 1
+        list_of_edges = path.list_of_edges
+        last_index = len(list_of_edges) - 1
+        is_closed = last_index >= 0 and path.is_closed
+        curve_indicators = {(True, True): self.CURVE_LARGE_CLOCK,
+                            (True, False): self.CURVE_LARGE_ANTICLOCK,
+                            (False, True): self.CURVE_SMALL_CLOCK,
+                            (False, False): self.CURVE_SMALL_ANTICLOCK}
 
         # Loop through the points and write them out
-        for index, edge in enumerate(path.list_of_edges):
+        previous_edge = None
+        for index, edge in enumerate(list_of_edges):
             # If this is the last point in a closed path, output the closed path indicator, rather than the xyz pos
-            if path.is_closed and index == last_index:
-                self.write_buffer += self.CLOSED_PATH_INDICATOR
+            if is_closed and index == last_index:
+                write(self.CLOSED_PATH_INDICATOR)
             else:
-                if index == 0 or edge.p1 != path.list_of_edges[index - 1].p2:
-                    last = add_point(index, edge.p1, last)
+                if index == 0 or edge.p1 != previous_edge.p2:
+                    add_point(index, edge.p1, last)
                     if index != last_index:
-                        self.write_buffer += self.POINT_SEPARATOR
-                last = add_point(index, edge.p2, last)
+                        write(self.POINT_SEPARATOR)
+                add_point(index, edge.p2, last)
 
             # Only a valid curve if all three curve parameters are present
             if edge.is_arc():
-                self.write_buffer += get_curve_indicator(edge)
-                if format_num(edge.radius) != last_r:
-                    self.write_buffer += format_num(edge.radius)
-                    last_r = format_num(edge.radius)
-            indicator_buffer = ''
+                write(curve_indicators[(bool(edge.large), bool(edge.clockwise))])
+                str_radius = format_cached(edge.radius)
+                if str_radius != last_r:
+                    write(str_radius)
+                    last_r = str_radius
 
             # Add point name if given
             # Skip the point name if its the last point in a closed path, as path name is invalid
             # and extra comma not needed
-            if not (index == last_index and path.is_closed):
-                indicator_buffer += ','
+            if not (index == last_index and is_closed):
                 if edge.p1.name:
-                    self.write_buffer += indicator_buffer + edge.p1.name
+                    write(',' + edge.p1.name)
                 elif edge.p2.name:
-                    self.write_buffer += indicator_buffer + edge.p2.name
-                indicator_buffer = ''
+                    write(',' + edge.p2.name)
 
             # Add edge name if given
-            indicator_buffer += ','
+            indicator_buffer = ','
             if edge.name:
-                self.write_buffer += indicator_buffer + edge.name
+                write(indicator_buffer + edge.name)
                 indicator_buffer = ''
 
             # Add edge style if given
             if edge.style:
-                self.write_buffer += indicator_buffer + self.LINE_STYLE_INDICATOR + edge.style
+                write(indicator_buffer + self.LINE_STYLE_INDICATOR + edge.style)
                 indicator_buffer = ''
 
             if index != last_index:
-                self.write_buffer += self.POINT_SEPARATOR
+                write(self.POINT_SEPARATOR)
+            previous_edge = edge
 
         if path.fill != '':
             if indicator_buffer != '':
-                if path.list_of_edges[-1].is_arc():
-                    self.write_buffer += indicator_buffer + self.FILL_INDICATOR
-                self.write_buffer += path.fill
+                if list_of_edges[-1].is_arc():
+                    write(indicator_buffer + self.FILL_INDICATOR)
+                write(path.fill)
             else:
-                self.write_buffer += self.FILL_INDICATOR + path.fill
+                write(self.FILL_INDICATOR + path.fill)
 
-        outbuf = self.write_buffer.replace(';;', ';')
-
-        return outbuf
+        return ''.join(out).replace(';;', ';')
 
     def parse_curve_def(self, curve_def, edit_mode):
         """
@@ -253,47 +387,165 @@ class PathFieldInterpreter(Path2, object):
         @param round_value: int required number of decimal places
         @param enlarge_offset: enlarge_offset only works for pre-defined shapes ie rect / diamond etc
         """
-        if override_data is None:
-            override_data = {}
+        if self.cache is None:
+            return self._load_paths(path_field, edit_mode, override_data, return_single, point_name_prefix,
+                                    round_value, enlarge_offset)
+
+        key = self.cache.make_key(path_field, override_data, return_single, point_name_prefix, round_value,
+                                  enlarge_offset, self.variables, edit_mode)
+        try:
+            self.read_buffer = path_field
+            return self.cache.get(key)
+        except KeyError:
+            pass
+        result = self._load_paths(path_field, edit_mode, override_data, return_single, point_name_prefix,
+                                  round_value, enlarge_offset)
+        self.cache.put(key, path_field, result)
+        return result
+
+    def load_syntax_tree(self, path_field, override_data=None, point_name_prefix='', round_value=2,
+                         enlarge_offset=0):
+        """
+        Reads a PathField string into a syntax tree for the shape editor, without building any geometry.
+        The points are kept as they are written, as edit_mode keeps radii, with their position in the PathField,
+        and the tree writes back the same PathField. The geometry of a path is built by load_path, with the
+        given options, when it is asked for with PathFieldSyntaxTree.get_paths.
+        @param path_field: string
+        @return: PathFieldSyntaxTree
+        """
+        return path_field_syntax.parse_syntax_tree(path_field, self, override_data=override_data,
+                                                   point_name_prefix=point_name_prefix, round_value=round_value,
+                                                   enlarge_offset=enlarge_offset)
 
+    def _load_paths(self, path_field, edit_mode, override_data, return_single, point_name_prefix, round_value,
+                    enlarge_offset):
         out_paths = []
 
         self.read_buffer = path_field
-        path_fields = self.split_into_paths(self.read_buffer)
+        if return_single is None:
+            path_fields = self.split_into_paths(self.read_buffer)
+        else:
+            # only the path string of the named path is parsed, unless a special shape comes before it
+            span = self.path_field_indexes.get_index(path_field).find(return_single, override_data)
+            if span is None:
+                return None
+            if span is SEARCH_ALL:
+                path_fields = self.split_into_paths(self.read_buffer)
+            else:
+                path_fields = [path_field[span[0]:span[1]]]
+
+        for path in self._iter_loaded_paths(path_fields, out_paths, edit_mode, override_data, point_name_prefix,
+                                            round_value, enlarge_offset):
+            if return_single is not None and path.name == return_single:
+                return path
+
+        if return_single is None:
+            return out_paths
+        else:
+            return None
+
+    def load_paths_many(self, path_fields, workers=None, chunksize=None, pool=None, edit_mode=False,
+                        override_data=None, return_single=None, point_name_prefix='', round_value=2,
+                        enlarge_offset=0):
+        """
+        Reads a list of PathField strings across a process pool.
+        Workers send their paths back in the compact format of path_field_pool.pack_path rather than
+        pickling Path2 / Edge2 / Point2 objects. The interpreter class and variables are passed to the
+        workers, so the class must be importable by them.
+        @param path_fields: list of PathField strings
+        @param workers: number of processes, defaults to the number of CPUs; 1 parses in this process
+        @param chunksize: number of PathFields sent to a worker at a time
+        @param pool: optional multiprocessing pool to use instead of starting one
+        @return: list with the load_path result of each PathField, in input order
+        """
+        return path_field_pool.load_paths_many(self, path_fields, workers=workers, chunksize=chunksize, pool=pool,
+                                               edit_mode=edit_mode, override_data=override_data,
+                                               return_single=return_single, point_name_prefix=point_name_prefix,
+                                               round_value=round_value, enlarge_offset=enlarge_offset)
+
+    def iter_paths(self, source, edit_mode=False, override_data=None, point_name_prefix='', round_value=2,
+                   enlarge_offset=0, previous_paths=None, chunk_size=65536):
+        """
+        Reads a PathField one path at a time, yielding each Path2 as soon as it has been parsed.
+        Only the path being parsed is held in memory, so huge multi-path PathFields can be processed
+        without building every Path2 first.
+        @param source: PathField string or text file object
+        @param edit_mode: boolean used for the shape editor
+        @param override_data:
+        @param point_name_prefix:
+        @param round_value: int required number of decimal places
+        @param enlarge_offset: enlarge_offset only works for pre-defined shapes ie rect / diamond etc
+        @param previous_paths: optional list that each path is appended to; special shapes can only refer
+                               to earlier paths when it is given
+        @param chunk_size: number of characters read from a file object at a time
+        @return: generator of Path2
+        """
+        path_strings = self.iter_path_strings(source, chunk_size)
+        return self._iter_loaded_paths(path_strings, previous_paths, edit_mode, override_data, point_name_prefix,
+                                       round_value, enlarge_offset)
 
-        for path_str in path_fields:
+    def find_path(self, source, name, edit_mode=False, override_data=None, point_name_prefix='', round_value=2,
+                  enlarge_offset=0, chunk_size=65536):
+        """
+        Returns the first path called name in a PathField string or text file object.
+        Reading and parsing stop at the first match.
+        @return: Path2 or None
+        """
+        for path in self.iter_paths(source, edit_mode, override_data, point_name_prefix, round_value,
+                                    enlarge_offset, [], chunk_size):
+            if path.name == name:
+                return path
+        return None
+
+    def iter_path_strings(self, source, chunk_size=65536):
+        """
+        Splits a PathField string or text file object into its path strings lazily.
+        @param source: PathField string or text file object
+        @param chunk_size: number of characters read from a file object at a time
+        @return: generator of str
+        """
+        if not hasattr(source, 'read'):
+            start = 0
+            while True:
+                end = source.find(self.NEW_PATH_CHAR, start)
+                if end == -1:
+                    yield source[start:]
+                    return
+                yield source[start:end]
+                start = end + 1
+
+        pieces = []
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            parts = chunk.split(self.NEW_PATH_CHAR)
+            if len(parts) == 1:
+                pieces.append(chunk)
+                continue
+            pieces.append(parts[0])
+            yield ''.join(pieces)
+            for part in parts[1:-1]:
+                yield part
+            pieces = [parts[-1]]
+        yield ''.join(pieces)
+
+    def _iter_loaded_paths(self, path_strings, previous_paths, edit_mode, override_data, point_name_prefix,
+                           round_value, enlarge_offset):
+        if override_data is None:
+            override_data = {}
+        if previous_paths is None:
+            previous_paths = []
+            keep_previous_paths = False
+        else:
+            keep_previous_paths = True
+
+        for path_str in path_strings:
             if len(path_str) == 0:
                 continue
 
             path = Path2()
-
-            if path_str[0] == self.TAG_START_CHAR:
-                index = path_str[1:].find(self.TAG_END_CHAR)
-                if index != 1:
-                    self.decode_attributes(path, path_str[1:index + 1])
-                    path_str = path_str[index + 2:]
-
-            if path_str[0] == self.TYPE_DELIMITER_CHAR:
-                index = path_str[1:].find(self.TYPE_DELIMITER_CHAR)
-                if index != 1:
-                    path.type = path_str[1:index + 1]
-                    path_str = path_str[index + 2:]
-
-            # Check if layers are specified
-            index = path_str.find(self.LAYER_CHAR)
-            if index != -1:
-                path.layers = path_str[:index].split(',')
-                path_str = path_str[index + 1:]
-
-            # Check if a path name has been specified
-            index = path_str.find(self.NAME_CHAR)
-            if index != -1:
-                path.name = path_str[:index]
-                # Check if the name has been overridden
-                if path.name in override_data and 'rename' in override_data[path.name]:
-                    path.name = override_data[path.name]['rename']
-
-                path_str = path_str[index + 1:]  # strip off the name now we've processed it
+            path_str = self.process_path_header(path_str, path, override_data)
 
             # Check for special shapes
             if path_str.startswith(self.SPECIAL_SHAPES):
@@ -305,92 +557,144 @@ class PathFieldInterpreter(Path2, object):
                     function_data = path_str[1:point_separator]
                     path_str = path_str[point_separator + 1:]
 
-                special_paths = PathFieldShapes.process_special_functions(path_field_interpreter=self,
-                                                                          function_data=function_data,
-                                                                          path2=path,
-                                                                          previous_paths=out_paths,
-                                                                          override_data=override_data,
-                                                                          enlarge_offset=enlarge_offset)
+                special_paths = self.process_special_shapes(function_data, path, previous_paths, override_data,
+                                                            enlarge_offset)
 
                 for special_path in special_paths:
-                    out_paths.append(special_path)
-                    if return_single is not None and special_path.name == return_single:
-                        return special_path
+                    if keep_previous_paths:
+                        previous_paths.append(special_path)
+                    yield special_path
 
                 if path_str in ('', ';'):
                     continue
 
-            points = path_str.split(self.POINT_SEPARATOR)
-
-            # State variables
-            last_edge = Edge2()
-            last_r = 0.0
-
-            is_closed = False
-            is_mirrored = False
-            mirrored_point = -1
-            if self.CLOSED_PATH_INDICATOR in points[len(points) - 1]:  # Check if path is closed
-                is_closed = True
-            if self.MIRRORED_PATH_INDICATOR in points[len(points) - 1]:  # Check if path is mirrored
-                is_mirrored = True
-
-            for index, point in enumerate(points):
-                default_point_name = "%s%d" % (point_name_prefix, index)
-                edge_d = Edge2(Point2(), Point2(), 0, False, False)
-
-                # if the path is closed, process the last point differently as the format could be quite different,
-                # especially if there is a fill colour specified
-
-                if point.startswith(self.INCLUDE_START):
-                    if self.process_include_tag(point, path, last_edge, edit_mode):
-                        continue
-
-                elif point.startswith(self.FUNCTION_CHAR):
-                    path_field_functions = PathFieldFunctions()
-                    path_field_functions.process(point, path)
-
-                elif is_closed and point is points[len(points) - 1]:  # last point of a closed path
-                    self.process_closed_point(point, path, last_edge, last_r, edit_mode)
-                    break
-
-                elif is_mirrored:  # mirrored point
-                    if point is points[len(points) - 1]:
-                        self.process_mirrored_points(point, edge_d, path,
-                                                     last_edge, last_r, mirrored_point, edit_mode, default_point_name,
-                                                     round_value=round_value)
-                        break
-
-                    else:
-                        if len(point) > 0 and point[0] == self.MIRRORED_PATH_POINT_INDICATOR:
-                            mirrored_point = path.path_length - 1
-                            point = point[1:]
-                            # if edit_mode:
-                            # path.points[-1]['mirror'] = self.MIRRORED_PATH_POINT_INDICATOR
-                        self.process_normal_point(point, edge_d, path, last_edge, last_r,
-                                                  edit_mode, default_point_name,
-                                                  round_value=round_value)
-                else:  # Normal point
-                    self.process_normal_point(point, edge_d, path, last_edge, last_r,
-                                              edit_mode, default_point_name,
-                                              round_value=round_value)
-                if last_edge.is_arc():
-                    last_r = last_edge.radius
-                last_edge = path.list_of_edges[-1]
-
-            if not is_closed and path.path_length > 1:
-                del path.list_of_edges[-1]
-
-            if path.is_incomplete_circle():
-                path.complete_circle()
+            is_closed = self.process_path_points(path_str, path, edit_mode, point_name_prefix, round_value)
+            self.finish_path(path, is_closed)
 
-            if return_single is not None and path.name == return_single:
-                return path
-            out_paths.append(path)
+            if keep_previous_paths:
+                previous_paths.append(path)
+            yield path
 
-        if return_single is None:
-            return out_paths
-        else:
-            return None
+    def process_special_shapes(self, function_data, path, previous_paths, override_data, enlarge_offset):
+        """
+        Builds the paths of a special shape, eg: '_rect,100,50'
+        @param function_data: the special shape without the leading '_'
+        @param path: Path2 holding the header of the path string
+        @return: list of Path2
+        """
+        return PathFieldShapes.process_special_functions(path_field_interpreter=self,
+                                                         function_data=function_data,
+                                                         path2=path,
+                                                         previous_paths=previous_paths,
+                                                         override_data=override_data,
+                                                         enlarge_offset=enlarge_offset)
+
+    @staticmethod
+    def finish_path(path, is_closed):
+        """
+        Removes the open last edge of a path that is not closed, once all its points have been processed,
+        and completes a path of a single arc into a circle.
+        @param path: Path2 built by process_path_points
+        @param is_closed: True if the path is closed
+        """
+        if not is_closed and path.path_length > 1:
+            del path.list_of_edges[-1]
+
+        if path.is_incomplete_circle():
+            path.complete_circle()
+
+    def process_path_header(self, path_str, path, override_data):
+        """
+        Decodes the attributes, type, layers and name at the start of a path string onto path.
+        @param path_str: a single path from the PathField
+        @param path: Path2 to receive the header values
+        @param override_data:
+        @return: the remainder of path_str
+        """
+        if path_str[0] == self.TAG_START_CHAR:
+            index = path_str[1:].find(self.TAG_END_CHAR)
+            if index != 1:
+                self.decode_attributes(path, path_str[1:index + 1])
+                path_str = path_str[index + 2:]
+
+        if path_str[0] == self.TYPE_DELIMITER_CHAR:
+            index = path_str[1:].find(self.TYPE_DELIMITER_CHAR)
+            if index != 1:
+                path.type = intern(path_str[1:index + 1])
+                path_str = path_str[index + 2:]
+
+        # Check if layers are specified
+        index = path_str.find(self.LAYER_CHAR)
+        if index != -1:
+            path.layers = [intern(layer) for layer in path_str[:index].split(',')]
+            path_str = path_str[index + 1:]
+
+        # Check if a path name has been specified
+        index = path_str.find(self.NAME_CHAR)
+        if index != -1:
+            path.name = intern(path_str[:index])
+            # Check if the name has been overridden
+            if path.name in override_data and 'rename' in override_data[path.name]:
+                path.name = override_data[path.name]['rename']
+
+            path_str = path_str[index + 1:]  # strip off the name now we've processed it
+        return path_str
+
+    def process_path_points(self, path_str, path, edit_mode, point_name_prefix, round_value):
+        """
+        Builds the edges of path from the points part of a path string.
+        The string is tokenized in one scan and simple points are turned into edges straight from
+        their tokens; includes, functions, closed and mirrored points use the process_* methods.
+        @return: True if the path is closed
+        """
+        last_index = path_str.count(self.POINT_SEPARATOR)
+        last_point = path_str[path_str.rfind(self.POINT_SEPARATOR) + 1:]
+        is_closed = self.CLOSED_PATH_INDICATOR in last_point
+        is_mirrored = self.MIRRORED_PATH_INDICATOR in last_point
+
+        # State variables
+        last_edge = Edge2()
+        last_r = 0.0
+        mirrored_point = -1
+        default_point_names = get_default_point_names(point_name_prefix)
+
+        for index, (point, x, y, curve, radius, names) in enumerate(tokenize_path_points(path_str)):
+            default_point_name = default_point_names[index]
+            edge_d = Edge2(Point2(), Point2(), 0, False, False)
+            first_char = point[:1]
+
+            if first_char == self.INCLUDE_START:
+                if self.process_include_tag(point, path, last_edge, edit_mode):
+                    continue
+
+            elif first_char == self.FUNCTION_CHAR:
+                path_field_functions = PathFieldFunctions()
+                path_field_functions.process(point, path)
+
+            elif is_closed and index == last_index:  # last point of a closed path
+                self.process_closed_point(point, path, last_edge, last_r, edit_mode)
+                break
+
+            elif is_mirrored and index == last_index:
+                self.process_mirrored_points(point, edge_d, path, last_edge, last_r, mirrored_point, edit_mode,
+                                             default_point_name, round_value=round_value)
+                break
+
+            elif x is None or (is_mirrored and first_char == self.MIRRORED_PATH_POINT_INDICATOR):
+                if is_mirrored and first_char == self.MIRRORED_PATH_POINT_INDICATOR:
+                    mirrored_point = path.path_length - 1
+                    point = point[1:]
+                self.process_normal_point(point, edge_d, path, last_edge, last_r,
+                                          edit_mode, default_point_name, round_value=round_value)
+            else:
+                self.process_point_token(x, y, curve, radius, names, edge_d, path, last_edge, last_r,
+                                         edit_mode, default_point_name, round_value)
+
+            if last_edge.is_arc():
+                last_r = last_edge.radius
+            last_edge = path.list_of_edges[-1]
+
+        return is_closed
 
     def process_include_tag(self, tag, path, last_edge, edit_mode):
         function_data = tag.lstrip(self.INCLUDE_START)
@@ -431,69 +735,118 @@ class PathFieldInterpreter(Path2, object):
             return False
 
         if valid:
-            path_string = self.variables.get(variable_name, ';')
-            new_path2 = self.load_path(path_string, point_name_prefix=variable_name + '_')[0]
-            result = new_path2.offset(offset_vector)
-            path += result
+            include_template = self.get_include_template(variable_name)
+            self.join_include_edges(path, include_template.instantiate(offset_vector, edge_type))
             return True
         else:
             path.list_of_edges.append(Edge2(Point2(offset_vector.x, offset_vector.y), Point2()))
             return True
 
+    def get_include_template(self, variable_name):
+        """
+        Returns the compiled include for a variable, compiling it again when the variable,
+        or a variable it includes, has changed since it was last compiled
+        @param variable_name: name of the included variable
+        @return: IncludeTemplate
+        """
+        include_template = self.include_templates.get(variable_name)
+        if include_template is None or not include_template.is_current(self.variables):
+            include_template = IncludeTemplate.compile(self, variable_name)
+            self.include_templates[variable_name] = include_template
+        return include_template
+
+    @staticmethod
+    def join_include_edges(path, include_edges):
+        """
+        Splices included edges into the points of a path. The open last edge of the path runs to the
+        first included point, or is replaced by the first included edge when it starts at the same point,
+        and a new open edge starts at the last included point for the following point to finish.
+        @param path: the path being built
+        @param include_edges: edges from IncludeTemplate.instantiate
+        """
+        if len(include_edges) == 0:
+            return
+
+        list_of_edges = path.list_of_edges
+        first_edge = include_edges[0]
+        if len(list_of_edges) > 0:
+            open_edge = list_of_edges[-1]
+            if open_edge.p1 == first_edge.p1:
+                del list_of_edges[-1]
+                first_edge.p1 = open_edge.p1
+                if first_edge.name == '':
+                    first_edge.name = open_edge.name
+                if first_edge.style == '':
+                    first_edge.style = open_edge.style
+            else:
+                open_edge.p2 = first_edge.p1.clone()
+                open_edge.centre = open_edge.calculate_centre()
+
+        list_of_edges.extend(include_edges)
+        # the open edge is made of the classes of the included edges, which path_field_batch gives as columns
+        last_point = include_edges[-1].p2
+        list_of_edges.append(first_edge.__class__(last_point.clone(), last_point.__class__()))
+
     def process_mirrored_points(self, point, edge_d, path, last_edge, last_r, mirrored_point, edit_mode, default_point_name,
                                 round_value):
+        """
+        Last point of a mirrored path. The mirror axis runs through the first point and the point before the
+        one marked with '*', and the points from the end of the path back to the start are mirrored about it.
+        Each mirrored edge is new and takes the arc of the edge it mirrors, keeping its direction as the
+        mirror and the reversed order cancel out.
+        """
         self.process_normal_point(point[:-1], edge_d, path, last_edge, last_r, edit_mode, default_point_name, round_value)
         if edit_mode:
             # path.list_of_edges.append('mirror')
             return
-        local_path_edges = copy.deepcopy(path.list_of_edges)
-        if (path.list_of_edges[0].p1.y == path.list_of_edges[mirrored_point].p1.y or
-                path.list_of_edges[0].p1.x == path.list_of_edges[mirrored_point].p1.x):
-            held_arc = None
-            if path.list_of_edges[0].p1.x == path.list_of_edges[mirrored_point].p1.x:
-                offset = path.list_of_edges[0].p1.x * 2
-                mirror_x = True
+
+        list_of_edges = path.list_of_edges
+        first_point = list_of_edges[0].p1
+        axis_point = list_of_edges[mirrored_point].p1
+        if first_point.x == axis_point.x:
+            offset = first_point.x * 2
+            mirror_x = True
+        elif first_point.y == axis_point.y:
+            offset = first_point.y * 2
+            mirror_x = False
+        else:
+            return
+        if mirrored_point == -1:
+            return
+
+        # Find the source point the end of the path is the mirror of, the points before it are mirrored
+        end_point = list_of_edges[-1].p1
+        last_source_index = 0
+        for index in range(mirrored_point - 1, -1, -1):
+            source_point = list_of_edges[index].p1
+            if mirror_x:
+                is_end_point = offset - source_point.x == end_point.x and source_point.y == end_point.y
             else:
-                offset = path.list_of_edges[0].p1.y * 2
-                mirror_x = False
-            if mirrored_point != -1:
-                end_point = path.list_of_edges[-1].p1
-                for local_path_edge in reversed(local_path_edges[:mirrored_point]):
-                    mirrored_point -= 1
-                    if (not mirror_x and offset - local_path_edge.p1.y == end_point.y and
-                            local_path_edge.p1.x == end_point.x):
-                        break
-                    elif (mirror_x and local_path_edge.p1.y == end_point.y and
-                          offset - local_path_edge.p1.x == end_point.x):
-                        break
-
-                for local_path_edge in reversed(local_path_edges[:mirrored_point]):
-                    if mirror_x:
-                        edge_d.p1.x = offset - local_path_edge.p1.x
-                        edge_d.p1.y = local_path_edge.p1.y
-                        edge_d.p2.x = offset - local_path_edge.p2.x
-                        edge_d.p2.y = local_path_edge.p2.y
-                    else:
-                        edge_d.p1.x = local_path_edge.p1.x
-                        edge_d.p1.y = offset - local_path_edge.p1.y
-                        edge_d.p2.x = local_path_edge.p2.x
-                        edge_d.p2.y = offset - local_path_edge.p2.y
-                    if is_path3(path):
-                        edge_d.p1.z = local_path_edge.p1.z
-                        edge_d.p2.z = local_path_edge.p2.z
-
-                    if held_arc is not None:
-                        edge_d.radius = held_arc.radius
-                        edge_d.clockwise = held_arc.clockwise
-                        edge_d.large = held_arc.large
-                        held_arc = None
-
-                    if local_path_edge.radius:
-                        held_arc = local_path_edge
-
-                    path.list_of_edges.append(edge_d)
+                is_end_point = source_point.x == end_point.x and offset - source_point.y == end_point.y
+            if is_end_point:
+                last_source_index = index
+                break
+
+        # Each mirrored point ends the open last edge and starts a new one. Only the end of the path changes,
+        # so the source edges are read in place.
+        open_edge = list_of_edges[-1]
+        for index in range(last_source_index - 1, -1, -1):
+            source_edge = list_of_edges[index]
+            if mirror_x:
+                x = offset - source_edge.p1.x
+                y = source_edge.p1.y
             else:
-                return
+                x = source_edge.p1.x
+                y = offset - source_edge.p1.y
+            open_edge.p2 = Point2(x, y)
+            if source_edge.is_arc():
+                open_edge.radius = source_edge.radius
+                open_edge.clockwise = source_edge.clockwise
+                open_edge.large = source_edge.large
+            open_edge.centre = open_edge.calculate_centre()
+
+            open_edge = Edge2(Point2(x, y), Point2(), 0, False, False)
+            list_of_edges.append(open_edge)
 
     def process_closed_point(self, point, path, last_edge, last_r, edit_mode):
         """
@@ -553,14 +906,14 @@ class PathFieldInterpreter(Path2, object):
             parts = edge_def.split(self.LINE_STYLE_INDICATOR)
 
             if parts[0] != '':
-                edge_d.name = parts[0]
+                edge_d.name = intern(parts[0])
 
             if len(parts) > 1 and parts[1] != '':
-                edge_d.style = parts[1]
+                edge_d.style = intern(parts[1])
 
         if len(point) > 0 and point[0] == self.FILL_INDICATOR:
             point = point[1:]
-        path.fill = point
+        path.fill = intern(point)
 
     @staticmethod
     def decode_attributes(path, attributes_str):
@@ -571,8 +924,8 @@ class PathFieldInterpreter(Path2, object):
             if len(attribute) == 1:
                 value = True
             else:
-                value = attribute[1]
-            path.attributes[attribute[0]] = value
+                value = intern(attribute[1])
+            path.attributes[intern(attribute[0])] = value
 
     def join_paths_left_right(self, path_field_left, path_field_right, merge_flip=True, edit_mode=False):
         path_left_list = []
@@ -637,8 +990,7 @@ class PathFieldInterpreter(Path2, object):
         # Now process the curve definition if there is one
         if len(point) == 0:
             edge_d.p1.name = default_point_name
-            path.list_of_edges.append(edge_d)
-            path.make_continuous()
+            path.append_continuous(edge_d)
             return
 
         # Look for a curve definition, it should be terminated either by a comma or be the whole string
@@ -667,33 +1019,64 @@ class PathFieldInterpreter(Path2, object):
         point = point[1:]
 
         if len(point) == 0:
-            path.list_of_edges.append(edge_d)
             edge_d.p1.name = default_point_name
-            path.make_continuous()
+            path.append_continuous(edge_d)
             return
 
         # Look for a point name and edge def if given
         parts = point.split(',')
 
+        self.process_point_names(parts, edge_d, default_point_name)
+
+        path.append_continuous(edge_d)
+
+    def process_point_token(self, x, y, curve, radius, names, edge_d, path, last_edge, last_r, edit_mode,
+                            default_point_name, round_value):
+        """
+        Same as process_normal_point, for a point already split up by tokenize_path_points.
+        """
+        edge_d.p1.x = self.get_value(x, last_edge.p1.x, round_value)
+        edge_d.p1.y = self.get_value(y, last_edge.p1.y, round_value)
+
+        if curve is not None:
+            edge_d.clockwise, edge_d.large = CURVE_FLAGS[curve]
+            if edit_mode:
+                edge_d.radius = radius
+            elif radius == '':
+                edge_d.radius = last_r
+            else:
+                edge_d.radius = float(radius)
+
+        if not names:
+            edge_d.p1.name = default_point_name
+        else:
+            # Look for a point name and edge def if given
+            self.process_point_names(names.split(','), edge_d, default_point_name)
+
+        path.append_continuous(edge_d)
+
+    def process_point_names(self, parts, edge_d, default_point_name):
+        """
+        Sets the point name, edge name and style, and left and right names of a point. The names are interned,
+        so the same name read from many paths is held once.
+        @param parts: the comma separated names after the position and curve of the point
+        """
         if parts[0] != '':
-            edge_d.p1.name = parts[0]
+            edge_d.p1.name = intern(parts[0])
         else:
             edge_d.p1.name = default_point_name
 
         if len(parts) > 1 and self.LINE_STYLE_INDICATOR in parts[1]:
             edge_def = parts[1].split(self.LINE_STYLE_INDICATOR)
             if edge_def[0] != '':
-                edge_d.name = edge_def[0]
-            edge_d.style = edge_def[1]
+                edge_d.name = intern(edge_def[0])
+            edge_d.style = intern(edge_def[1])
         elif len(parts) > 1 and parts[1] != '':
-            edge_d.name = parts[1]
+            edge_d.name = intern(parts[1])
         if len(parts) > 2 and parts[2] != '':
-            edge_d.left_name = parts[2]
+            edge_d.left_name = intern(parts[2])
         if len(parts) > 3 and parts[3] != '':
-            edge_d.right_name = parts[3]
-
-        path.list_of_edges.append(edge_d)
-        path.make_continuous()
+            edge_d.right_name = intern(parts[3])
 
     def get_value(self, in_value, last_value, round_value):
         if in_value == '':
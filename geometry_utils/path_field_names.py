@@ -0,0 +1,53 @@
+import threading
+from collections import OrderedDict
+
+try:
+    from sys import intern
+except ImportError:  # Python 2, where the builtin intern only takes byte strings
+    def intern(string, builtin_intern=intern):
+        if isinstance(string, str):
+            return builtin_intern(string)
+        return string
+
+# The most point name prefixes that keep a table of default point names, the least recently used is dropped first
+MAX_POINT_NAME_PREFIXES = 64
+# The most default point names kept for a prefix, the names of points after them are made each time
+MAX_POINT_NAMES = 1024
+
+
+class DefaultPointNames(dict):
+    """
+    The default point names for one point name prefix, by point index. Each name is made the first time
+    a point needs it and is then shared by the points of every path loaded, rather than each point holding
+    its own copy. Only the names of the first MAX_POINT_NAMES points are kept.
+    """
+
+    def __init__(self, point_name_prefix):
+        super(DefaultPointNames, self).__init__()
+        self.point_name_prefix = point_name_prefix
+
+    def __missing__(self, index):
+        name = intern("%s%d" % (self.point_name_prefix, index))
+        if index < MAX_POINT_NAMES:
+            self[index] = name
+        return name
+
+
+default_point_names_by_prefix = OrderedDict()
+# held while default_point_names_by_prefix is reordered, as the interpreters of every thread share it
+default_point_names_lock = threading.Lock()
+
+
+def get_default_point_names(point_name_prefix):
+    """
+    Returns the shared DefaultPointNames of a point name prefix. The tables of the MAX_POINT_NAME_PREFIXES most
+    recently used prefixes are kept, so a long running process reading prefixes it is given stays bounded.
+    """
+    with default_point_names_lock:
+        default_point_names = default_point_names_by_prefix.pop(point_name_prefix, None)
+        if default_point_names is None:
+            default_point_names = DefaultPointNames(point_name_prefix)
+            while len(default_point_names_by_prefix) >= MAX_POINT_NAME_PREFIXES:
+                default_point_names_by_prefix.popitem(last=False)
+        default_point_names_by_prefix[point_name_prefix] = default_point_names
+    return default_point_names
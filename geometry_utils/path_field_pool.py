@@ -0,0 +1,153 @@
+import multiprocessing
+
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.path2 import Path2, is_path2
+from geometry_utils.two_d.point2 import Point2
+
+# Values stored per edge in a packed path, see pack_path
+EDGE_RECORD_LENGTH = 20
+
+CENTRE_IS_SEPARATE = 0
+CENTRE_IS_P1 = 1
+CENTRE_IS_P2 = 2
+
+
+def pack_path(path):
+    """
+    Flattens a Path2 into a tuple of plain values, which pickles far smaller and faster than the
+    Path2 / Edge2 / Point2 object graph
+
+    :param path: the path to pack
+    :return: (name, type, fill, layers, attributes, closed, edge values)
+    :rtype: tuple
+    """
+    values = []
+    extend = values.extend
+    for edge in path.list_of_edges:
+        p1 = edge.p1
+        p2 = edge.p2
+        centre = edge.centre
+        if centre is p1:
+            centre_type = CENTRE_IS_P1
+        elif centre is p2:
+            centre_type = CENTRE_IS_P2
+        else:
+            centre_type = CENTRE_IS_SEPARATE
+        extend((p1.x, p1.y, p1.w, p1.name, p2.x, p2.y, p2.w, p2.name, centre.x, centre.y, centre.w, centre_type,
+                edge.radius, edge.clockwise, edge.large, edge.name, edge.style, edge.type, edge.left_name,
+                edge.right_name))
+    return path.name, path.type, path.fill, path.layers, path.attributes, path.closed, values
+
+
+def unpack_path(packed_path):
+    """
+    Rebuilds the Path2 flattened by pack_path
+
+    :param packed_path: tuple from pack_path
+    :return: the rebuilt path
+    :rtype: Path2
+    """
+    name, path_type, fill, layers, attributes, closed, values = packed_path
+    path = Path2()
+    path.name = name
+    path.type = path_type
+    path.fill = fill
+    path.layers = layers
+    path.attributes = attributes
+    path.closed = closed
+
+    new_point = Point2.__new__
+    new_edge = Edge2.__new__
+    list_of_edges = path.list_of_edges
+    for index in range(0, len(values), EDGE_RECORD_LENGTH):
+        (p1_x, p1_y, p1_w, p1_name, p2_x, p2_y, p2_w, p2_name, centre_x, centre_y, centre_w, centre_type,
+         radius, clockwise, large, edge_name, style, edge_type, left_name, right_name) = \
+            values[index:index + EDGE_RECORD_LENGTH]
+
+        p1 = new_point(Point2)
+        p1.__dict__ = {'x': p1_x, 'y': p1_y, 'w': p1_w, 'name': p1_name}
+        p2 = new_point(Point2)
+        p2.__dict__ = {'x': p2_x, 'y': p2_y, 'w': p2_w, 'name': p2_name}
+        if centre_type == CENTRE_IS_P1:
+            centre = p1
+        elif centre_type == CENTRE_IS_P2:
+            centre = p2
+        else:
+            centre = new_point(Point2)
+            centre.__dict__ = {'x': centre_x, 'y': centre_y, 'w': centre_w, 'name': ''}
+
+        edge = new_edge(Edge2)
+        edge.__dict__ = {'p1': p1, 'p2': p2, 'radius': radius, 'clockwise': clockwise, 'large': large,
+                         'centre': centre, 'name': edge_name, 'style': style, 'type': edge_type,
+                         'left_name': left_name, 'right_name': right_name}
+        list_of_edges.append(edge)
+    return path
+
+
+def pack_result(result):
+    """
+    Packs a load_path result: a list of Path2s becomes a list, a single Path2 a tuple and None stays None
+    """
+    if result is None:
+        return None
+    if is_path2(result):
+        return pack_path(result)
+    return [pack_path(path) for path in result]
+
+
+def unpack_result(packed_result):
+    if packed_result is None:
+        return None
+    if isinstance(packed_result, tuple):
+        return unpack_path(packed_result)
+    return [unpack_path(packed_path) for packed_path in packed_result]
+
+
+def load_packed_chunk(task):
+    """
+    Process pool worker: parses a chunk of PathFields and returns the packed results
+    """
+    interpreter_class, variables, path_fields, options = task
+    interpreter = interpreter_class()
+    interpreter.variables = variables
+    return [pack_result(interpreter.load_path(path_field, **options)) for path_field in path_fields]
+
+
+def load_paths_many(interpreter, path_fields, workers=None, chunksize=None, pool=None, **options):
+    """
+    Parses a list of PathFields across a process pool, see PathFieldInterpreter.load_paths_many
+
+    :return: one load_path result per PathField, in input order
+    :rtype: list
+    """
+    path_fields = list(path_fields)
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    if chunksize is None:
+        chunksize, extra = divmod(len(path_fields), workers * 4)
+        if extra:
+            chunksize += 1
+    chunksize = max(1, chunksize)
+
+    if pool is None and (workers <= 1 or len(path_fields) <= chunksize):
+        return [interpreter.load_path(path_field, **options) for path_field in path_fields]
+
+    tasks = [(interpreter.__class__, interpreter.variables, path_fields[start:start + chunksize], options)
+             for start in range(0, len(path_fields), chunksize)]
+
+    own_pool = pool is None
+    if own_pool:
+        pool = multiprocessing.Pool(workers)
+    try:
+        results = []
+        for packed_results in pool.imap(load_packed_chunk, tasks):
+            results.extend(unpack_result(packed_result) for packed_result in packed_results)
+    except Exception:
+        if own_pool:
+            pool.terminate()
+        raise
+    if own_pool:
+        pool.close()
+        pool.join()
+    return results
@@ -0,0 +1,186 @@
+from timeit import default_timer
+
+# Phase names and the PathFieldInterpreter methods timed for them
+PHASE_METHODS = (('load', 'load_path'),
+                 ('header', 'process_path_header'),
+                 ('attributes', 'decode_attributes'),
+                 ('special_shapes', 'process_special_shapes'),
+                 ('points', 'process_path_points'),
+                 ('includes', 'process_include_tag'),
+                 ('mirror', 'process_mirrored_points'),
+                 ('closed', 'process_closed_point'),
+                 ('finish', 'finish_path'))
+
+
+class PathFieldLoadStats(object):
+    """
+    The timings and size of one PathFieldInterpreter.load_path call
+
+    Attributes:
+    ___________
+    seconds: float
+        the wall time of the call
+    phase_seconds: dict
+        the wall time of each phase, excluding the phases it called, so they add up to seconds
+    phase_calls: dict
+        the number of calls of each phase
+    paths: int
+        the number of paths loaded
+    points: int
+        the number of points in the path strings
+    arcs: int
+        the number of arc edges created
+    includes: int
+        the number of include points
+    """
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.phase_seconds = {}
+        self.phase_calls = {}
+        self.paths = 0
+        self.points = 0
+        self.arcs = 0
+        self.includes = 0
+
+
+class PathFieldStats(PathFieldLoadStats):
+    """
+    Opt-in timing of the phases of PathFieldInterpreter.load_path. The timed methods are wrapped on the
+    instrumented interpreters only, so interpreters without stats run unchanged. Phases called by another
+    phase, such as the points of an include, are timed separately. Sizes are counted for the PathField being
+    loaded and not for the variables it includes.
+
+    Attributes:
+    ___________
+    The totals of PathFieldLoadStats over every load_path call, and:
+    loads: int
+        the number of load_path calls
+    last_load: PathFieldLoadStats
+        the stats of the last load_path call
+    callback: function
+        optional function called with the PathFieldLoadStats of each load_path call
+
+    Methods:
+    ________
+    instrument(PathFieldInterpreter):
+        Starts timing the phases of an interpreter
+    remove(PathFieldInterpreter):
+        Stops timing the phases of an interpreter
+    reset():
+        Clears the totals
+    summary(): str
+        Returns a table of the time and number of calls of each phase
+    """
+
+    def __init__(self, callback=None):
+        super(PathFieldStats, self).__init__()
+        self.loads = 0
+        self.last_load = None
+        self.callback = callback
+        self.current_load = None
+        self.include_depth = 0
+        self.timer_stack = []
+
+    def reset(self):
+        self.seconds = 0.0
+        self.phase_seconds = {}
+        self.phase_calls = {}
+        self.paths = 0
+        self.points = 0
+        self.arcs = 0
+        self.includes = 0
+        self.loads = 0
+        self.last_load = None
+
+    def instrument(self, path_field_interpreter):
+        for phase, method_name in PHASE_METHODS:
+            method = getattr(path_field_interpreter, method_name)
+            setattr(path_field_interpreter, method_name, self.timed(phase, method))
+        path_field_interpreter.stats = self
+
+    @staticmethod
+    def remove(path_field_interpreter):
+        for _, method_name in PHASE_METHODS:
+            path_field_interpreter.__dict__.pop(method_name, None)
+        path_field_interpreter.stats = None
+
+    def timed(self, phase, method):
+        """
+        Wraps a method to time it as a phase and to count the sizes it handles
+        """
+        timer_stack = self.timer_stack
+
+        def timed_method(*args, **kwargs):
+            is_load = phase == 'load' and self.current_load is None
+            if is_load:
+                self.current_load = PathFieldLoadStats()
+            elif phase == 'includes':
+                self.include_depth += 1
+            timer_stack.append(0.0)
+            start = default_timer()
+            completed = False
+            try:
+                result = method(*args, **kwargs)
+                completed = True
+            finally:
+                seconds = default_timer() - start
+                called_seconds = timer_stack.pop()
+                if timer_stack:
+                    timer_stack[-1] += seconds
+                if phase == 'includes':
+                    self.include_depth -= 1
+                self.add_phase(phase, seconds - called_seconds)
+                if is_load:
+                    load_stats = self.current_load
+                    self.current_load = None
+                    if completed:
+                        load_stats.seconds = seconds
+                        self.add_load(load_stats)
+            if self.include_depth == 0 and self.current_load is not None:
+                self.count(phase, args, result)
+            return result
+
+        return timed_method
+
+    def add_phase(self, phase, seconds):
+        for stats in (self, self.current_load):
+            if stats is not None:
+                stats.phase_seconds[phase] = stats.phase_seconds.get(phase, 0.0) + seconds
+                stats.phase_calls[phase] = stats.phase_calls.get(phase, 0) + 1
+
+    def count(self, phase, args, result):
+        """
+        Counts the sizes handled by a phase of the load_path call in progress
+        """
+        load_stats = self.current_load
+        if phase == 'points':
+            path_str, path = args[0], args[1]
+            load_stats.points += path_str.count(';') + 1
+            load_stats.arcs += sum(1 for edge in path.list_of_edges if edge.is_arc())
+        elif phase == 'finish':
+            load_stats.paths += 1
+        elif phase == 'special_shapes':
+            load_stats.paths += len(result)
+            for path in result:
+                load_stats.arcs += sum(1 for edge in path.list_of_edges if edge.is_arc())
+        elif phase == 'includes':
+            load_stats.includes += 1
+
+    def add_load(self, load_stats):
+        self.loads += 1
+        self.seconds += load_stats.seconds
+        self.paths += load_stats.paths
+        self.points += load_stats.points
+        self.arcs += load_stats.arcs
+        self.includes += load_stats.includes
+        self.last_load = load_stats
+        if self.callback is not None:
+            self.callback(load_stats)
+
+    def summary(self):
+        lines = ['%d loads, %d paths, %d points, %d arcs, %d includes, %.3f ms' %
+                 (self.loads, self.paths, self.points, self.arcs, self.includes, self.seconds * 1000)]
+        for phase, seconds in sorted(self.phase_seconds.items(), key=lambda item: -item[1]):
+            lines.append('%-16s %10.3f ms %8d calls' % (phase, seconds * 1000, self.phase_calls[phase]))
+        return '\n'.join(lines)
@@ -0,0 +1,397 @@
+import re
+
+from geometry_utils.path_field_validator import (CLOSED_PATH_INDICATOR, FUNCTION_CHAR, INCLUDE_START,
+                                                 MIRRORED_PATH_INDICATOR, SPECIAL_SHAPES, PathFieldSyntaxError,
+                                                 scan_header)
+
+# A whole plain point, with the same grammar as the point tokens of PathFieldInterpreter
+PLAIN_POINT_REGEX = re.compile(r'(?P<x>[^;:(){},]*)(?::(?P<y>[^;:(){},]*)(?::(?P<z>[^;(){},]*))?)?'
+                               r'(?:(?P<curve>[(){}])(?P<radius>[^;(){},]*))?'
+                               r'(?:,(?P<names>[^;(){}]*))?\Z')
+
+CURVE_CHARS = '(){}'
+MIRRORED_PATH_POINT_INDICATOR = '*'
+
+
+class SyntaxNode(object):
+    """
+    One point of a path in a PathFieldSyntaxTree. start and end are the position of the point in the PathField
+    that was parsed, they are not moved when nodes are changed. Each kind of node has a to_text method
+    returning the point as it is written in a PathField.
+    """
+    __slots__ = ('start', 'end')
+
+
+class PointNode(SyntaxNode):
+    """
+    A point with its position, curve and names, eg: '~10:20(5,p1,top%dash'
+
+    Attributes:
+    ___________
+    x: str
+        x as written, which may be relative, '' when it is the x of the last point
+    y: str or None
+        y as written, None when the point has no ':'
+    z: str or None
+        z as written, None when the point has no z
+    curve: str or None
+        the curve character of an arc, one of '(){}'
+    radius: str
+        the radius of an arc as written, '' when it is the last radius
+    names: list or None
+        the point name, edge name and style, left name and right name, None when the point has no names
+    mirror_axis: bool
+        True for the point after the mirror axis of a mirrored path, written with a leading '*'
+    mirror_end: bool
+        True for the last point of a mirrored path, written with a trailing '^'
+    """
+    __slots__ = ('x', 'y', 'z', 'curve', 'radius', 'names', 'mirror_axis', 'mirror_end')
+
+    def to_text(self):
+        out = ['*' if self.mirror_axis else '', self.x]
+        if self.y is not None:
+            out.append(':' + self.y)
+            if self.z is not None:
+                out.append(':' + self.z)
+        if self.curve is not None:
+            out.append(self.curve + self.radius)
+        if self.names is not None:
+            out.append(',' + ','.join(self.names))
+        if self.mirror_end:
+            out.append(MIRRORED_PATH_INDICATOR)
+        return ''.join(out)
+
+
+class IncludeNode(SyntaxNode):
+    """
+    An include of a variable, eg: '?hinge,pm,0,100?1'
+
+    Attributes:
+    ___________
+    marks: int
+        the number of '?' the include starts with
+    arguments: list
+        the variable name, edge type, x and y offsets as written
+    condition: str or None
+        the condition after the second '?', None when there is none
+    """
+    __slots__ = ('marks', 'arguments', 'condition')
+
+    def to_text(self):
+        text = INCLUDE_START * self.marks + ','.join(self.arguments)
+        if self.condition is not None:
+            text += INCLUDE_START + self.condition
+        return text
+
+
+class FunctionNode(SyntaxNode):
+    """
+    A function such as a swept top rail, eg: '!STR,,50,400'
+
+    Attributes:
+    ___________
+    arguments: list
+        the function name and its arguments as written
+    """
+    __slots__ = ('arguments',)
+
+    def to_text(self):
+        return FUNCTION_CHAR + ','.join(self.arguments)
+
+
+class ShapeNode(SyntaxNode):
+    """
+    A special shape, eg: '_rect,100,50'
+
+    Attributes:
+    ___________
+    arguments: list
+        the shape name and its arguments as written
+    """
+    __slots__ = ('arguments',)
+
+    def to_text(self):
+        return SPECIAL_SHAPES + ','.join(self.arguments)
+
+
+class ClosedNode(SyntaxNode):
+    """
+    The closing point of a closed path, eg: '#(5,left%dash#oak'
+
+    Attributes:
+    ___________
+    curve: str or None
+        the curve character of the closing edge, one of '(){}'
+    radius: str
+        the radius of the closing edge as written
+    edge: str or None
+        the name and style of the closing edge, None when they are not given
+    fill: str or None
+        the fill of the path, None when it is not given
+    fill_indicator: bool
+        True when the fill is written after a '#', which it has to be after an edge name
+    """
+    __slots__ = ('curve', 'radius', 'edge', 'fill', 'fill_indicator')
+
+    def to_text(self):
+        text = CLOSED_PATH_INDICATOR
+        if self.curve is not None:
+            text += self.curve + self.radius
+        if self.edge is not None:
+            text += ',' + self.edge
+        if self.fill is not None:
+            text += (CLOSED_PATH_INDICATOR if self.fill_indicator else '') + self.fill
+        return text
+
+
+class TextNode(SyntaxNode):
+    """
+    A point the syntax tree does not split up, kept as it is written
+
+    Attributes:
+    ___________
+    text: str
+        the point
+    """
+    __slots__ = ('text',)
+
+    def to_text(self):
+        return self.text
+
+
+def parse_plain_point(point, mirror_axis=False, mirror_end=False):
+    """
+    Returns the PointNode of a plain point, or None if it does not fit the plain point grammar
+    """
+    match = PLAIN_POINT_REGEX.match(point)
+    if match is None:
+        return None
+    x, y, z, curve, radius, names = match.groups()
+    node = PointNode()
+    node.x = x
+    node.y = y
+    node.z = z
+    node.curve = curve
+    node.radius = radius
+    node.names = None if names is None else names.split(',')
+    node.mirror_axis = mirror_axis
+    node.mirror_end = mirror_end
+    return node
+
+
+def parse_include(point):
+    node = IncludeNode()
+    function_data = point.lstrip(INCLUDE_START)
+    node.marks = len(point) - len(function_data)
+    main_include_data = function_data.split(INCLUDE_START, 1)
+    node.arguments = main_include_data[0].split(',')
+    node.condition = main_include_data[1] if len(main_include_data) > 1 else None
+    return node
+
+
+def parse_closed_point(point):
+    node = ClosedNode()
+    node.curve = None
+    node.radius = ''
+    node.edge = None
+    node.fill = None
+    node.fill_indicator = False
+    rest = point[1:]
+    if rest and rest[0] in CURVE_CHARS:
+        index = rest.find(',')
+        if index == -1:
+            index = len(rest)
+        node.curve = rest[0]
+        node.radius = rest[1:index]
+        rest = rest[index:]
+    if rest[:1] == ',':
+        index = rest.find(CLOSED_PATH_INDICATOR)
+        if index == -1:
+            index = len(rest)
+        node.edge = rest[1:index]
+        rest = rest[index:]
+    if rest[:1] == CLOSED_PATH_INDICATOR:
+        node.fill = rest[1:]
+        node.fill_indicator = True
+    elif rest:
+        node.fill = rest
+    return node
+
+
+def parse_point(point, is_first, is_last, is_closed, is_mirrored):
+    """
+    Returns the syntax node of a point, following how PathFieldInterpreter.process_path_points reads it.
+    A point whose node would not write it back exactly as it is written, such as a closing point with text
+    before the '#', is kept as a TextNode.
+    """
+    first_char = point[:1]
+    node = None
+    if first_char == INCLUDE_START:
+        node = parse_include(point)
+    elif first_char == FUNCTION_CHAR:
+        node = FunctionNode()
+        node.arguments = point[1:].split(',')
+    elif is_first and first_char == SPECIAL_SHAPES:
+        node = ShapeNode()
+        node.arguments = point[1:].split(',')
+    elif is_closed and is_last:
+        if first_char == CLOSED_PATH_INDICATOR:
+            node = parse_closed_point(point)
+    elif is_mirrored and is_last:
+        if point.endswith(MIRRORED_PATH_INDICATOR):
+            node = parse_plain_point(point[:-1], mirror_end=True)
+    elif is_mirrored and first_char == MIRRORED_PATH_POINT_INDICATOR:
+        node = parse_plain_point(point[1:], mirror_axis=True)
+    else:
+        node = parse_plain_point(point)
+
+    if node is None or node.to_text() != point:
+        node = TextNode()
+        node.text = point
+    return node
+
+
+class PathNode(object):
+    """
+    One path string of a PathFieldSyntaxTree
+
+    Attributes:
+    ___________
+    start: int
+        position of the path string in the PathField
+    end: int
+        position of the end of the path string in the PathField
+    header: PathFieldHeader or None
+        the name, type, layers and attributes of the path, None when the header can not be read
+    header_text: str
+        the header as written, the whole path string when the header can not be read
+    points: list
+        a syntax node for each point, an empty path string has none
+    is_closed: bool
+        True when the path ends with a closing point
+    is_mirrored: bool
+        True when the path ends with a mirrored point
+
+    Methods:
+    ________
+    to_text(): str
+        Returns the path string
+    """
+    __slots__ = ('start', 'end', 'header', 'header_text', 'points', 'is_closed', 'is_mirrored', 'geometry')
+
+    def __init__(self, path_str, start, override_data=None):
+        self.start = start
+        self.end = start + len(path_str)
+        self.header = None
+        self.header_text = path_str
+        self.points = []
+        self.is_closed = False
+        self.is_mirrored = False
+        # the text and paths of the last built geometry
+        self.geometry = None
+        if not path_str:
+            return
+
+        try:
+            self.header, position = scan_header(path_str, start, override_data)
+        except PathFieldSyntaxError:
+            return
+        self.header_text = path_str[:position]
+        point_strings = path_str[position:].split(';')
+
+        # the closed and mirrored markers of a special shape are read from the points after it
+        last_point = point_strings[-1]
+        if len(point_strings) > 1 or not last_point.startswith(SPECIAL_SHAPES):
+            self.is_closed = CLOSED_PATH_INDICATOR in last_point
+            self.is_mirrored = MIRRORED_PATH_INDICATOR in last_point
+
+        last_index = len(point_strings) - 1
+        point_start = start + position
+        points = self.points
+        for index, point in enumerate(point_strings):
+            node = parse_point(point, index == 0, index == last_index, self.is_closed, self.is_mirrored)
+            node.start = point_start
+            point_start += len(point)
+            node.end = point_start
+            point_start += 1
+            points.append(node)
+
+    @property
+    def name(self):
+        return '' if self.header is None else self.header.name
+
+    def to_text(self):
+        return self.header_text + ';'.join([node.to_text() for node in self.points])
+
+
+class PathFieldSyntaxTree(object):
+    """
+    A PathField read into paths and points without building any geometry, for the shape editor. Each point
+    keeps its values as they are written and its position in the PathField, and the tree writes back the
+    PathField it was read from. The geometry of a path is built by the interpreter when it is asked for,
+    and built again only once the path has been changed.
+
+    Attributes:
+    ___________
+    path_field: str
+        the PathField that was read
+    paths: list
+        a PathNode for each path string, including empty ones
+    interpreter: PathFieldInterpreter
+        the interpreter that builds the geometry
+    load_options: dict
+        the load_path options the geometry is built with
+
+    Methods:
+    ________
+    to_text(): str
+        Returns the PathField of the tree
+    get_paths(int): list
+        Returns the geometry of a path string
+    """
+
+    def __init__(self, path_field, interpreter, override_data=None, **load_options):
+        self.path_field = path_field
+        self.interpreter = interpreter
+        self.load_options = load_options
+        self.load_options['override_data'] = override_data
+        self.paths = []
+        start = 0
+        for path_str in path_field.split('|'):
+            self.paths.append(PathNode(path_str, start, override_data))
+            start += len(path_str) + 1
+
+    def __len__(self):
+        return len(self.paths)
+
+    def to_text(self):
+        return '|'.join([path.to_text() for path in self.paths])
+
+    def get_paths(self, index):
+        """
+        Returns the paths load_path builds from a path string, which are built the first time they are asked
+        for and after the path string has been changed
+
+        :param index: the index of the path string in paths
+        :return: list of Path2, empty for an empty path string
+        :rtype: list
+        """
+        path_node = self.paths[index]
+        text = path_node.to_text()
+        if path_node.geometry is None or path_node.geometry[0] != text:
+            paths = self.interpreter.load_path(text, **self.load_options) if text else []
+            path_node.geometry = (text, paths)
+        return path_node.geometry[1]
+
+
+def parse_syntax_tree(path_field, interpreter, override_data=None, **load_options):
+    """
+    Reads a PathField into a PathFieldSyntaxTree
+
+    :param path_field: PathField string
+    :param interpreter: the PathFieldInterpreter that builds the geometry of the paths
+    :param override_data: renames applied to the path names as load_path applies them
+    :return: the syntax tree
+    :rtype: PathFieldSyntaxTree
+    """
+    return PathFieldSyntaxTree(path_field, interpreter, override_data, **load_options)
@@ -0,0 +1,459 @@
+import keyword
+import re
+
+from geometry_utils.path_field_interpreter import CURVE_FLAGS, PathFieldInterpreter, tokenize_path_points
+from geometry_utils.path_field_names import get_default_point_names, intern
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.path2 import Path2
+from geometry_utils.two_d.point2 import Point2
+from geometry_utils.two_d.vector2 import Vector2
+
+# An expression is numbers and variable names joined by + - * /, PathField curve characters rule out brackets
+EXPRESSION_TOKEN_REGEX = re.compile(r'\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)|'
+                                    r'(?P<name>[A-Za-z_]\w*)|'
+                                    r'(?P<operator>[-+*/]))\s*')
+
+# The functions and names the evaluate function of a template is compiled with. Numbers are written with repr,
+# which gives inf and nan for the values float() reads from them.
+TEMPLATE_FUNCTIONS = {'round': round, 'float': float, 'inf': float('inf'), 'nan': float('nan')}
+
+# Operations of a path plan
+POINT = 0
+INCLUDE = 1
+CLOSED = 2
+
+
+def compile_expression(text):
+    """
+    Translates a PathField expression into Python source that reads its variables from locals named v_<name>
+
+    :param text: expression, eg: 'W-20'
+    :return: the Python source and the variable names
+    :rtype: tuple
+    :raises: ValueError: the text is not an expression
+    """
+    source = []
+    names = set()
+    position = 0
+    while position < len(text):
+        token = EXPRESSION_TOKEN_REGEX.match(text, position)
+        if token is None or token.end() == position:
+            raise ValueError('Invalid PathField template expression %r' % text)
+        number, name, operator = token.group('number', 'name', 'operator')
+        if number is not None:
+            source.append(repr(float(number)))
+        elif name is not None:
+            if keyword.iskeyword(name):
+                raise ValueError('Invalid PathField template variable %r' % name)
+            names.add(name)
+            source.append('v_' + name)
+        else:
+            source.append(operator)
+        position = token.end()
+    source = ' '.join(source)
+    try:
+        compile(source, '<PathField template>', 'eval')
+    except SyntaxError:
+        raise ValueError('Invalid PathField template expression %r' % text)
+    return source, names
+
+
+def compile_evaluator(source, functions):
+    """
+    Compiles the evaluate function of a template
+
+    :param source: the source of the function
+    :param functions: the round and float functions and the inf and nan values it uses
+    :return: function of the bindings returning a tuple of every value of the template
+    :rtype: function
+    """
+    namespace = {}
+    exec(compile(source, '<PathField template>', 'exec'), dict(functions), namespace)
+    return namespace['evaluate']
+
+
+class PathBuilder(object):
+    """
+    Creates the points and edges of template paths for PathFieldTemplate.build_path, which joins them as the parser
+    does. path_field_batch builds the paths of a group of bindings at once with its ColumnPathBuilder.
+    """
+
+    @staticmethod
+    def round(value, round_value):
+        return round(value, round_value)
+
+    @staticmethod
+    def decide(condition):
+        """
+        :return: the branch taken for a condition
+        :rtype: bool
+        """
+        return condition
+
+    @staticmethod
+    def new_point(x, y, name):
+        point = Point2.__new__(Point2)
+        point.__dict__ = {'x': x, 'y': y, 'w': 1, 'name': name}
+        return point
+
+    def new_edge(self, p1, radius, clockwise, large, edge_names):
+        """
+        Creates the edge of a point, ending at the origin until the next point joins it, with its centre at p1
+        """
+        edge_name, style, left_name, right_name = edge_names
+        edge = Edge2.__new__(Edge2)
+        edge.__dict__ = {'p1': p1, 'p2': self.new_point(0.0, 0.0, ''), 'radius': radius, 'clockwise': clockwise,
+                         'large': large, 'centre': p1, 'name': edge_name, 'style': style, 'type': '',
+                         'left_name': left_name, 'right_name': right_name}
+        return edge
+
+    @staticmethod
+    def new_open_edge(x, y):
+        """
+        Creates the edge left by an include whose condition is not met, as process_include_tag does
+        """
+        return Edge2(Point2(x, y), Point2())
+
+    @staticmethod
+    def include(include_template, offset_x, offset_y, include_type):
+        return include_template.instantiate(Vector2(offset_x, offset_y), include_type)
+
+
+class PathFieldTemplate:
+    """
+    A PathField whose coordinates, radii and include offsets and conditions may be expressions of variables,
+    eg: ';W;W:H)R;0:H-20;#', parsed once and then instantiated for any values of the variables.
+    instantiate gives the paths load_path would give for the PathField with the values written in place
+    of the expressions, without parsing it again. An include condition
+    is met when its expression is not 0.
+    Mirrored paths, functions and special shapes can not be compiled.
+
+    Attributes:
+    ___________
+    path_field: str
+        the PathField the template was compiled from
+    variable_names: list
+        the names of the variables used, sorted
+    round_value: int
+        the number of decimal places coordinates are rounded to
+    paths: list
+        the header values and operations of each path
+    source: str
+        the source of evaluate
+
+    Methods:
+    ________
+    evaluate(dict): tuple
+        Returns the value of every expression of the template
+    instantiate(dict): list
+        Returns new Path2s for the values of the variables
+    build_path(tuple, tuple, PathBuilder): Path2
+        Builds one path from the values of the template
+    """
+
+    def __init__(self, path_field, path_field_interpreter=None, override_data=None, point_name_prefix='',
+                 round_value=2):
+        if path_field_interpreter is None:
+            path_field_interpreter = PathFieldInterpreter()
+        if override_data is None:
+            override_data = {}
+        self.path_field = path_field
+        self.round_value = round_value
+        self.paths = []
+        self.sources = []
+        self.names = set()
+
+        for path_str in path_field.split(path_field_interpreter.NEW_PATH_CHAR):
+            if path_str:
+                self.paths.append(self.compile_path(path_field_interpreter, path_str, override_data,
+                                                    point_name_prefix))
+
+        self.variable_names = sorted(self.names)
+        lines = ['def evaluate(bindings):']
+        for name in self.variable_names:
+            lines.append('    v_%s = bindings[%r]' % (name, name))
+        lines.append('    return (%s,)' % ', '.join(self.sources) if self.sources else '    return ()')
+        self.source = '\n'.join(lines)
+        self.evaluate = compile_evaluator(self.source, TEMPLATE_FUNCTIONS)
+        del self.sources, self.names
+
+    def add_value(self, text, rounded):
+        """
+        Adds a number or an expression to the values evaluated on instantiation
+
+        :param text: the number or expression
+        :param rounded: True to round the value to round_value places, as absolute coordinates are
+        :return: the index of the value
+        :rtype: int
+        """
+        try:
+            value = float(text)
+            source = repr(round(value, self.round_value) if rounded else value)
+        except ValueError:
+            source, names = compile_expression(text)
+            self.names.update(names)
+            if rounded:
+                source = 'round(float(%s), %d)' % (source, self.round_value)
+            else:
+                source = 'float(%s)' % source
+        self.sources.append(source)
+        return len(self.sources) - 1
+
+    def add_coordinate(self, text, relative_char):
+        """
+        :return: None for a coordinate taken from the last point, or whether it is relative and its value index
+        """
+        if text == '':
+            return None
+        if text.startswith(relative_char):
+            return True, self.add_value(text[1:], False)
+        return False, self.add_value(text, True)
+
+    def compile_path(self, path_field_interpreter, path_str, override_data, point_name_prefix):
+        header = Path2()
+        path_str = path_field_interpreter.process_path_header(path_str, header, override_data)
+        if path_str.startswith(path_field_interpreter.SPECIAL_SHAPES):
+            raise ValueError('Special shapes can not be compiled into a PathField template')
+
+        last_index = path_str.count(path_field_interpreter.POINT_SEPARATOR)
+        last_point = path_str[path_str.rfind(path_field_interpreter.POINT_SEPARATOR) + 1:]
+        is_closed = path_field_interpreter.CLOSED_PATH_INDICATOR in last_point
+        if path_field_interpreter.MIRRORED_PATH_INDICATOR in last_point:
+            raise ValueError('Mirrored paths can not be compiled into a PathField template')
+
+        relative_char = path_field_interpreter.RELATIVE_CHAR
+        default_point_names = get_default_point_names(point_name_prefix)
+        operations = []
+        for index, (point, x, y, curve, radius, names) in enumerate(tokenize_path_points(path_str)):
+            first_char = point[:1]
+            if first_char == path_field_interpreter.INCLUDE_START:
+                operations.append(self.compile_include(path_field_interpreter, point))
+
+            elif first_char == path_field_interpreter.FUNCTION_CHAR:
+                raise ValueError('Functions can not be compiled into a PathField template')
+
+            elif is_closed and index == last_index:
+                if index == 0:
+                    raise ValueError('A closed path needs a point before the closing point')
+                operations.append(self.compile_closed_point(point))
+                break
+
+            elif x is None:
+                raise ValueError('Point %r can not be compiled into a PathField template' % point)
+
+            else:
+                if curve is None:
+                    arc = None
+                else:
+                    clockwise, large = CURVE_FLAGS[curve]
+                    arc = (clockwise, large, None if radius == '' else self.add_value(radius, False))
+
+                point_name = default_point_names[index]
+                edge_names = ('', '', '', '')
+                if names:
+                    parts = names.split(',')
+                    if parts[0] != '':
+                        point_name = intern(parts[0])
+                    edge_names = self.compile_edge_names(path_field_interpreter, parts)
+
+                operations.append((POINT, self.add_coordinate(x, relative_char), self.add_coordinate(y, relative_char),
+                                   arc, point_name, edge_names))
+
+        return header.name, header.type, header.layers, header.attributes, is_closed, operations
+
+    @staticmethod
+    def compile_edge_names(path_field_interpreter, parts):
+        """
+        :return: the edge name, style, left name and right name of a point, as process_point_names sets them
+        """
+        name = style = left_name = right_name = ''
+        if len(parts) > 1 and path_field_interpreter.LINE_STYLE_INDICATOR in parts[1]:
+            edge_def = parts[1].split(path_field_interpreter.LINE_STYLE_INDICATOR)
+            name = intern(edge_def[0])
+            style = intern(edge_def[1])
+        elif len(parts) > 1:
+            name = intern(parts[1])
+        if len(parts) > 2:
+            left_name = intern(parts[2])
+        if len(parts) > 3:
+            right_name = intern(parts[3])
+        return name, style, left_name, right_name
+
+    def compile_include(self, path_field_interpreter, point):
+        """
+        Compiles an include in the same way as process_include_tag reads it, the included variable is compiled
+        from the variables of the interpreter
+        """
+        main_include_data = point.lstrip(path_field_interpreter.INCLUDE_START).split(
+            path_field_interpreter.INCLUDE_CONDITION_DELIMITER)
+        condition = True
+        if len(main_include_data) > 1 and main_include_data[1] != '':
+            try:
+                condition = bool(int(main_include_data[1]))
+            except ValueError:
+                try:
+                    float(main_include_data[1])
+                except ValueError:
+                    condition = self.add_value(main_include_data[1], False)
+
+        include_data = main_include_data[0].split(path_field_interpreter.INCLUDE_DELIMITER)
+        edge_type = 'pp'
+        if len(include_data) > 1 and include_data[1] != '':
+            edge_type = include_data[1]
+        offset_x = offset_y = None
+        if len(include_data) > 2 and include_data[2] != '':
+            offset_x = self.add_value(include_data[2], False)
+        if len(include_data) > 3 and include_data[3] != '':
+            offset_y = self.add_value(include_data[3], False)
+
+        include_template = path_field_interpreter.get_include_template(include_data[0])
+        return INCLUDE, include_template, edge_type, offset_x, offset_y, condition
+
+    def compile_closed_point(self, point):
+        """
+        Compiles the closing point in the same way as process_closed_point reads it
+        """
+        arc = None
+        name = style = None
+        fill = None
+        point = point[1:]
+        if point != '':
+            if point[0] in CURVE_FLAGS:
+                index = point.find(',')
+                if index == -1:
+                    curve_def = point
+                    point = ''
+                else:
+                    curve_def = point[:index]
+                    point = point[index + 1:]
+                clockwise, large = CURVE_FLAGS[curve_def[0]]
+                arc = (clockwise, large, None if len(curve_def) == 1 else self.add_value(curve_def[1:], False))
+
+            if point != '':
+                if point[0] == ',':
+                    point = point[1:]
+                    index = point.find('#')
+                    if index == -1:
+                        edge_def = point
+                        point = ''
+                    else:
+                        edge_def = point[:index]
+                        point = point[index + 1:]
+                    parts = edge_def.split('%')
+                    if parts[0] != '':
+                        name = intern(parts[0])
+                    if len(parts) > 1 and parts[1] != '':
+                        style = intern(parts[1])
+
+                if len(point) > 0 and point[0] == '#':
+                    point = point[1:]
+                fill = intern(point)
+        return CLOSED, arc, name, style, fill
+
+    def instantiate(self, bindings):
+        """
+        Creates the paths of the template for values of its variables
+
+        :param bindings: dict of the value of each variable
+        :return: list of new Path2s
+        :rtype: list
+        :raises: KeyError: a variable has no value
+        """
+        values = self.evaluate(bindings)
+        builder = PathBuilder()
+        return [self.build_path(path_plan, values, builder) for path_plan in self.paths]
+
+    def build_path(self, path_plan, values, builder):
+        """
+        Follows the operations of a path as the parser follows its points, joining each edge with
+        Path2.append_continuous and each include with PathFieldInterpreter.join_include_edges
+
+        :param path_plan: the header values and operations of the path
+        :param values: the values of the template
+        :param builder: PathBuilder creating the points and edges
+        :return: the path
+        :rtype: Path2
+        """
+        name, path_type, layers, attributes, is_closed, operations = path_plan
+        round_value = self.round_value
+        list_of_edges = []
+        path = Path2.__new__(Path2)
+        path.__dict__ = {'list_of_edges': list_of_edges, 'fill': '', 'name': name, 'type': path_type,
+                         'layers': list(layers), 'closed': None, 'attributes': dict(attributes)}
+
+        # the edge of the last point, which includes leave in place, and its position
+        last_edge = None
+        last_x = last_y = 0.0
+        last_r = 0.0
+        for operation in operations:
+            kind = operation[0]
+            if kind == POINT:
+                _, x, y, arc, point_name, edge_names = operation
+                if x is None:
+                    x = last_x
+                elif x[0]:
+                    x = builder.round(values[x[1]] + last_x, round_value)
+                else:
+                    x = values[x[1]]
+                if y is None:
+                    y = last_y
+                elif y[0]:
+                    y = builder.round(values[y[1]] + last_y, round_value)
+                else:
+                    y = values[y[1]]
+
+                if arc is None:
+                    radius = 0
+                    clockwise = large = False
+                else:
+                    clockwise, large, radius = arc
+                    radius = last_r if radius is None else values[radius]
+                edge = builder.new_edge(builder.new_point(x, y, point_name), radius, clockwise, large, edge_names)
+                path.append_continuous(edge)
+
+                if last_edge is not None and last_edge.is_arc():
+                    last_r = last_edge.radius
+                last_edge = edge
+                last_x = x
+                last_y = y
+
+            elif kind == INCLUDE:
+                _, include_template, include_type, offset_x, offset_y, condition = operation
+                offset_x = last_x if offset_x is None else values[offset_x]
+                offset_y = last_y if offset_y is None else values[offset_y]
+                if condition is True or condition is not False and builder.decide(values[condition] != 0):
+                    PathFieldInterpreter.join_include_edges(path, builder.include(include_template, offset_x,
+                                                                                  offset_y, include_type))
+                else:
+                    list_of_edges.append(builder.new_open_edge(offset_x, offset_y))
+
+            else:
+                _, arc, edge_name, style, fill = operation
+                closing_edge = list_of_edges[-1]
+                closing_edge.p2 = list_of_edges[0].p1.clone()
+                if arc is not None:
+                    closing_edge.clockwise, closing_edge.large, radius = arc
+                    closing_edge.radius = last_r if radius is None else values[radius]
+                if edge_name is not None:
+                    closing_edge.name = edge_name
+                if style is not None:
+                    closing_edge.style = style
+                if fill is not None:
+                    path.fill = fill
+
+        PathFieldInterpreter.finish_path(path, is_closed)
+        return path
+
+
+def compile_template(path_field, path_field_interpreter=None, override_data=None, point_name_prefix='',
+                     round_value=2):
+    """
+    Parses a parametric PathField once, see PathFieldTemplate
+
+    :param path_field: PathField string with expressions of variables in place of numbers
+    :param path_field_interpreter: interpreter holding the variables of includes
+    :return: the compiled template
+    :rtype: PathFieldTemplate
+    :raises: ValueError: the PathField can not be compiled
+    """
+    return PathFieldTemplate(path_field, path_field_interpreter, override_data, point_name_prefix, round_value)
@@ -0,0 +1,225 @@
+import re
+from collections import namedtuple
+
+# Header of one path of a PathField. start and end are the position of the path string in the PathField.
+PathFieldHeader = namedtuple('PathFieldHeader', ['name', 'type', 'layers', 'attributes', 'start', 'end'])
+
+# The point grammar accepted by PathFieldInterpreter.load_path. A number is anything float() reads apart
+# from nan and inf, a coordinate is empty, a number or a relative number, and z is ignored by the parser.
+NUMBER = r'\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*'
+COORDINATE = r'(?:~?' + NUMBER + r')?'
+PLAIN_POINT = (COORDINATE + r'(?::' + COORDINATE + r'(?::[^;(){},]*)?)?'
+               r'(?:[(){}](?:' + NUMBER + r')?)?'
+               r'(?:,[^;(){}]*)?')
+INCLUDE_POINT = (r'\?+[^;,?]*(?:,[^;,?]*(?:,(?:' + NUMBER + r')?(?:,(?:' + NUMBER + r')?(?:,[^;?]*)?)?)?)?'
+                 r'(?:\?[^;]*)?')
+FUNCTION_POINT = r'![sS][tT][rR],[^;,]*,' + NUMBER + ',' + NUMBER + r'(?:,' + NUMBER + ',' + NUMBER + r'(?:,[^;]*)?)?'
+CLOSED_POINT = r'#(?:[(){}](?:' + NUMBER + r')?(?:,[^;]*)?|[^;(){}][^;]*)?'
+
+POINTS_REGEX = re.compile(r'(?:(?:%s|%s|%s);)*' % (INCLUDE_POINT, FUNCTION_POINT, PLAIN_POINT))
+MIRRORED_POINTS_REGEX = re.compile(r'(?:(?:%s|%s|\*?%s);)*' % (INCLUDE_POINT, FUNCTION_POINT, PLAIN_POINT))
+PLAIN_POINT_REGEX = re.compile(PLAIN_POINT)
+MIRRORED_POINT_REGEX = re.compile(r'\*?' + PLAIN_POINT)
+LAST_MIRRORED_POINT_REGEX = re.compile(PLAIN_POINT + r'\^')
+INCLUDE_POINT_REGEX = re.compile(INCLUDE_POINT)
+FUNCTION_POINT_REGEX = re.compile(FUNCTION_POINT)
+CLOSED_POINT_REGEX = re.compile(CLOSED_POINT)
+
+INCLUDE_START = '?'
+FUNCTION_CHAR = '!'
+CLOSED_PATH_INDICATOR = '#'
+MIRRORED_PATH_INDICATOR = '^'
+SPECIAL_SHAPES = '_'
+
+
+class PathFieldSyntaxError(ValueError):
+    """
+    A PathField that load_path can not read
+
+    Attributes:
+    ___________
+    position: int
+        position in the PathField string of the first error
+    """
+
+    def __init__(self, message, position):
+        super(PathFieldSyntaxError, self).__init__('%s at position %d' % (message, position))
+        self.position = position
+
+
+def decode_attributes(attributes_str):
+    """
+    Decodes the attributes of a path header in the same way as PathFieldInterpreter.decode_attributes
+    """
+    attributes = {}
+    for attribute_str in attributes_str.split(';'):
+        attribute = attribute_str.split(':')
+        if len(attribute) == 1:
+            attributes[attribute[0]] = True
+        else:
+            attributes[attribute[0]] = attribute[1]
+    return attributes
+
+
+def scan_header(path_str, start, override_data=None):
+    """
+    Reads the header of a path string without parsing its points, following
+    PathFieldInterpreter.process_path_header
+
+    :param path_str: a non-empty path string
+    :param start: position of the path string in the PathField
+    :return: the header and the position of the points in the path string
+    :rtype: tuple
+    :raises: PathFieldSyntaxError: the header can not be read
+    """
+    name = ''
+    path_type = ''
+    layers = []
+    attributes = {}
+    position = 0
+
+    if path_str[0] == '<':
+        index = path_str.find('>', 1) - 1
+        if index == -2:
+            raise PathFieldSyntaxError('Unterminated path attributes', start)
+        if index != 1:
+            attributes = decode_attributes(path_str[1:index + 1])
+            position = index + 2
+            if position == len(path_str):
+                raise PathFieldSyntaxError('Path ends after its attributes', start + position)
+
+    if path_str[position] == '"':
+        index = path_str.find('"', position + 1)
+        index = -1 if index == -1 else index - position - 1
+        if index != 1:
+            path_type = path_str[position + 1:position + index + 1]
+            position += index + 2
+
+    index = path_str.find('&', position)
+    if index != -1:
+        layers = path_str[position:index].split(',')
+        position = index + 1
+
+    index = path_str.find('@', position)
+    if index != -1:
+        name = path_str[position:index]
+        if override_data is not None and name in override_data and 'rename' in override_data[name]:
+            name = override_data[name]['rename']
+        position = index + 1
+
+    return PathFieldHeader(name, path_type, layers, attributes, start, start + len(path_str)), position
+
+
+def match_length(regex, text):
+    match = regex.match(text)
+    return 0 if match is None else match.end()
+
+
+def find_points_error(points):
+    """
+    Returns the position in points of the first error and its message, or None if they are valid
+    """
+    last_separator = points.rfind(';')
+    last_point = points[last_separator + 1:]
+
+    first_char = last_point[:1]
+    is_mirrored = False
+    if first_char == INCLUDE_START:
+        last_point_regex = INCLUDE_POINT_REGEX
+    elif first_char == FUNCTION_CHAR:
+        last_point_regex = FUNCTION_POINT_REGEX
+    elif CLOSED_PATH_INDICATOR in last_point:
+        if last_separator == -1:
+            return 0, 'Closed path has no points'
+        if first_char != CLOSED_PATH_INDICATOR:
+            return last_separator + 1, 'Closing point does not start with #'
+        last_point_regex = CLOSED_POINT_REGEX
+    elif MIRRORED_PATH_INDICATOR in last_point:
+        last_point_regex = LAST_MIRRORED_POINT_REGEX
+        is_mirrored = True
+    else:
+        last_point_regex = PLAIN_POINT_REGEX
+
+    points_regex = MIRRORED_POINTS_REGEX if is_mirrored else POINTS_REGEX
+    if points_regex.match(points, 0, last_separator + 1).end() == last_separator + 1:
+        end = match_length(last_point_regex, last_point)
+        if end == len(last_point):
+            return None
+        return last_separator + 1 + end, 'Invalid last point'
+
+    # find the point the grammar failed on
+    point_start = 0
+    while True:
+        point_end = points.find(';', point_start)
+        if point_end == -1 or point_end > last_separator:
+            break
+        point = points[point_start:point_end]
+        if point[:1] == INCLUDE_START:
+            point_regex = INCLUDE_POINT_REGEX
+        elif point[:1] == FUNCTION_CHAR:
+            point_regex = FUNCTION_POINT_REGEX
+        else:
+            point_regex = MIRRORED_POINT_REGEX if is_mirrored else PLAIN_POINT_REGEX
+        end = match_length(point_regex, point)
+        if end != len(point):
+            return point_start + end, 'Invalid point'
+        point_start = point_end + 1
+    return None
+
+
+def find_path_field_error(path_field, override_data=None):
+    """
+    Checks a PathField against the grammar load_path reads, without creating any geometry
+
+    :param path_field: PathField string
+    :return: the first error, or None if there is none
+    :rtype: PathFieldSyntaxError
+    """
+    start = 0
+    for path_str in path_field.split('|'):
+        if path_str:
+            try:
+                header, points_start = scan_header(path_str, start, override_data)
+            except PathFieldSyntaxError as error:
+                return error
+            points = path_str[points_start:]
+            if not points.startswith(SPECIAL_SHAPES):
+                error = find_points_error(points)
+                if error is not None:
+                    return PathFieldSyntaxError(error[1], start + points_start + error[0])
+        start += len(path_str) + 1
+    return None
+
+
+def scan_path_field_headers(path_field, override_data=None):
+    """
+    Reads the name, type, layers and attributes of each path of a PathField without parsing its points
+
+    :param path_field: PathField string
+    :param override_data: renames applied to the names as load_path applies them
+    :return: a PathFieldHeader for each non-empty path string
+    :rtype: list
+    :raises: PathFieldSyntaxError: a header can not be read
+    """
+    headers = []
+    start = 0
+    for path_str in path_field.split('|'):
+        if path_str:
+            headers.append(scan_header(path_str, start, override_data)[0])
+        start += len(path_str) + 1
+    return headers
+
+
+def validate_path_field(path_field, override_data=None):
+    """
+    Checks a PathField without creating any geometry and returns its headers
+
+    :param path_field: PathField string
+    :return: a PathFieldHeader for each non-empty path string
+    :rtype: list
+    :raises: PathFieldSyntaxError: the PathField has an error, which is the first one
+    """
+    error = find_path_field_error(path_field, override_data)
+    if error is not None:
+        raise error
+    return scan_path_field_headers(path_field, override_data)
@@ -1,13 +1,16 @@
 import math
+import os
 
 import pytest
 
+from geometry_utils import path_field_batch
 from geometry_utils.three_d.axis_aligned_box3 import AxisAlignedBox3
 from geometry_utils.three_d.edge3 import Edge3
 from geometry_utils.three_d.matrix4 import Matrix4
 from geometry_utils.three_d.path3 import Path3
 from geometry_utils.three_d.point3 import Point3
 from geometry_utils.three_d.vector3 import Vector3
+from geometry_utils.two_d import bulk_transforms
 from geometry_utils.two_d.axis_aligned_box2 import AxisAlignedBox2
 from geometry_utils.two_d.edge2 import Edge2
 from geometry_utils.two_d.intersection import Intersection
@@ -520,3 +523,43 @@ Intersection
 def intersection1():
     return Intersection()
 
+
+'''
+Backends
+'''
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    """
+    Runs a test with the NumPy code of path_field_batch and bulk_transforms, and again with the Python code they
+    use when NumPy is not installed. The NumPy run is skipped without NumPy, unless REQUIRE_NUMPY is set.
+    """
+    if request.param == 'python':
+        monkeypatch.setattr(path_field_batch, 'numpy', None)
+        monkeypatch.setattr(bulk_transforms, 'numpy', None)
+    elif path_field_batch.numpy is None:
+        if os.environ.get('REQUIRE_NUMPY'):
+            pytest.fail('NumPy is required but not installed')
+        pytest.skip('NumPy is not installed')
+    return request.param
+
+
+'''
+Path state
+'''
+
+
+def edge_state(edge):
+    return (edge.p1.x, edge.p1.y, edge.p1.name, edge.p1.w, edge.p2.x, edge.p2.y, edge.p2.name, edge.p2.w,
+            edge.centre.x, edge.centre.y, edge.centre is edge.p1, edge.centre is edge.p2, edge.radius,
+            edge.clockwise, edge.large, edge.name, edge.style, edge.type, edge.left_name, edge.right_name)
+
+
+def paths_state(paths):
+    """
+    The values of paths and their edges, to compare paths built in different ways
+    """
+    return [(path.name, path.type, path.fill, path.layers, path.attributes, path.closed,
+             [edge_state(edge) for edge in path.list_of_edges])
+            for path in paths]
@@ -0,0 +1,81 @@
+import pytest
+
+from geometry_utils.path_field_batch import instantiate_batch, load_path_batch
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.path_field_template import compile_template
+from geometry_utils.pytests.conftest import paths_state
+
+PANEL = '"panel"door@0:0;W:0;W:H-R;~-R:H)R;R:H(R*2;0:H-R)R;#|handle@X:Y;~40;:~12)6;X;#)6'
+
+
+def size_rows():
+    # a radius of 0 and a handle at the origin change which edges the parser joins
+    return [{'W': 400, 'H': 700, 'R': 40, 'X': 60, 'Y': 320},
+            {'W': 512.345, 'H': 999.999, 'R': 12.5, 'X': -3.333, 'Y': 0.005},
+            {'W': 400, 'H': 700, 'R': 0, 'X': 0, 'Y': 0},
+            {'W': 0.125, 'H': 0.375, 'R': 0.0625, 'X': 1, 'Y': 2}]
+
+
+def test_batch_matches_instantiate(backend):
+    template = compile_template(PANEL)
+    rows = size_rows()
+    expected = [paths_state(template.instantiate(bindings)) for bindings in rows]
+    assert [paths_state(paths) for paths in instantiate_batch(template, rows)] == expected
+
+    table = dict((name, [bindings[name] for bindings in rows]) for name in template.variable_names)
+    assert [paths_state(paths) for paths in instantiate_batch(template, table)] == expected
+
+
+@pytest.mark.parametrize('include_type', ['pp', 'mm', 'pm', 'mp'])
+def test_batch_includes(include_type, backend):
+    interpreter = PathFieldInterpreter()
+    interpreter.variables = {'notch': ';5;5:5)2;0:5'}
+    template = compile_template(';W;?notch,%s,W-10,0?N;0:20;#' % include_type, interpreter)
+    rows = [{'W': 30, 'N': 1}, {'W': 30, 'N': 0}, {'W': 10, 'N': 2}, {'W': 50, 'N': 1}]
+    expected = [paths_state(template.instantiate(bindings)) for bindings in rows]
+    assert [paths_state(paths) for paths in instantiate_batch(template, rows)] == expected
+
+
+def test_batch_point_at_origin(backend):
+    # a point at the origin matches the open edge before it without being joined to it
+    template = compile_template('~-3)3.5;X{20;7')
+    rows = [{'X': 0}, {'X': 1}, {'X': 0}]
+    expected = [paths_state(template.instantiate(bindings)) for bindings in rows]
+    assert [paths_state(paths) for paths in instantiate_batch(template, rows)] == expected
+
+
+def test_batch_packed(backend):
+    rows = size_rows()
+    template = compile_template(PANEL)
+    packed_paths = load_path_batch(PANEL, rows, packed=True)
+    assert [packed_edges.name for packed_edges in packed_paths] == ['door', 'handle']
+    for path_index, packed_edges in enumerate(packed_paths):
+        assert len(packed_edges) == len(rows)
+        for index, bindings in enumerate(rows):
+            start, end = packed_edges.get_edge_range(index)
+            edges = template.instantiate(bindings)[path_index].list_of_edges
+            assert end - start == len(edges)
+            for offset, edge in enumerate(edges):
+                assert packed_edges.p1_x[start + offset] == edge.p1.x
+                assert packed_edges.p2_y[start + offset] == edge.p2.y
+                assert packed_edges.centre_x[start + offset] == edge.centre.x
+                assert packed_edges.radius[start + offset] == edge.radius
+                assert bool(packed_edges.clockwise[start + offset]) == edge.clockwise
+
+
+def test_batch_bindings_errors(backend):
+    template = compile_template(';W;W:H;#')
+    with pytest.raises(ValueError):
+        instantiate_batch(template, {'W': [1, 2], 'H': [1]})
+    with pytest.raises(KeyError):
+        instantiate_batch(template, [{'W': 1}])
+    assert instantiate_batch(template, []) == []
+
+
+@pytest.mark.parametrize('width', [0, 1])
+def test_batch_division_by_zero(width, backend):
+    template = compile_template(';W/H;W:H;#')
+    with pytest.raises(ZeroDivisionError):
+        template.instantiate({'W': width, 'H': 0})
+    with pytest.raises(ZeroDivisionError):
+        load_path_batch(';W/H;W:H;#', {'W': [width, 1], 'H': [0, 2]})
@@ -0,0 +1,56 @@
+import pytest
+
+from geometry_utils.path_field_binary import decode, encode
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.pytests.conftest import paths_state
+from geometry_utils.three_d.path3 import Path3
+
+PATH_FIELDS = ['<a:1><b:2.5>outer@;100,p1;:50)30,p2,top%dash;0;#fill',
+               '5:5)2',
+               ';1:1;2:2;#|inner@;10:10;20:10(3;20:20;#',
+               '0:0;50:0)20;50:50{30;0:80;*-50:50;-50:0{30^',
+               'big@;123456.75;:0.001;-99999;#']
+
+
+@pytest.mark.parametrize('path_field', PATH_FIELDS)
+def test_binary_round_trip(path_field):
+    paths = PathFieldInterpreter().load_path(path_field)
+    assert paths_state(decode(encode(paths))) == paths_state(paths)
+
+
+def test_binary_round_trip_string_values():
+    paths = PathFieldInterpreter().load_path(';10;:10)5;0;#')
+    edge = paths[0].list_of_edges[1]
+    edge.p2.x = 'width'
+    edge.radius = 'radius'
+    decoded = decode(encode(paths))
+    assert paths_state(decoded) == paths_state(paths)
+    assert decoded[0].list_of_edges[1].radius == 'radius'
+
+
+@pytest.mark.parametrize('path_field', PATH_FIELDS)
+def test_binary_to_path_field(path_field):
+    test_path_field_interpreter = PathFieldInterpreter()
+    data = test_path_field_interpreter.path_field_to_binary(path_field)
+    expected = PathFieldInterpreter().add_paths(test_path_field_interpreter.load_path(path_field))
+    assert test_path_field_interpreter.binary_to_path_field(data) == expected
+
+
+def test_binary_is_smaller_than_text_for_long_profiles():
+    path_field = '0:0;' + ';'.join('%d:%d' % (index * 10, (index * 7) % 50) for index in range(1, 500)) + ';#'
+    test_path_field_interpreter = PathFieldInterpreter()
+    text = PathFieldInterpreter().add_paths(test_path_field_interpreter.load_path(path_field))
+    assert len(test_path_field_interpreter.path_field_to_binary(path_field)) < len(text) / 2
+
+
+def test_load_binary_rejects_bad_data():
+    data = PathFieldInterpreter().path_field_to_binary(';1:1;2:2;#')
+    with pytest.raises(ValueError):
+        decode(b'XYZ' + data[3:])
+    with pytest.raises(ValueError):
+        decode(data + b'\x00')
+
+
+def test_dump_binary_rejects_path3():
+    with pytest.raises(TypeError):
+        PathFieldInterpreter().dump_binary([Path3()])
@@ -0,0 +1,54 @@
+from geometry_utils.path_field_cache import PathFieldCache
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+
+
+def test_path_field_cache_hit_returns_equal_copy():
+    test_path_field_interpreter = PathFieldInterpreter(cache=PathFieldCache())
+    first = test_path_field_interpreter.load_path(';1:1;2:2;#')
+    second = test_path_field_interpreter.load_path(';1:1;2:2;#')
+    assert first[0] == second[0]
+    assert first[0] is not second[0]
+    assert first[0].list_of_edges[0].p1 is not second[0].list_of_edges[0].p1
+    assert test_path_field_interpreter.cache.get_stats()['hits'] == 1
+    assert test_path_field_interpreter.cache.get_stats()['misses'] == 1
+
+
+def test_path_field_cache_results_are_mutable():
+    test_path_field_interpreter = PathFieldInterpreter(cache=PathFieldCache())
+    path = test_path_field_interpreter.load_path(';1:1;2:2;#')[0]
+    path.list_of_edges[1].p1.x = 50.0
+    path.name = 'changed'
+    cached = test_path_field_interpreter.load_path(';1:1;2:2;#')[0]
+    assert cached.list_of_edges[1].p1.x == 1.0
+    assert cached.name == ''
+
+
+def test_path_field_cache_key_includes_options():
+    test_path_field_interpreter = PathFieldInterpreter(cache=PathFieldCache())
+    test_path_field_interpreter.load_path('a@;1;#')
+    renamed = test_path_field_interpreter.load_path('a@;1;#', override_data={'a': {'rename': 'b'}})
+    assert renamed[0].name == 'b'
+    assert test_path_field_interpreter.load_path('a@;1;#', return_single='a').name == 'a'
+    assert test_path_field_interpreter.cache.get_stats()['hits'] == 0
+
+
+def test_path_field_cache_evicts_least_recently_used():
+    cache = PathFieldCache(max_entries=2)
+    test_path_field_interpreter = PathFieldInterpreter(cache=cache)
+    test_path_field_interpreter.load_path(';1;#')
+    test_path_field_interpreter.load_path(';2;#')
+    test_path_field_interpreter.load_path(';1;#')
+    test_path_field_interpreter.load_path(';3;#')
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    test_path_field_interpreter.load_path(';1;#')
+    assert cache.hits == 2
+
+
+def test_path_field_cache_size_limit():
+    cache = PathFieldCache(max_size=5000)
+    test_path_field_interpreter = PathFieldInterpreter(cache=cache)
+    for index in range(10):
+        test_path_field_interpreter.load_path(';%d;:1;#' % (index + 1))
+    assert cache.size <= 5000
+    assert cache.evictions > 0
@@ -0,0 +1,109 @@
+import threading
+
+try:
+    from StringIO import StringIO  # Python 2, where io.StringIO only takes unicode
+except ImportError:
+    from io import StringIO
+
+import pytest
+
+from geometry_utils.path_field_codec import MAX_INCLUDE_BINDINGS, PathFieldCodec
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.pytests.conftest import paths_state
+
+
+def test_codec_load_matches_interpreter():
+    path_field = 'a@;100;:50)30;0;#|b@0:0;50:0;*50:25;60:40^'
+    codec = PathFieldCodec(round_value=1)
+    expected = PathFieldInterpreter().load_path(path_field, round_value=1)
+    assert paths_state(codec.load(path_field)) == paths_state(expected)
+    assert codec.load(path_field, return_single='b').name == 'b'
+    assert [path.name for path in codec.iter_paths(StringIO(path_field))] == ['a', 'b']
+    assert codec.options == {'round_value': 1}
+
+
+def test_codec_variables_per_call():
+    codec = PathFieldCodec(variables={'notch': ';5;5:5;0:5'})
+    default_paths = codec.load(';10;?notch;0:20;#')
+    wide_paths = codec.load(';10;?notch;0:20;#', variables={'notch': ';9;9:9;0:9'})
+    assert paths_state(default_paths) != paths_state(wide_paths)
+    assert paths_state(codec.load(';10;?notch;0:20;#')) == paths_state(default_paths)
+    assert codec.variables == {'notch': ';5;5:5;0:5'}
+
+
+def test_codec_reuses_interpreter_between_calls():
+    path_field = 'a@;100;:50)30;0;#|b@0:0;50:0;*50:25;60:40^'
+    codec = PathFieldCodec()
+    assert codec.load(path_field, return_single='b').name == 'b'
+    path_field_interpreter = codec.get_interpreter()
+    path_field_index = path_field_interpreter.path_field_indexes.get_index(path_field)
+    assert codec.load(path_field, return_single='a').name == 'a'
+    assert codec.get_interpreter() is path_field_interpreter
+    assert path_field_interpreter.path_field_indexes.get_index(path_field) is path_field_index
+
+
+def test_codec_include_templates_by_variables():
+    codec = PathFieldCodec(variables={'notch': ';5;5:5;0:5'})
+    codec.load(';10;?notch;0:20;#')
+    default_template = codec.get_include_templates()['notch']
+    codec.load(';10;?notch;0:20;#', variables={'notch': ';9;9:9;0:9'})
+    wide_template = codec.get_include_templates({'notch': ';9;9:9;0:9'})['notch']
+    assert wide_template is not default_template
+    codec.load(';10;?notch;0:20;#')
+    assert codec.get_include_templates()['notch'] is default_template
+    assert codec.get_include_templates({'notch': ';9;9:9;0:9'})['notch'] is wide_template
+
+
+def test_codec_dumps_does_not_accumulate():
+    codec = PathFieldCodec()
+    paths = codec.load(';10;10:10;#')
+    assert codec.dumps(paths) == codec.dumps(paths) == PathFieldInterpreter().add_paths(paths)
+    output = StringIO()
+    codec.dump(paths + paths, output)
+    assert output.getvalue() == codec.dumps(paths + paths)
+    assert paths_state(codec.load_binary(codec.dump_binary(paths))) == paths_state(paths)
+
+
+def test_codec_unknown_option():
+    with pytest.raises(TypeError):
+        PathFieldCodec(round_values=2)
+
+
+def test_codec_shared_between_threads():
+    codec = PathFieldCodec()
+    path_field = ';10;?notch,pp,20;0:20;#'
+    variables = [{'notch': ';%d;%d:%d;0:%d' % (size, size, size, size)} for size in range(1, 9)]
+    expected = [paths_state(PathFieldCodec(variables=notch).load(path_field)) for notch in variables]
+    errors = []
+
+    def work(index):
+        for _ in range(50):
+            if paths_state(codec.load(path_field, variables=variables[index])) != expected[index]:
+                errors.append(index)
+
+    threads = [threading.Thread(target=work, args=(index,)) for index in range(len(variables))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_codec_include_templates_bounded_between_threads():
+    codec = PathFieldCodec()
+    errors = []
+
+    def work(offset):
+        try:
+            for size in range(offset, offset + MAX_INCLUDE_BINDINGS):
+                codec.load(';10;?notch;0:20;#', variables={'notch': ';%d;0:%d' % (size, size)})
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=work, args=(index * MAX_INCLUDE_BINDINGS,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(codec.include_templates) == MAX_INCLUDE_BINDINGS
@@ -0,0 +1,81 @@
+import pytest
+
+from geometry_utils.path_field_incremental import IncrementalPathField
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.pytests.conftest import paths_state
+
+
+def assert_matches_load_path(incremental_path_field, **options):
+    expected = PathFieldInterpreter().load_path(incremental_path_field.path_field, **options)
+    assert paths_state(incremental_path_field.paths) == paths_state(expected)
+
+
+def test_incremental_edit_point_in_place():
+    incremental_path_field = IncrementalPathField(PathFieldInterpreter(), 'door@;100;100:50,top;~-20;0:80;#fill',
+                                                  edit_mode=True)
+    path = incremental_path_field.paths[0]
+    first_edge = path.list_of_edges[0]
+    offset = incremental_path_field.path_field.index('100:50')
+    paths = incremental_path_field.apply_edit(offset + 4, 2, '75')
+    assert paths[0] is path
+    assert path.list_of_edges[0] is first_edge
+    assert incremental_path_field.path_field == 'door@;100;100:75,top;~-20;0:80;#fill'
+    assert_matches_load_path(incremental_path_field, edit_mode=True)
+
+
+def test_incremental_relative_points_follow_edit():
+    incremental_path_field = IncrementalPathField(PathFieldInterpreter(), '0:0;10:0;~5;~5:~5;:~5;20:40;0:40;#')
+    incremental_path_field.apply_edit(incremental_path_field.path_field.index('10:0'), 2, '12')
+    assert incremental_path_field.paths[0].list_of_edges[3].p1.x == 22
+    assert_matches_load_path(incremental_path_field)
+
+
+def test_incremental_arc_radius_follows_edit():
+    incremental_path_field = IncrementalPathField(PathFieldInterpreter(), '0:0;100:0)40;100:100(;0:100(;#')
+    incremental_path_field.apply_edit(incremental_path_field.path_field.index(')40') + 1, 2, '60')
+    assert [edge.radius for edge in incremental_path_field.paths[0].list_of_edges[:3]] == [60, 60, 60]
+    assert_matches_load_path(incremental_path_field)
+
+
+def test_incremental_edit_first_point_of_closed_path():
+    incremental_path_field = IncrementalPathField(PathFieldInterpreter(), '5:5;100:0;100:100;0:100;#')
+    incremental_path_field.apply_edit(0, 3, '0:0')
+    assert incremental_path_field.paths[0].list_of_edges[-1].p2.x == 0
+    assert_matches_load_path(incremental_path_field)
+
+
+def test_incremental_edit_updates_cached_properties():
+    incremental_path_field = IncrementalPathField(PathFieldInterpreter(), '0:0;100:0;100:50;0:80;#')
+    path = incremental_path_field.paths[0]
+    assert path.get_bounds().max.y == 80
+    assert path.get_enclosed_area() == 6500
+    version = path.version
+
+    incremental_path_field.apply_edit(incremental_path_field.path_field.index(':80') + 1, 2, '500')
+    assert path.version > version
+    assert path.get_bounds().max.y == 500
+    assert path.get_enclosed_area() == 27500
+
+    # a point added parses the path again into the same Path2
+    incremental_path_field.apply_edit(incremental_path_field.path_field.index(';#'), 0, ';0:600')
+    assert path.get_bounds().max.y == 600
+    assert_matches_load_path(incremental_path_field)
+
+
+@pytest.mark.parametrize('offset, removed_length, inserted_text', [(9, 0, ';50:50'),  # adds a point
+                                                                   (4, 0, 'a@'),  # names the path
+                                                                   (0, 0, 'b@;1;2;3|'),  # adds a path
+                                                                   (11, 1, '')])  # joins two paths
+def test_incremental_structural_edits(offset, removed_length, inserted_text):
+    path_field = ';10;10:10;0:10;#|c@;1;2;3'
+    incremental_path_field = IncrementalPathField(PathFieldInterpreter(), path_field)
+    incremental_path_field.apply_edit(offset, removed_length, inserted_text)
+    assert incremental_path_field.path_field == (path_field[:offset] + inserted_text +
+                                                 path_field[offset + removed_length:])
+    assert_matches_load_path(incremental_path_field)
+
+
+def test_incremental_edit_outside_path_field():
+    incremental_path_field = IncrementalPathField(PathFieldInterpreter(), ';10;10:10;0:10;#')
+    with pytest.raises(ValueError):
+        incremental_path_field.apply_edit(15, 5, '')
@@ -0,0 +1,59 @@
+from geometry_utils.path_field_index import SEARCH_ALL, PathFieldIndex, PathFieldIndexCache
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.path_field_stats import PathFieldStats
+
+
+def test_path_field_index_spans():
+    path_field = 'a@;1;#||<k:v>"t"l1&b@;2;#|;3;#|a@;4;#'
+    path_field_index = PathFieldIndex(path_field)
+    assert len(path_field_index) == 4
+    assert [path_field[start:end] for _, start, end in path_field_index.spans] == \
+        ['a@;1;#', '<k:v>"t"l1&b@;2;#', ';3;#', 'a@;4;#']
+    assert path_field_index.names == {'a': 0, 'b': 1, '': 2}
+    assert path_field_index.first_unnamed is None
+    assert path_field_index.find('a') == (0, 6)
+    assert path_field_index.find('b') == (8, 25)
+    assert path_field_index.find('c') is None
+
+
+def test_path_field_index_renames():
+    path_field_index = PathFieldIndex('a@;1;#|b@;2;#|c@;3;#')
+    assert path_field_index.find('a', {'a': {'rename': 'x'}}) is None
+    assert path_field_index.find('x', {'a': {'rename': 'x'}}) == (0, 6)
+    assert path_field_index.find('a', {'c': {'rename': 'a'}, 'b': {'rename': 'a'}}) == (0, 6)
+    assert path_field_index.find('c', {'a': {'rename': 'c'}, 'c': {}}) == (0, 6)
+
+
+def test_path_field_index_special_shapes():
+    path_field_index = PathFieldIndex('a@;1;#|b@_rect,10,10|c@;3;#')
+    assert path_field_index.first_unnamed == 1
+    assert path_field_index.find('a') == (0, 6)
+    assert path_field_index.find('c') is SEARCH_ALL
+    assert path_field_index.find('missing') is SEARCH_ALL
+
+
+def test_load_path_return_single_parses_one_path():
+    stats = PathFieldStats()
+    interpreter = PathFieldInterpreter(stats=stats)
+    path_field = '|'.join('p%d@;%d;%d:%d;#' % (index, index, index, index) for index in range(20))
+    path = interpreter.load_path(path_field, return_single='p15')
+    expected = [loaded_path for loaded_path in PathFieldInterpreter().load_path(path_field)
+                if loaded_path.name == 'p15'][0]
+    assert path == expected
+    assert stats.last_load.paths == 1
+    assert interpreter.load_path(path_field, return_single='p99') is None
+    assert interpreter.load_path(path_field, return_single='x', override_data={'p3': {'rename': 'x'}}) == \
+        PathFieldInterpreter().load_path(path_field, override_data={'p3': {'rename': 'x'}})[3]
+    assert len(interpreter.path_field_indexes) == 1
+
+
+def test_path_field_index_cache():
+    cache = PathFieldIndexCache(max_entries=2)
+    first_index = cache.get_index('a@;1;#')
+    assert cache.get_index('a@;1;#') is first_index
+    cache.get_index('b@;1;#')
+    cache.get_index('c@;1;#')
+    assert len(cache) == 2
+    assert cache.get_index('a@;1;#') is not first_index
+    cache.clear()
+    assert len(cache) == 0
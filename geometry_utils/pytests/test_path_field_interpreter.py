@@ -1,6 +1,20 @@
+try:
+    from StringIO import StringIO  # Python 2, where io.StringIO only takes unicode
+except ImportError:
+    from io import StringIO
+
+import functools
+
 import pytest
 
-from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils import path_field_names
+from geometry_utils.path_field_interpreter import (PathFieldFunctions, PathFieldInterpreter, format_num,
+                                                   tokenize_path_points)
+from geometry_utils.pytests.conftest import paths_state
+from geometry_utils.two_d.bulk_transforms import offset_paths
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.point2 import Point2
+from geometry_utils.two_d.vector2 import Vector2
 
 
 def test_path_field_add_field_closed_line(path2_1):
@@ -37,3 +51,267 @@ def test_path_field_load_path_circle(path2_6):
     test_path_field_interpreter = PathFieldInterpreter()
     path = test_path_field_interpreter.load_path('1:1)1')
     assert path[0] == path2_6
+
+
+def test_tokenize_path_points():
+    tokens = list(tokenize_path_points(';1:~2)5,p1,e1%dash;:3'))
+    assert tokens == [('', '', '', None, None, None),
+                      ('1:~2)5,p1,e1%dash', '1', '~2', ')', '5', 'p1,e1%dash'),
+                      (':3', '', '3', None, None, None)]
+
+
+def test_tokenize_path_points_unsupported_point_uses_text():
+    assert list(tokenize_path_points('1:1)5)6')) == [('1:1)5)6', None, None, None, None, None)]
+
+
+def legacy_process_path_points(interpreter, path_str, path, edit_mode, point_name_prefix, round_value):
+    """
+    The original point parser of PathFieldInterpreter, splitting and searching each point separately.
+    Kept here to check that the tokenizing parser builds the same paths.
+    @return: True if the path is closed
+    """
+    points = path_str.split(interpreter.POINT_SEPARATOR)
+
+    # State variables
+    last_edge = Edge2()
+    last_r = 0.0
+
+    is_closed = False
+    is_mirrored = False
+    mirrored_point = -1
+    if interpreter.CLOSED_PATH_INDICATOR in points[len(points) - 1]:  # Check if path is closed
+        is_closed = True
+    if interpreter.MIRRORED_PATH_INDICATOR in points[len(points) - 1]:  # Check if path is mirrored
+        is_mirrored = True
+
+    for index, point in enumerate(points):
+        default_point_name = "%s%d" % (point_name_prefix, index)
+        edge_d = Edge2(Point2(), Point2(), 0, False, False)
+
+        # if the path is closed, process the last point differently as the format could be quite different,
+        # especially if there is a fill colour specified
+
+        if point.startswith(interpreter.INCLUDE_START):
+            if interpreter.process_include_tag(point, path, last_edge, edit_mode):
+                continue
+
+        elif point.startswith(interpreter.FUNCTION_CHAR):
+            path_field_functions = PathFieldFunctions()
+            path_field_functions.process(point, path)
+
+        elif is_closed and point is points[len(points) - 1]:  # last point of a closed path
+            interpreter.process_closed_point(point, path, last_edge, last_r, edit_mode)
+            break
+
+        elif is_mirrored:  # mirrored point
+            if point is points[len(points) - 1]:
+                interpreter.process_mirrored_points(point, edge_d, path, last_edge, last_r, mirrored_point, edit_mode,
+                                                    default_point_name, round_value=round_value)
+                break
+
+            else:
+                if len(point) > 0 and point[0] == interpreter.MIRRORED_PATH_POINT_INDICATOR:
+                    mirrored_point = path.path_length - 1
+                    point = point[1:]
+                    # if edit_mode:
+                    # path.points[-1]['mirror'] = interpreter.MIRRORED_PATH_POINT_INDICATOR
+                interpreter.process_normal_point(point, edge_d, path, last_edge, last_r, edit_mode, default_point_name,
+                                                 round_value=round_value)
+        else:  # Normal point
+            interpreter.process_normal_point(point, edge_d, path, last_edge, last_r, edit_mode, default_point_name,
+                                             round_value=round_value)
+        if last_edge.is_arc():
+            last_r = last_edge.radius
+        last_edge = path.list_of_edges[-1]
+
+    return is_closed
+
+
+def legacy_load_path(path_field):
+    interpreter = PathFieldInterpreter()
+    interpreter.process_path_points = functools.partial(legacy_process_path_points, interpreter)
+    return interpreter.load_path(path_field)
+
+
+@pytest.mark.parametrize('path_field', [
+    ';1:1;2:2;#',
+    '1:1)1',
+    'l1,l2&outer@;100;:50)30;0;#fill',
+    '<a:1;b>"extrude"outer@;100;:50;0;#)20,top%dash#red',
+    ';100,p1,e1%s1,left,right;100:100(25,p2;0:100,,edge;#',
+    ';~10;~10:~10;:~-5;#',
+    '0:0;50:0;*50:25;60:40^',
+    ';10(5;20{5;30}5;40)5;50(;60);#(',
+    ';10;10:10;#|b@;1;2;#|c@5:5)2',
+])
+def test_path_field_load_path_matches_legacy_parser(path_field):
+    test_path_field_interpreter = PathFieldInterpreter()
+    paths = test_path_field_interpreter.load_path(path_field)
+    assert paths_state(paths) == paths_state(legacy_load_path(path_field))
+
+
+def test_path_field_iter_paths_matches_load_path():
+    path_field = 'a@;1:1;2:2;#||b@;10;:10)5;0;#|c@1:1)1'
+    test_path_field_interpreter = PathFieldInterpreter()
+    paths = list(test_path_field_interpreter.iter_paths(path_field))
+    loaded_paths = test_path_field_interpreter.load_path(path_field)
+    assert [path.name for path in paths] == ['a', 'b', 'c']
+    for path, loaded_path in zip(paths, loaded_paths):
+        assert path == loaded_path
+
+
+def test_path_field_iter_paths_from_file_in_chunks():
+    path_field = '|'.join('p%d@;%d;:%d;0;#' % (index, index + 1, index + 2) for index in range(20))
+    test_path_field_interpreter = PathFieldInterpreter()
+    paths = list(test_path_field_interpreter.iter_paths(StringIO(path_field), chunk_size=7))
+    loaded_paths = test_path_field_interpreter.load_path(path_field)
+    assert [path.name for path in paths] == [path.name for path in loaded_paths]
+    for path, loaded_path in zip(paths, loaded_paths):
+        assert path == loaded_path
+
+
+def test_path_field_iter_path_strings():
+    test_path_field_interpreter = PathFieldInterpreter()
+    assert list(test_path_field_interpreter.iter_path_strings('a||bc|')) == ['a', '', 'bc', '']
+    assert list(test_path_field_interpreter.iter_path_strings(StringIO('a||bc|'), chunk_size=2)) == \
+        ['a', '', 'bc', '']
+
+
+def test_path_field_find_path_stops_at_first_match():
+    source = StringIO('a@;1;#|b@;2;:2;#|c@;W)bad;#')
+    path = PathFieldInterpreter().find_path(source, 'b', chunk_size=4)
+    assert path.name == 'b'
+    assert path.path_length == 3
+    assert source.read() != ''
+
+
+def test_path_field_add_path_accumulates(path2_1, path2_6):
+    test_path_field_interpreter = PathFieldInterpreter()
+    test_path_field_interpreter.add_path(path2_1)
+    assert test_path_field_interpreter.add_path(path2_6) == ';1:1;2:2;#|1:1)1'
+
+
+def test_path_field_add_paths(path2_1, path2_8, path2_6):
+    test_path_field_interpreter = PathFieldInterpreter()
+    assert test_path_field_interpreter.add_paths([path2_1, path2_8, path2_6]) == ';1:1;2:2;#|;1;:1;0)0.5;#|1:1)1'
+
+
+def test_path_field_dump(path2_1, path2_6):
+    output = StringIO()
+    PathFieldInterpreter().dump([path2_1, path2_6], output)
+    assert output.getvalue() == ';1:1;2:2;#|1:1)1'
+
+
+def test_path_field_format_num():
+    assert format_num(12.00003535) == '12'
+    assert format_num(12.300) == '12.3'
+    assert format_num(-0.001) == '-0'
+    assert format_num(0.0) == '0'
+    assert format_num('W') == 'W'
+
+
+def point_values(point):
+    return round(point.x, 6), round(point.y, 6), point.name
+
+
+def test_path_field_load_path_include():
+    test_path_field_interpreter = PathFieldInterpreter()
+    test_path_field_interpreter.variables = {'h': ';0:-10;20:-10;20:0'}
+    path = test_path_field_interpreter.load_path(';100,a;?h;200;200:100;#')[0]
+    assert [point_values(edge.p1) for edge in path.list_of_edges] == \
+           [(0, 0, '0'), (100, 0, 'a'), (100, -10, 'h_1'), (120, -10, 'h_2'), (120, 0, 'h_3'), (200, 0, '3'),
+            (200, 100, '4')]
+    assert path.is_continuous and path.is_closed
+
+
+@pytest.mark.parametrize('point_type', ['pp', 'mm', 'pm', 'mp'])
+def test_include_template_matches_path_offset(point_type):
+    test_path_field_interpreter = PathFieldInterpreter()
+    test_path_field_interpreter.variables = {'h': ';10{15;20:-10(30;20:0,,side%dash;'}
+    offset_vector = Vector2(5, 7)
+
+    edges = test_path_field_interpreter.get_include_template('h').instantiate(offset_vector, point_type)
+
+    # offset_paths rather than Path2.offset, which reverses arcs turned a half turn by 'mm'
+    expected_path = test_path_field_interpreter.load_path(';10{15;20:-10(30;20:0,,side%dash;',
+                                                          point_name_prefix='h_')[0]
+    offset_paths(expected_path, offset_vector, point_type)
+    assert len(edges) == expected_path.path_length
+    for edge, expected_edge in zip(edges, expected_path.list_of_edges):
+        assert point_values(edge.p1)[:2] == point_values(expected_edge.p1)[:2]
+        assert point_values(edge.p2)[:2] == point_values(expected_edge.p2)[:2]
+        assert point_values(edge.centre)[:2] == point_values(expected_edge.centre)[:2]
+        assert (edge.radius, edge.clockwise, edge.large, edge.name, edge.style) == \
+               (expected_edge.radius, expected_edge.clockwise, expected_edge.large, expected_edge.name,
+                expected_edge.style)
+
+
+def test_include_template_half_turn_keeps_arc_direction():
+    test_path_field_interpreter = PathFieldInterpreter()
+    test_path_field_interpreter.variables = {'h': ';10{15;20:-10(30;'}
+    include_template = test_path_field_interpreter.get_include_template('h')
+    edges = include_template.instantiate(Vector2(0, 0))
+    turned_edges = include_template.instantiate(Vector2(0, 0), 'mm')
+    for edge, turned_edge in zip(edges, turned_edges):
+        assert turned_edge.clockwise == edge.clockwise
+        assert point_values(turned_edge.centre)[:2] == (-round(edge.centre.x, 6), -round(edge.centre.y, 6))
+
+
+def test_include_template_is_compiled_once_and_follows_variables():
+    test_path_field_interpreter = PathFieldInterpreter()
+    test_path_field_interpreter.variables = {'outer': ';10;?inner;', 'inner': ';0:5;'}
+    include_template = test_path_field_interpreter.get_include_template('outer')
+    assert test_path_field_interpreter.get_include_template('outer') is include_template
+    assert include_template.dependencies == {'outer': ';10;?inner;', 'inner': ';0:5;'}
+
+    test_path_field_interpreter.variables['inner'] = ';0:6;'
+    recompiled_template = test_path_field_interpreter.get_include_template('outer')
+    assert recompiled_template is not include_template
+    assert (10, 6, 'inner_1') in [point_values(edge.p2) for edge in recompiled_template.instantiate(Vector2(0, 0))]
+
+
+def test_path_field_load_path_mirrored():
+    path = PathFieldInterpreter().load_path('0:0;50:0)20;50:50{30;0:80;*-50:50;-50:0{30^')[0]
+    assert [point_values(edge.p1)[:2] for edge in path.list_of_edges] == \
+           [(0, 0), (50, 0), (50, 50), (0, 80), (-50, 50), (-50, 0)]
+    assert path.list_of_edges[-1].p2 == path.list_of_edges[0].p1
+    assert path.is_continuous
+    assert len(set(id(edge) for edge in path.list_of_edges)) == path.path_length
+
+    arc, mirrored_arc = path.list_of_edges[1], path.list_of_edges[4]
+    assert (mirrored_arc.radius, mirrored_arc.clockwise, mirrored_arc.large) == (30, True, True)
+    assert point_values(mirrored_arc.centre)[:2] == (-point_values(arc.centre)[0], point_values(arc.centre)[1])
+    assert (path.list_of_edges[5].radius, path.list_of_edges[5].clockwise) == (20, False)
+
+
+def test_path_field_load_path_shares_names():
+    test_path_field_interpreter = PathFieldInterpreter()
+    path_field = '<finish:matt>front,back&"extrude"outer@;1000,,rebate%dash;1000:50,hinge;0:50;#,top#oak'
+    first_path = test_path_field_interpreter.load_path(path_field, point_name_prefix='p')[0]
+    second_path = test_path_field_interpreter.load_path(''.join(list(path_field)), point_name_prefix='p')[0]
+
+    assert first_path.list_of_edges[0].p1.name == 'p0'
+    assert [edge.p1.name for edge in first_path.list_of_edges] == ['p0', 'p1', 'hinge', 'p3']
+    for first_edge, second_edge in zip(first_path.list_of_edges, second_path.list_of_edges):
+        assert first_edge.p1.name is second_edge.p1.name
+        assert first_edge.name is second_edge.name
+        assert first_edge.style is second_edge.style
+    for first_value, second_value in zip(first_path.layers + [first_path.name, first_path.type, first_path.fill],
+                                         second_path.layers + [second_path.name, second_path.type, second_path.fill]):
+        assert first_value is second_value
+    assert list(first_path.attributes.items())[0][1] is list(second_path.attributes.items())[0][1]
+
+
+def test_path_field_default_point_names_are_bounded():
+    test_path_field_interpreter = PathFieldInterpreter()
+    for index in range(path_field_names.MAX_POINT_NAME_PREFIXES + 10):
+        test_path_field_interpreter.load_path(';1;1:1;#', point_name_prefix='bounded%d_' % index)
+    assert len(path_field_names.default_point_names_by_prefix) <= path_field_names.MAX_POINT_NAME_PREFIXES
+    assert 'bounded0_' not in path_field_names.default_point_names_by_prefix
+
+    default_point_names = path_field_names.get_default_point_names('bounded_')
+    last_index = path_field_names.MAX_POINT_NAMES + 5
+    assert default_point_names[last_index] == 'bounded_%d' % last_index
+    assert default_point_names[3] == 'bounded_3'
+    assert len(default_point_names) == 1
+    assert path_field_names.get_default_point_names('bounded_') is default_point_names
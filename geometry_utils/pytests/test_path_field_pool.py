@@ -0,0 +1,35 @@
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.path_field_pool import pack_path, unpack_path
+
+
+def test_pack_path_round_trip():
+    path = PathFieldInterpreter().load_path('<a:1>outer@;100,p1;:50)30,p2,top%dash;0;#fill')[0]
+    unpacked = unpack_path(pack_path(path))
+    assert unpacked == path
+    assert (unpacked.name, unpacked.fill, unpacked.attributes) == ('outer', 'fill', {'a': '1'})
+    assert [edge.p1.name for edge in unpacked.list_of_edges] == [edge.p1.name for edge in path.list_of_edges]
+    assert (unpacked.list_of_edges[2].name, unpacked.list_of_edges[2].style) == ('top', 'dash')
+
+
+def test_pack_path_keeps_centre_aliases():
+    path = PathFieldInterpreter().load_path('5:5)2')[0]
+    edge = unpack_path(pack_path(path)).list_of_edges[0]
+    assert (edge.centre is edge.p1) == (path.list_of_edges[0].centre is path.list_of_edges[0].p1)
+
+
+def test_load_paths_many_in_order():
+    path_fields = ['p%d@;%d;:%d;0;#' % (index, index + 1, index + 2) for index in range(12)]
+    test_path_field_interpreter = PathFieldInterpreter()
+    results = test_path_field_interpreter.load_paths_many(path_fields, workers=2, chunksize=5)
+    expected = [test_path_field_interpreter.load_path(path_field) for path_field in path_fields]
+    assert [result[0].name for result in results] == ['p%d' % index for index in range(12)]
+    for result, expected_result in zip(results, expected):
+        assert result[0] == expected_result[0]
+
+
+def test_load_paths_many_return_single():
+    test_path_field_interpreter = PathFieldInterpreter()
+    results = test_path_field_interpreter.load_paths_many(['a@;1;#|b@;2;#', 'a@;3;#'], workers=2, chunksize=1,
+                                                          return_single='b')
+    assert results[0].name == 'b'
+    assert results[1] is None
@@ -0,0 +1,51 @@
+import pytest
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.path_field_stats import PathFieldStats
+
+
+def test_stats_count_each_load():
+    loads = []
+    stats = PathFieldStats(callback=loads.append)
+    path_field_interpreter = PathFieldInterpreter(stats=stats)
+    path_field_interpreter.variables['notch'] = ';5;5:5)3;0:5'
+    path_field_interpreter.load_path('<a:1>"t"n@;100;:50)30;?notch,pp,10,10;0;#|m@0:0;50:0;*50:25;60:40^')
+    path_field_interpreter.load_path('x@;10;10:10')
+
+    assert len(loads) == 2
+    load_stats = loads[0]
+    assert (load_stats.paths, load_stats.points, load_stats.arcs, load_stats.includes) == (2, 10, 2, 1)
+    assert load_stats.phase_calls['header'] == 3  # the include is loaded too
+    assert load_stats.phase_calls['load'] == 2
+    assert load_stats.phase_calls['attributes'] == 1
+    assert load_stats.phase_calls['mirror'] == 1
+    assert load_stats.phase_calls['closed'] == 1
+    assert sum(load_stats.phase_seconds.values()) == pytest.approx(load_stats.seconds)
+
+    assert stats.last_load is loads[1]
+    assert (stats.loads, stats.paths, stats.points, stats.includes) == (2, 3, 13, 1)
+    assert stats.phase_calls['finish'] == 4
+    assert 'points' in stats.summary()
+
+
+def test_stats_remove():
+    stats = PathFieldStats()
+    path_field_interpreter = PathFieldInterpreter(stats=stats)
+    stats.remove(path_field_interpreter)
+    path_field_interpreter.load_path(';10;10:10;#')
+    assert path_field_interpreter.stats is None
+    assert stats.loads == 0
+    assert 'load_path' not in path_field_interpreter.__dict__
+
+
+def test_stats_failed_load():
+    stats = PathFieldStats()
+    path_field_interpreter = PathFieldInterpreter(stats=stats)
+    with pytest.raises(ValueError):
+        path_field_interpreter.load_path(';10)5)6;20;#')
+    assert stats.loads == 0
+    assert stats.phase_calls['load'] == 1
+    path_field_interpreter.load_path(';10;10:10;#')
+    assert stats.last_load.points == 4
+    stats.reset()
+    assert stats.loads == 0 and stats.phase_seconds == {}
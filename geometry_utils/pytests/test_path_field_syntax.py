@@ -0,0 +1,70 @@
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.path_field_syntax import (ClosedNode, FunctionNode, IncludeNode, PointNode, ShapeNode,
+                                              TextNode)
+
+
+def test_syntax_tree_round_trip():
+    interpreter = PathFieldInterpreter()
+    for path_field in ('', '||', 'a@', '<k:v>"t"l1,l2&a@;10:5:1(5,p1,top%dash,l,r;~5:~5;#}8,left%hidden#oak',
+                       ';1;#oak', '1:1;2:2)5;#(,#oak', '?hinge,pm,0,10?1;??a;!STR,,50,400', '_rect,1,2;3:4',
+                       'm@0:0;5:5;*10:0;15:5;20:0^', '1:1;2x(;3', '<bad', 'a@;1;2;#,name'):
+        tree = interpreter.load_syntax_tree(path_field)
+        assert tree.to_text() == path_field
+        for path_node in tree.paths:
+            assert path_field[path_node.start:path_node.end] == path_node.to_text()
+            for node in path_node.points:
+                assert path_field[node.start:node.end] == node.to_text()
+
+
+def test_syntax_tree_round_trip_of_markers_inside_points():
+    interpreter = PathFieldInterpreter()
+    for path_field in ('0:0;10:0;10:10#', '1;2#', '1;#2#', '1;2#(5', '1;##,e', '1;2;^#', '1;2^^', '1;*2;3^x',
+                       '1;*2;*3^', '1;2:^3', '1;2#^'):
+        tree = interpreter.load_syntax_tree(path_field)
+        assert tree.to_text() == path_field
+        last_node = tree.paths[0].points[-1]
+        assert path_field[last_node.start:last_node.end] == last_node.to_text()
+    assert isinstance(interpreter.load_syntax_tree('1;2#').paths[0].points[-1], TextNode)
+
+
+def test_syntax_tree_nodes():
+    tree = PathFieldInterpreter().load_syntax_tree('"panel"l&a@10:5(5,p1,top%dash;?hinge,pm,0,10?1;!STR,,50,400;'
+                                                   '1(2(3;#{8,left#oak|m@0:0;*10:0;20:0^|_rect,1,2')
+    assert len(tree) == 3
+    path_node = tree.paths[0]
+    assert path_node.name == 'a'
+    assert path_node.header.type == 'panel' and path_node.header.layers == ['l']
+    assert path_node.is_closed and not path_node.is_mirrored
+    point, include, function, text, closed = path_node.points
+    assert isinstance(point, PointNode)
+    assert (point.x, point.y, point.z, point.curve, point.radius, point.names) == \
+        ('10', '5', None, '(', '5', ['p1', 'top%dash'])
+    assert isinstance(include, IncludeNode)
+    assert (include.marks, include.arguments, include.condition) == (1, ['hinge', 'pm', '0', '10'], '1')
+    assert isinstance(function, FunctionNode) and function.arguments == ['STR', '', '50', '400']
+    assert isinstance(text, TextNode) and text.text == '1(2(3'
+    assert isinstance(closed, ClosedNode)
+    assert (closed.curve, closed.radius, closed.edge, closed.fill) == ('{', '8', 'left', 'oak')
+
+    first, axis, end = tree.paths[1].points
+    assert tree.paths[1].is_mirrored
+    assert not first.mirror_axis and axis.mirror_axis and end.mirror_end
+    assert isinstance(tree.paths[2].points[0], ShapeNode)
+
+
+def test_syntax_tree_edit_and_geometry():
+    interpreter = PathFieldInterpreter()
+    path_field = 'a@0:0;10:0;10:10(5;#|b@0:0;~5:~5'
+    tree = interpreter.load_syntax_tree(path_field)
+    assert tree.paths[0].geometry is None and tree.paths[1].geometry is None
+    assert tree.get_paths(1) == interpreter.load_path(path_field)[1:]
+    assert tree.paths[0].geometry is None
+    paths = tree.get_paths(1)
+    assert tree.get_paths(1) is paths
+
+    tree.paths[1].points[1].x = '~7'
+    tree.paths[0].points[2].radius = '6'
+    assert tree.to_text() == 'a@0:0;10:0;10:10(6;#|b@0:0;~7:~5'
+    assert tree.get_paths(1) is not paths
+    assert tree.get_paths(1)[0].list_of_edges[0].p2.x == 7
+    assert tree.get_paths(0) == interpreter.load_path('a@0:0;10:0;10:10(6;#')
@@ -0,0 +1,79 @@
+import pytest
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.path_field_template import compile_template
+from geometry_utils.pytests.conftest import paths_state
+
+
+def test_template_matches_load_path():
+    template = compile_template('<depth:18>"panel"front&door@0:0;W:0,,bottom%thin;W:H-R;~-R:H)R;R:H(R*2,,top;'
+                                '0:H-R)R;#|handle@X:Y;~40;:~12)6;X;#)6,edge%dash#red')
+    assert template.variable_names == ['H', 'R', 'W', 'X', 'Y']
+    for bindings in ({'W': 400, 'H': 700, 'R': 40, 'X': 60, 'Y': 320},
+                     {'W': 512.345, 'H': 999.999, 'R': 12.5, 'X': -3.333, 'Y': 0}):
+        path_field = ('<depth:18>"panel"front&door@0:0;%(W)r:0,,bottom%%thin;%(W)r:%(H-R)r;~-%(R)r:%(H)r)%(R)r;'
+                      '%(R)r:%(H)r(%(R*2)r,,top;0:%(H-R)r)%(R)r;#|handle@%(X)r:%(Y)r;~40;:~12)6;%(X)r;#)6,edge%%dash#red'
+                      % dict(bindings, **{'H-R': float(bindings['H'] - bindings['R']),
+                                          'R*2': float(bindings['R'] * 2)}))
+        expected = PathFieldInterpreter().load_path(path_field)
+        assert paths_state(template.instantiate(bindings)) == paths_state(expected)
+
+
+def test_template_instances_are_independent():
+    template = compile_template('<k:v>l1,l2&a@0:0;W:0;W:W;#')
+    first, second = template.instantiate({'W': 10})[0], template.instantiate({'W': 20})[0]
+    first.layers.append('l3')
+    first.attributes['k'] = 'changed'
+    first.list_of_edges[0].p1.x = 5
+    assert second.layers == ['l1', 'l2']
+    assert second.attributes == {'k': 'v'}
+    assert second.list_of_edges[0].p1.x == 0
+    assert second.list_of_edges[1].p1.x == 20
+
+
+def test_template_includes():
+    interpreter = PathFieldInterpreter()
+    interpreter.variables = {'notch': ';5;5:5)2;0:5'}
+    template = compile_template(';W;?notch,pp,W-10,0?N;0:20;#', interpreter)
+    for bindings, condition in (({'W': 30, 'N': 1}, '1'), ({'W': 30, 'N': 0}, '0'), ({'W': 50, 'N': 2}, '1')):
+        path_field = ';%r;?notch,pp,%r,0?%s;0:20;#' % (float(bindings['W']), float(bindings['W'] - 10), condition)
+        expected = interpreter.load_path(path_field)
+        assert paths_state(template.instantiate(bindings)) == paths_state(expected)
+
+
+def test_template_point_at_origin():
+    template = compile_template('~-3)3.5;X{20;7')
+    for bindings in ({'X': 0}, {'X': 1}):
+        expected = PathFieldInterpreter().load_path('~-3)3.5;%r{20;7' % float(bindings['X']))
+        paths = template.instantiate(bindings)
+        assert paths_state(paths) == paths_state(expected)
+        first_edge = paths[0].list_of_edges[0]
+        assert first_edge.centre == first_edge.calculate_centre()
+
+
+def test_template_constant_path_field():
+    path_field = 'a@;100;:50)30;0,p,e%s;#(|b@5:5)2|c@0:0;10:0;10:10'
+    template = compile_template(path_field, point_name_prefix='q', round_value=1)
+    assert template.variable_names == []
+    expected = PathFieldInterpreter().load_path(path_field, point_name_prefix='q', round_value=1)
+    assert paths_state(template.instantiate({})) == paths_state(expected)
+
+
+def test_template_missing_variable():
+    with pytest.raises(KeyError):
+        compile_template(';W;W:H;#').instantiate({'W': 1})
+
+
+@pytest.mark.parametrize('path_field', [
+    '0:0;50:0;*50:25;60:40^',
+    '_rect,W,H',
+    ';10;!STR,style,0,0,W,H',
+    ';W+;#',
+    ';W(H)2;#',
+    ';import:1;#',
+    ';W H;#',
+    '#',
+])
+def test_template_rejects(path_field):
+    with pytest.raises(ValueError):
+        compile_template(path_field)
@@ -0,0 +1,56 @@
+import pytest
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.path_field_validator import (PathFieldSyntaxError, find_path_field_error,
+                                                 scan_path_field_headers, validate_path_field)
+
+
+@pytest.mark.parametrize('path_field', ['', '|', ';1:1;2:2;#', 'a@;10;:10;0;#', ';~10;~10:~10;:~-5;#',
+                                        ';10(5;20{5;30}5;40)5;50(;60);#(', '0:0;50:0;*50:25;60:40^',
+                                        '<a:1;b>"extrude"outer@;100;:50;0;#)20,top%dash#red',
+                                        ';100,p1,e1%s1,left,right;100:100(25,p2;0:100,,edge;#',
+                                        '?inc,pp,5,5;10:10;#', ';1.5e2: -3 ;#fill', '1:2:3;4:5:6:7;#'])
+def test_validator_accepts_path_fields_load_path_reads(path_field):
+    assert find_path_field_error(path_field) is None
+    PathFieldInterpreter().load_path(path_field)
+
+
+@pytest.mark.parametrize('path_field, position', [(';10;W:5;#', 4),
+                                                  (';10)5)6;20;#', 5),
+                                                  (';10;:10;0;#|b@;1;2x;#', 18),
+                                                  ('<layer;10;20', 0),
+                                                  ('<a:1>', 5),
+                                                  ('#', 0),
+                                                  (';10;20;x#', 7),
+                                                  ('*1:1;2:2;3', 0),
+                                                  (';10;20,x;30^y', 12),
+                                                  ('?inc,pp,a;10;#', 8),
+                                                  (';10;!str,,a,1;#', 4)])
+def test_validator_reports_first_error(path_field, position):
+    error = find_path_field_error(path_field)
+    assert error.position == position
+    with pytest.raises(PathFieldSyntaxError):
+        validate_path_field(path_field)
+
+
+def test_validator_rejects_what_load_path_rejects():
+    for path_field in (';10)5)6;20;#', ';10;W:5;#', '<a:1>', '#'):
+        assert find_path_field_error(path_field) is not None
+        with pytest.raises(Exception):
+            PathFieldInterpreter().load_path(path_field)
+
+
+def test_scan_headers_match_load_path():
+    path_field = ('<a:1;b>"extrude"outer@;100;:50;0;#||l1,l2&inner@;10;:10;0;#|"t"p@;1;2|;5;6|'
+                  '"5;6;7|<k:v;z>"x"l&n@;1')
+    headers = scan_path_field_headers(path_field, override_data={'inner': {'rename': 'hole'}})
+    paths = PathFieldInterpreter().load_path(path_field, override_data={'inner': {'rename': 'hole'}})
+    assert ([(header.name, header.type, header.layers, header.attributes) for header in headers] ==
+            [(path.name, path.type, path.layers, path.attributes) for path in paths])
+    assert [path_field[header.start:header.end] for header in headers] == [
+        path_str for path_str in path_field.split('|') if path_str]
+
+
+def test_validate_returns_headers():
+    headers = validate_path_field('front@;10;:10;0;#|back@;1;2')
+    assert [header.name for header in headers] == ['front', 'back']
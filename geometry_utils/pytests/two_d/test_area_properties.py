@@ -0,0 +1,82 @@
+import math
+
+import pytest
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.two_d.area_properties import get_area_properties_of_paths
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.packed_path2 import PackedPath2
+from geometry_utils.two_d.path2 import Path2
+from geometry_utils.two_d.point2 import Point2
+
+
+def make_semicircle(radius=3.0):
+    path = Path2()
+    path.list_of_edges = [Edge2(Point2(-1.0, 1.0), Point2(2.0 * radius - 1.0, 1.0)),
+                          Edge2(Point2(2.0 * radius - 1.0, 1.0), Point2(-1.0, 1.0), radius, False)]
+    return path
+
+
+def get_values(properties):
+    if properties is None:
+        return None
+    return properties.area, properties.centroid, properties.ixx, properties.iyy, properties.ixy
+
+
+def test_path2_get_area_properties_of_arcs():
+    properties = make_semicircle(3.0).get_area_properties()
+    assert properties.area == pytest.approx(math.pi * 9.0 / 2.0)
+    assert properties.centroid.x == pytest.approx(2.0)
+    assert properties.centroid.y == pytest.approx(1.0 + 4.0 / math.pi)
+    assert properties.ixx == pytest.approx((math.pi / 8.0 - 8.0 / (9.0 * math.pi)) * 81.0)
+    assert properties.iyy == pytest.approx(math.pi * 81.0 / 8.0)
+    assert properties.ixy == pytest.approx(0.0)
+
+    path = Path2()
+    path.list_of_edges = [Edge2(Point2(0.0, 0.0), Point2(2.0, 0.0), 2.0, True, True),
+                          Edge2(Point2(2.0, 0.0), Point2(0.0, 0.0))]
+    sweep = 2.0 * math.pi - math.pi / 3.0
+    assert path.get_enclosed_area() == pytest.approx(-2.0 * (sweep - math.sin(sweep)))
+
+    circle = PathFieldInterpreter().load_path('c@10:20(5')[0]
+    properties = circle.get_area_properties()
+    assert abs(properties.area) == pytest.approx(math.pi * 25.0)
+    assert properties.centroid == Point2(10.0, 20.0)
+    assert properties.ixx / properties.area == pytest.approx(25.0 / 4.0)
+    assert circle.get_enclosed_area() is None
+
+    # ends that Point2 compares as equal make a whole circle, as Edge2.is_circle finds
+    circle = Path2()
+    circle.list_of_edges = [Edge2(Point2(0.0, 0.0), Point2(1e-12, 0.0), 2.0)]
+    assert circle.is_circle()
+    assert abs(circle.get_area_properties().area) == pytest.approx(math.pi * 4.0)
+    assert PackedPath2.from_path2(circle).get_area_properties().area == circle.get_area_properties().area
+
+
+def test_path2_get_area_properties_of_lines(path2_7):
+    properties = path2_7.get_area_properties()
+    assert properties.area == path2_7.get_enclosed_area() == 1.0
+
+    path = Path2()
+    path.list_of_edges = [Edge2(Point2(0.0, 0.0), Point2(0.0, 2.0)),
+                          Edge2(Point2(0.0, 2.0), Point2(4.0, 2.0)),
+                          Edge2(Point2(4.0, 2.0), Point2(4.0, 0.0)),
+                          Edge2(Point2(4.0, 0.0), Point2(0.0, 0.0))]
+    properties = path.get_area_properties()
+    assert properties.area == -8.0
+    assert properties.centroid == Point2(2.0, 1.0)
+    assert properties.ixx == pytest.approx(-4.0 * 8.0 / 12.0)
+    assert properties.iyy == pytest.approx(-16.0 * 8.0 / 12.0)
+
+    path.list_of_edges.pop()
+    assert path.get_area_properties() is None
+
+
+def test_get_area_properties_of_paths():
+    paths = PathFieldInterpreter().load_path('a@0:0;100:0;100:50(30;0:50;#|b@0:0;10:0;10:10;#|c@0:0;5:5')
+    packed_paths = [PackedPath2.from_path2(path) for path in paths]
+    assert ([get_values(properties) for properties in get_area_properties_of_paths(packed_paths)] ==
+            [get_values(properties) for properties in get_area_properties_of_paths(paths)])
+    assert [path.get_enclosed_area() for path in packed_paths] == [path.get_enclosed_area() for path in paths]
+    assert get_area_properties_of_paths(paths)[1].area == 50.0
+    assert get_area_properties_of_paths(paths)[2] is None
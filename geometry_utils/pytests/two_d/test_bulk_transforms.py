@@ -0,0 +1,102 @@
+import pytest
+
+from geometry_utils.two_d.bulk_transforms import mirror_paths, offset_paths, rotate_paths, transform_paths
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.matrix3 import Matrix3
+from geometry_utils.two_d.packed_path2 import PackedPath2
+from geometry_utils.two_d.path2 import Path2
+from geometry_utils.two_d.point2 import Point2
+from geometry_utils.two_d.vector2 import Vector2
+
+
+def make_path():
+    path = Path2()
+    path.list_of_edges = [Edge2(Point2(0.0, 0.0), Point2(10.0, 0.0)),
+                          Edge2(Point2(10.0, 0.0), Point2(10.0, 10.0), 6.0, True, False),
+                          Edge2(Point2(10.0, 10.0), Point2(0.0, 0.0), 8.0, False, True)]
+    return path
+
+
+def assert_consistent(path, clockwise):
+    assert [edge.clockwise for edge in path.list_of_edges] == clockwise
+    for edge in path.list_of_edges:
+        assert edge.centre == edge.calculate_centre()
+
+
+def test_rotate_paths(backend):
+    path = make_path()
+    expected = make_path().rotate(30.0)
+    rotate_paths(path, 30.0)
+    assert path == expected
+    assert_consistent(path, [False, True, False])
+
+    path = make_path()
+    rotate_paths(path, 90.0, Vector2(5.0, 5.0))
+    assert path.list_of_edges[0].p1 == Point2(10.0, 0.0)
+    assert path.list_of_edges[0].p2 == Point2(10.0, 10.0)
+    assert_consistent(path, [False, True, False])
+
+
+def test_mirror_paths_flip_arcs(backend):
+    for axis, clockwise in (('x', [False, False, True]), ('y', [False, False, True]),
+                            ('origin', [False, True, False])):
+        path = make_path()
+        mirror_paths(path, axis)
+        assert_consistent(path, clockwise)
+    path = make_path()
+    mirror_paths(path, 'x')
+    assert path.list_of_edges[1].p2 == Point2(10.0, -10.0)
+
+
+def test_offset_and_transform_paths(backend):
+    path = make_path()
+    offset_paths(path, Vector2(1.0, 2.0), 'pm')
+    assert path.list_of_edges[0].p2 == Point2(-9.0, 2.0)
+    assert_consistent(path, [False, False, True])
+
+    path = make_path()
+    transform_paths(path, Matrix3([[2.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 1.0]]))
+    assert path.list_of_edges[1].radius == 12.0
+    assert_consistent(path, [False, True, False])
+
+    with pytest.raises(ValueError):
+        transform_paths(path, Matrix3([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 0.0, 1.0]]))
+    with pytest.raises(TypeError):
+        offset_paths(path, 1.0)
+
+
+def test_transform_paths_moves_shared_points_once(backend):
+    shared_point = Point2(1.0, 1.0)
+    first_path = Path2()
+    first_path.list_of_edges = [Edge2(Point2(0.0, 0.0), shared_point)]
+    second_path = Path2()
+    second_path.list_of_edges = [Edge2(shared_point, Point2(2.0, 0.0))]
+    offset_paths([first_path, second_path], Vector2(1.0, 0.0))
+    assert shared_point == Point2(2.0, 1.0)
+    assert second_path.list_of_edges[0].p2 == Point2(3.0, 0.0)
+
+
+def test_transform_packed_paths(backend):
+    packed_paths = [PackedPath2.from_path2(make_path()), PackedPath2(), PackedPath2.from_path2(make_path())]
+    mirror_paths(packed_paths, 'y')
+    expected = mirror_paths(make_path(), 'y')
+    for packed_path in (packed_paths[0], packed_paths[2]):
+        assert packed_path == expected
+        assert [edge.clockwise for edge in packed_path.to_path2().list_of_edges] == [False, False, True]
+
+
+def test_transform_paths_rejects_stretched_arcs(backend):
+    stretch = Matrix3([[2.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    shear = Matrix3([[1.0, 0.5, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    for matrix in (stretch, shear):
+        path = make_path()
+        with pytest.raises(ValueError):
+            transform_paths([PackedPath2(), path], matrix)
+        assert path == make_path()
+        with pytest.raises(ValueError):
+            transform_paths(PackedPath2.from_path2(make_path()), matrix)
+
+    path = Path2()
+    path.list_of_edges = [Edge2(Point2(0.0, 0.0), Point2(2.0, 0.0)), Edge2(Point2(2.0, 0.0), Point2(2.0, 2.0))]
+    transform_paths(path, stretch)
+    assert path.list_of_edges[1].p2 == Point2(4.0, 2.0)
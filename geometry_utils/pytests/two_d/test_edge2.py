@@ -7,6 +7,7 @@ from geometry_utils.two_d.matrix3 import Matrix3
 from geometry_utils.two_d.point2 import Point2
 from geometry_utils.two_d.vector2 import Vector2
 from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.ellipse import Ellipse
 from geometry_utils.maths_utility import floats_are_close, QUARTER_PI, PI
 
 
@@ -405,6 +406,18 @@ def test_edge2_calculate_arc_centre(test_edge2_2):
     assert test_edge2_2.calculate_centre() == Point2(1.0, 1.0)
 
 
+@pytest.mark.parametrize('radius', [0.5, 1.0, 2.5, 40.0])
+@pytest.mark.parametrize('clockwise', [False, True])
+@pytest.mark.parametrize('large', [False, True])
+def test_edge2_calculate_arc_centre_matches_ellipse(radius, clockwise, large):
+    # a radius of 0.5 is too short to reach p2 and is grown until it does
+    edge = Edge2(Point2(-1.25, 3.0), Point2(0.5, 2.2), radius, clockwise, large)
+    ellipse = Ellipse(start=edge.p1, end=edge.p2, major_radius=radius, minor_radius=radius, clockwise=clockwise,
+                      large_arc=large, angle=0.0)
+    centre = edge.calculate_centre()
+    assert (centre.x, centre.y) == (ellipse.centre.x, ellipse.centre.y)
+
+
 def test_edge2_get_edge_bounds(test_edge2_2):
     assert test_edge2_2.get_edge_bounds() == AxisAlignedBox2(Point2(0.0, 0.0), Point2(2.0, 2.0))
 
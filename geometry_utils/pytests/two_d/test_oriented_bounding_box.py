@@ -0,0 +1,56 @@
+import math
+
+import pytest
+
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.oriented_bounding_box import get_minimum_area_box, get_oriented_bounding_boxes
+from geometry_utils.two_d.packed_path2 import PackedPath2
+from geometry_utils.two_d.path2 import Path2
+from geometry_utils.two_d.point2 import Point2
+
+
+def make_path(coordinates, angle=0.0):
+    cos_angle = math.cos(math.radians(angle))
+    sin_angle = math.sin(math.radians(angle))
+    points = [Point2(x * cos_angle - y * sin_angle, x * sin_angle + y * cos_angle) for x, y in coordinates]
+    path = Path2()
+    path.list_of_edges = [Edge2(point, next_point.clone())
+                          for point, next_point in zip(points, points[1:] + points[:1])]
+    return path
+
+
+def test_path2_get_oriented_bounding_box():
+    for angle in (0.0, 30.0, 100.0):
+        box = make_path([(0.0, 0.0), (4.0, 0.0), (4.0, 2.0), (1.0, 1.0), (0.0, 2.0)], angle).get_oriented_bounding_box()
+        assert box.area == pytest.approx(8.0)
+        assert box.get_smallest_angle_to_align_box() == pytest.approx(math.radians(angle if angle < 45.0 else 10.0))
+
+    box = make_path([(0.0, 0.0), (3.0, 0.0), (3.0, 1.0), (2.0, 2.0), (0.0, 1.0)]).get_oriented_bounding_box()
+    assert box.area == pytest.approx(6.0)
+    hull = make_path([(0.0, 0.0), (3.0, 0.0), (3.0, 1.0), (2.0, 2.0), (0.0, 1.0)]).get_convex_hull_coordinates()
+    assert hull == [(0.0, 1.0), (0.0, 0.0), (3.0, 0.0), (3.0, 1.0), (2.0, 2.0)]
+    assert box.U[0].dot(box.U[1]) == 0.0
+    assert box.U0_square_length == box.U[0].square_length()
+
+    with pytest.raises(IndexError):
+        make_path([(0.0, 0.0), (1.0, 0.0)]).get_oriented_bounding_box()
+
+
+def test_get_minimum_area_box_of_points_and_lines():
+    assert get_minimum_area_box([]).area == 0.0
+    assert get_minimum_area_box([(1.0, 1.0)]).area == 0.0
+    box = get_minimum_area_box([(0.0, 0.0), (2.0, 2.0)])
+    assert box.area == 0.0
+    assert box.get_smallest_angle_to_align_box() == pytest.approx(math.pi / 4.0)
+
+
+def test_get_oriented_bounding_boxes():
+    paths = [make_path([(0.0, 0.0), (4.0, 0.0), (4.0, 2.0), (0.0, 2.0)], angle) for angle in range(0, 90, 7)]
+    paths.append(make_path([(0.0, 0.0), (5.0, 0.0), (5.0, 0.0)]))
+    boxes = get_oriented_bounding_boxes(paths + [PackedPath2.from_path2(path) for path in paths])
+    assert len(boxes) == 2 * len(paths)
+    for box, packed_box in zip(boxes[:len(paths)], boxes[len(paths):]):
+        assert box.area == packed_box.area
+        assert box.index == packed_box.index
+    assert [box.area for box in boxes[:len(paths) - 1]] == pytest.approx([8.0] * (len(paths) - 1))
+    assert boxes[len(paths) - 1].area == 0.0
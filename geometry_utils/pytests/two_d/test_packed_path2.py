@@ -0,0 +1,67 @@
+import pytest
+
+from geometry_utils.path_field_interpreter import PathFieldInterpreter
+from geometry_utils.two_d.axis_aligned_box2 import AxisAlignedBox2
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.packed_path2 import PackedPath2
+from geometry_utils.two_d.path2 import Path2
+from geometry_utils.two_d.point2 import Point2
+
+
+def get_values(path):
+    values = [path.name, path.type, path.fill, list(path.layers), path.attributes, path.closed]
+    for edge in path.list_of_edges:
+        values.append([(point.x, point.y, point.w, point.name) for point in (edge.p1, edge.p2, edge.centre)] +
+                      [edge.centre is edge.p1, edge.centre is edge.p2, edge.p2 is edge.p1, edge.radius,
+                       edge.clockwise, edge.large, edge.name, edge.style, edge.type, edge.left_name, edge.right_name])
+    return values
+
+
+def test_packed_path2_round_trip():
+    interpreter = PathFieldInterpreter()
+    for path in interpreter.load_path('<k:v>"panel"a,b&outer@0:0,p;100:0,,bottom%dash,l,r;100:50(30,c2;0:50;#,left#oak|'
+                                      'open@0:0;~10:~5{8;20:0|circle@0:0(5'):
+        packed_path = PackedPath2.from_path2(path)
+        assert get_values(packed_path.to_path2()) == get_values(path)
+        assert packed_path == path
+
+    path = Path2()
+    edge = Edge2(Point2(1.0, 2.0, 2), Point2(3.0, 4.0), 2.5, True, True)
+    edge.centre.name = 'c'
+    edge.type = 'hinge'
+    shared_point = Point2(5.0, 5.0)
+    path.list_of_edges = [edge, Edge2(shared_point, shared_point)]
+    packed_path = PackedPath2.from_path2(path)
+    assert packed_path.point_names is None
+    assert get_values(packed_path.to_path2()) == get_values(path)
+
+
+def test_packed_path2_rejects_text_coordinates():
+    path = Path2()
+    edge = Edge2(Point2(), Point2())
+    edge.p1.x = 'width'
+    path.list_of_edges = [edge]
+    with pytest.raises(TypeError):
+        PackedPath2.from_path2(path)
+
+
+def test_packed_path2_queries(path2_1, path2_3, path2_6, path2_7, path2_8):
+    for path in (path2_1, path2_3, path2_6, path2_7, path2_8, Path2()):
+        packed_path = PackedPath2.from_path2(path)
+        assert packed_path.path_length == len(packed_path) == path.path_length
+        assert packed_path.is_closed == path.is_closed
+        assert packed_path.is_continuous == path.is_continuous
+        assert packed_path.to_tuple_list() == path.to_tuple_list()
+        assert packed_path.get_list_of_points() == path.get_list_of_points()
+        assert packed_path.is_circle() == path.is_circle()
+        assert packed_path.is_incomplete_circle() == path.is_incomplete_circle()
+        assert packed_path.is_quadrilateral() == path.is_quadrilateral()
+        assert packed_path.get_enclosed_area() == path.get_enclosed_area()
+    assert PackedPath2.from_path2(path2_8).get_bounds() == AxisAlignedBox2(Point2(0.0, 0.0), Point2(1.0, 1.5))
+    assert PackedPath2.from_path2(path2_7).get_last_edge() == path2_7.get_last_edge()
+    with pytest.raises(IndexError):
+        PackedPath2().get_first_edge()
+    with pytest.raises(IndexError):
+        return PackedPath2.from_path2(path2_1) == path2_7
+    with pytest.raises(TypeError):
+        return PackedPath2.from_path2(path2_1) == 9.0
@@ -290,6 +290,55 @@ def test_path2_make_continuous():
                                      Edge2(Point2(2.0, 2.0), Point2(0.0, 0.0))]
 
 
+def test_path2_append_continuous():
+    path = Path2()
+    path.append_continuous(Edge2(Point2(0.0, 0.0), Point2(0.0, 0.0)))
+    path.append_continuous(Edge2(Point2(2.0, 0.0), Point2(0.0, 0.0), 1.0, True))
+    path.append_continuous(Edge2(Point2(2.0, 2.0), Point2(0.0, 0.0)))
+
+    continuous_path = Path2()
+    continuous_path.list_of_edges = [Edge2(Point2(0.0, 0.0), Point2(2.0, 0.0), 1.0, True),
+                                     Edge2(Point2(2.0, 0.0), Point2(2.0, 2.0)),
+                                     Edge2(Point2(2.0, 2.0), Point2(0.0, 0.0))]
+    assert path == continuous_path
+    assert path.list_of_edges[0].centre == Point2(1.0, 0.0)
+    assert path.list_of_edges[1].centre == Point2(2.0, 1.0)
+    # each joined end is a copy of the next start, so moving one does not move the other
+    assert path.list_of_edges[0].p2 is not path.list_of_edges[1].p1
+    assert type(path.list_of_edges[0].p2) is Point2
+
+
+def test_path2_append_continuous_matches_make_continuous():
+    points = [(0.0, 0.0, 0), (10.0, 0.0, 0), (10.0, 10.0, 6.0), (0.0, 0.0, 0), (0.0, 10.0, 20.0), (5.0, 5.0, 0)]
+    path = Path2()
+    appended_path = Path2()
+    for x, y, radius in points:
+        path.list_of_edges.append(Edge2(Point2(x, y), Point2(), radius))
+        path.make_continuous()
+        appended_path.append_continuous(Edge2(Point2(x, y), Point2(), radius))
+    assert path == appended_path
+    for edge, appended_edge in zip(path.list_of_edges, appended_path.list_of_edges):
+        assert edge.centre == appended_edge.centre
+
+
+def test_path2_append_continuous_point_at_origin():
+    # the parser sets the radius after making each edge, so its centre is only found when the edge is joined
+    path = Path2()
+    for x, radius in ((-3.0, 3.5), (0.0, 20.0), (7.0, 0)):
+        edge = Edge2(Point2(x, 0.0), Point2())
+        edge.radius = radius
+        path.append_continuous(edge)
+    for edge in path.list_of_edges[:-1]:
+        assert edge.centre == edge.calculate_centre()
+    assert path.list_of_edges[0].centre != Point2(-3.0, 0.0)
+
+    # an edge put straight onto the list is still joined when the next edge starts at the origin
+    path.list_of_edges.append(Edge2(Point2(5.0, 5.0), Point2()))
+    path.append_continuous(Edge2(Point2(0.0, 0.0), Point2()))
+    assert path.list_of_edges[2].p2 == Point2(5.0, 5.0)
+    assert path.list_of_edges[3].p2 == Point2(0.0, 0.0)
+
+
 def test_path2_is_circle(path2_6):
     assert path2_6.is_circle()
 
@@ -407,15 +456,18 @@ def test_path2_transform(test_matrix3_3):
                           Edge2(Point2(1.0, 1.0), Point2(0.0, 1.0), 0.5),
                           Edge2(Point2(0.0, 1.0), Point2(0.0, 0.0))]
 
+    area = path.get_enclosed_area()
     path.transform(test_matrix3_3)
 
+    # a half turn keeps the arc bulging out of the square, anticlockwise
     transformed_path = Path2()
     transformed_path.list_of_edges = [Edge2(Point2(0.0, 0.0), Point2(-1.0, 0.0)),
                                       Edge2(Point2(-1.0, 0.0), Point2(-1.0, -1.0)),
-                                      Edge2(Point2(-1.0, -1.0), Point2(0.0, -1.0), 0.5, True),
+                                      Edge2(Point2(-1.0, -1.0), Point2(0.0, -1.0), 0.5),
                                       Edge2(Point2(0.0, -1.0), Point2(0.0, 0.0))]
 
     assert path == transformed_path
+    assert path.get_enclosed_area() == pytest.approx(area)
 
 
 def test_path2_get_convex_hull():
@@ -432,3 +484,113 @@ def test_path2_get_convex_hull():
                                  Edge2(Point2(1.0, 1.0), Point2(0.0, 1.0))]
 
     assert path.get_convex_hull() == convex_hull
+
+
+def test_path2_get_convex_hull_drops_inner_collinear_and_repeated_points():
+    path = Path2()
+    path.list_of_edges = [Edge2(Point2(0.0, 0.0), Point2(1.0, 0.0)),
+                          Edge2(Point2(1.0, 0.0), Point2(2.0, 0.0)),
+                          Edge2(Point2(2.0, 0.0), Point2(2.0, 0.0)),
+                          Edge2(Point2(2.0, 0.0), Point2(1.0, 0.5)),
+                          Edge2(Point2(1.0, 0.5), Point2(1.0, 2.0)),
+                          Edge2(Point2(1.0, 2.0), Point2(0.0, 0.0))]
+    convex_hull = path.get_convex_hull()
+    assert convex_hull.to_tuple_list() == [((0.0, 0.0), (2.0, 0.0)), ((2.0, 0.0), (1.0, 2.0)),
+                                           ((1.0, 2.0), (0.0, 0.0))]
+    assert convex_hull.list_of_edges[0].p1 is path.list_of_edges[0].p1
+    assert convex_hull.is_closed
+
+
+def test_path2_get_convex_hull_include_arcs():
+    path = Path2()
+    path.list_of_edges = [Edge2(Point2(0.0, 0.0), Point2(2.0, 0.0)),
+                          Edge2(Point2(2.0, 0.0), Point2(2.0, 2.0)),
+                          Edge2(Point2(2.0, 2.0), Point2(0.0, 2.0), 1.0, False),
+                          Edge2(Point2(0.0, 2.0), Point2(0.0, 0.0))]
+    assert path.get_convex_hull().path_length == 4
+
+    convex_hull = path.get_convex_hull(True, 0.001)
+    assert convex_hull.get_bounds() == AxisAlignedBox2(Point2(0.0, 0.0), Point2(2.0, 3.0))
+    for edge in convex_hull.list_of_edges:
+        if edge.p1.y > 2.0:
+            assert edge.p1.distance_to(Point2(1.0, 2.0)) == pytest.approx(1.0)
+            middle = Point2((edge.p1.x + edge.p2.x) * 0.5, (edge.p1.y + edge.p2.y) * 0.5)
+            assert 1.0 - middle.distance_to(Point2(1.0, 2.0)) <= 0.001
+
+    with pytest.raises(ValueError):
+        path.get_convex_hull(True, 0.0)
+
+
+def test_path2_clone(path2_8):
+    path = path2_8.clone()
+    assert path == path2_8
+    assert path.list_of_edges[0] is not path2_8.list_of_edges[0]
+    assert path.list_of_edges[0].p1 is not path2_8.list_of_edges[0].p1
+    path.list_of_edges[0].p1.x = 10.0
+    assert path2_8.list_of_edges[0].p1.x == 0.0
+
+
+def make_triangle():
+    path = Path2()
+    path.list_of_edges = [Edge2(Point2(0.0, 0.0), Point2(2.0, 0.0)),
+                          Edge2(Point2(2.0, 0.0), Point2(2.0, 1.0)),
+                          Edge2(Point2(2.0, 1.0), Point2(0.0, 0.0))]
+    return path
+
+
+def test_path2_derived_properties_follow_edits_in_place():
+    path = make_triangle()
+    assert path.is_closed
+    path.list_of_edges[2].p2.x = 9.0
+    assert not path.is_closed
+    assert path.get_enclosed_area() is None
+
+    path = make_triangle()
+    assert path.get_bounds() == AxisAlignedBox2(Point2(0.0, 0.0), Point2(2.0, 1.0))
+    for edge in path.list_of_edges:
+        edge.offset(Vector2(1.0, 0.0))
+    assert path.get_bounds() == AxisAlignedBox2(Point2(1.0, 0.0), Point2(3.0, 1.0))
+
+
+def test_path2_caches_derived_properties():
+    path = make_triangle()
+    path.cache_properties = True
+    assert path.is_closed
+    assert path.get_enclosed_area() == 1.0
+    assert path.get_cached('is_closed', lambda: None) is True
+    path.get_bounds().include(Point2(5.0, 5.0))
+    assert path.get_bounds() == AxisAlignedBox2(Point2(0.0, 0.0), Point2(2.0, 1.0))
+    path.get_list_of_points().pop()
+    assert len(path.get_list_of_points()) == 4
+
+    version = path.version
+    path.offset(Vector2(1.0, 0.0))
+    assert path.version > version
+    assert path.get_bounds() == AxisAlignedBox2(Point2(1.0, 0.0), Point2(3.0, 1.0))
+
+    path.list_of_edges.append(Edge2(Point2(0.0, 0.0), Point2(0.0, 5.0)))
+    assert not path.is_closed
+    del path.list_of_edges[-1]
+    assert path.is_closed
+
+    path.list_of_edges[2].p2.x = 9.0
+    assert not path.invalidate().is_closed
+    assert path.get_enclosed_area() is None
+
+
+def test_path2_repairs_ignore_cached_properties():
+    path = make_triangle()
+    path.cache_properties = True
+    assert path.is_continuous and path.is_closed
+    path.list_of_edges[1].p1 = Point2(5.0, 5.0)
+    path.make_continuous()
+    assert path.list_of_edges[0].p2 == Point2(5.0, 5.0)
+    assert path.is_continuous
+
+    path = make_triangle()
+    path.cache_properties = True
+    assert path.is_closed
+    path.list_of_edges[2].p2 = Point2(0.0, 1.0)
+    path.close_path()
+    assert path.path_length == 4
+    assert path.is_closed
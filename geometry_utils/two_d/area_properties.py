@@ -0,0 +1,121 @@
+from math import atan2, cos, sin, sqrt
+
+from geometry_utils.maths_utility import DOUBLE_EPSILON, TWO_PI, floats_are_close
+from geometry_utils.two_d.point2 import Point2
+
+
+class AreaProperties2(object):
+    """
+    The area, centroid and second moments of the region inside a closed path, signed like the area:
+    positive when the path goes counterclockwise, negative when it goes clockwise
+
+    Attributes:
+    ___________
+    area: float
+        the signed area
+    centroid: Point2
+        the centroid of the region, None when the area is 0.0
+    ixx: float
+        the second moment about the line through the centroid along the x axis, the integral of (y - centroid y) ** 2
+    iyy: float
+        the second moment about the line through the centroid along the y axis, the integral of (x - centroid x) ** 2
+    ixy: float
+        the product moment about the centroid, the integral of (x - centroid x) * (y - centroid y)
+    """
+
+    __slots__ = ('area', 'centroid', 'ixx', 'iyy', 'ixy')
+
+    def __init__(self, integrals):
+        """
+        :param integrals: the integrals of 1, x, y, x ** 2, y ** 2 and x * y over the region, as integrate_edges returns
+        :type  integrals: tuple
+        """
+        area, integral_x, integral_y, integral_xx, integral_yy, integral_xy = integrals
+        self.area = area
+        if area == 0.0:
+            self.centroid = None
+            self.ixx = self.iyy = self.ixy = 0.0
+        else:
+            centroid_x = integral_x / area
+            centroid_y = integral_y / area
+            self.centroid = Point2(centroid_x, centroid_y)
+            self.ixx = integral_yy - centroid_y * integral_y
+            self.iyy = integral_xx - centroid_x * integral_x
+            self.ixy = integral_xy - centroid_x * integral_y
+
+
+def integrate_edges(edges):
+    """
+    Integrates 1, x, y, x ** 2, y ** 2 and x * y over the region inside a closed list of edges, in one pass with Green's
+    theorem. Each line adds the integrals over the triangle between the origin and the line. Each arc adds the
+    triangles to and from its centre and the exact integrals over the sector of the circle between them,
+    so arcs are neither copied nor flattened.
+
+    :param edges: p1 x and y, p2 x and y, centre x and y, radius and clockwise of each edge
+    :type  edges: iterable
+    :return: the signed integrals of 1, x, y, x ** 2, y ** 2 and x * y
+    :rtype: tuple
+    """
+    area = integral_x = integral_y = integral_xx = integral_yy = integral_xy = 0.0
+    for x1, y1, x2, y2, centre_x, centre_y, radius, clockwise in edges:
+        if radius > DOUBLE_EPSILON:
+            if floats_are_close(x1, x2) and floats_are_close(y1, y2):
+                # a circle around its centre, with ends equal as Point2 compares them
+                lines = ()
+                start_angle = 0.0
+                sweep = -TWO_PI if clockwise else TWO_PI
+            else:
+                lines = ((x1, y1, centre_x, centre_y), (centre_x, centre_y, x2, y2))
+                # the distance to the start point, rather than the radius, for arcs too short for their radius
+                radius = sqrt((x1 - centre_x) ** 2 + (y1 - centre_y) ** 2)
+                start_angle = atan2(y1 - centre_y, x1 - centre_x)
+                end_angle = atan2(y2 - centre_y, x2 - centre_x)
+                if clockwise:
+                    sweep = -((start_angle - end_angle) % TWO_PI)
+                else:
+                    sweep = (end_angle - start_angle) % TWO_PI
+            end_angle = start_angle + sweep
+
+            # the sector integrals about the centre of the circle
+            square_radius = radius * radius
+            sector_area = square_radius * sweep * 0.5
+            sector_x = square_radius * radius * (sin(end_angle) - sin(start_angle)) / 3.0
+            sector_y = square_radius * radius * (cos(start_angle) - cos(end_angle)) / 3.0
+            double_angle_sines = (sin(2.0 * end_angle) - sin(2.0 * start_angle)) * 0.5
+            eighth_radius_4 = square_radius * square_radius * 0.125
+            sector_xx = eighth_radius_4 * (sweep + double_angle_sines)
+            sector_yy = eighth_radius_4 * (sweep - double_angle_sines)
+            sector_xy = eighth_radius_4 * (sin(end_angle) ** 2 - sin(start_angle) ** 2)
+
+            area += sector_area
+            integral_x += sector_x + centre_x * sector_area
+            integral_y += sector_y + centre_y * sector_area
+            integral_xx += sector_xx + 2.0 * centre_x * sector_x + centre_x * centre_x * sector_area
+            integral_yy += sector_yy + 2.0 * centre_y * sector_y + centre_y * centre_y * sector_area
+            integral_xy += (sector_xy + centre_x * sector_y + centre_y * sector_x +
+                            centre_x * centre_y * sector_area)
+        else:
+            lines = ((x1, y1, x2, y2),)
+
+        for start_x, start_y, end_x, end_y in lines:
+            cross = start_x * end_y - end_x * start_y
+            area += cross * 0.5
+            integral_x += (start_x + end_x) * cross / 6.0
+            integral_y += (start_y + end_y) * cross / 6.0
+            integral_xx += (start_x * start_x + start_x * end_x + end_x * end_x) * cross / 12.0
+            integral_yy += (start_y * start_y + start_y * end_y + end_y * end_y) * cross / 12.0
+            integral_xy += ((start_x * end_y + 2.0 * (start_x * start_y + end_x * end_y) + end_x * start_y) *
+                            cross / 24.0)
+    return area, integral_x, integral_y, integral_xx, integral_yy, integral_xy
+
+
+def get_area_properties_of_paths(paths):
+    """
+    Finds the area, centroid and second moments of each of a list of paths
+
+    :param paths: the Path2s or PackedPath2s
+    :type  paths: list
+    :return: the AreaProperties2 of each path, None for a path that is not closed
+    :rtype: list
+    """
+    return [path.get_area_properties() for path in paths]
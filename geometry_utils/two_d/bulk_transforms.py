@@ -0,0 +1,266 @@
+from math import sqrt
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from geometry_utils.maths_utility import DOUBLE_EPSILON, EPSILON, floats_are_close
+from geometry_utils.two_d.matrix3 import Matrix3
+from geometry_utils.two_d.packed_path2 import CLOCKWISE, EDGE_VALUES, is_packed_path2
+from geometry_utils.two_d.vector2 import Vector2, is_vector2
+
+# Matrix3 values of the mirrors of Path2.mirror_x, mirror_y and mirror_origin
+MIRROR_VALUES = {'x': [[1.0, 0.0, 0.0], [0.0, -1.0, 0.0], [0.0, 0.0, 1.0]],
+                 'y': [[-1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+                 'origin': [[-1.0, 0.0, 0.0], [0.0, -1.0, 0.0], [0.0, 0.0, 1.0]]}
+
+# The mirror applied before the offset for each point type of Path2.offset
+OFFSET_MIRRORS = {'pp': None, 'mm': 'origin', 'pm': 'y', 'mp': 'x'}
+
+
+def multiply_values(left, right):
+    """
+    Returns the values of the product of two 3 x 3 matrices, the matrix on the right being applied first
+    """
+    return [[sum(left[i][k] * right[k][j] for k in range(3)) for j in range(3)] for i in range(3)]
+
+
+def get_affine_values(transformation_matrix):
+    """
+    Returns the values of a Matrix3 that move a point, which must leave w at 1
+
+    :return: a, b, c, d, e, f where x' = a * x + b * y + c and y' = d * x + e * y + f
+    :rtype: tuple
+    :raises: ValueError: the matrix is not affine
+    """
+    (a, b, c), (d, e, f), bottom_row = transformation_matrix.vals
+    if list(bottom_row) != [0, 0, 1]:
+        raise ValueError('Bulk transforms need an affine matrix, with a bottom row of 0, 0, 1')
+    return float(a), float(b), float(c), float(d), float(e), float(f)
+
+
+def transform_coordinates(x_values, y_values, affine_values):
+    """
+    Moves lists of coordinates as Matrix3 moves points, setting the values Point2.accuracy_fix would set to 0.0
+
+    :return: the new x and y values
+    :rtype: tuple
+    """
+    a, b, c, d, e, f = affine_values
+    if numpy is not None:
+        x_values = numpy.asarray(x_values, dtype=float)
+        y_values = numpy.asarray(y_values, dtype=float)
+        new_x = a * x_values + b * y_values + c
+        new_y = d * x_values + e * y_values + f
+        new_x[numpy.abs(new_x) < EPSILON] = 0.0
+        new_y[numpy.abs(new_y) < EPSILON] = 0.0
+        return new_x.tolist(), new_y.tolist()
+
+    new_x = []
+    new_y = []
+    for x, y in zip(x_values, y_values):
+        x, y = a * x + b * y + c, d * x + e * y + f
+        new_x.append(0.0 if -EPSILON < x < EPSILON else x)
+        new_y.append(0.0 if -EPSILON < y < EPSILON else y)
+    return new_x, new_y
+
+
+def is_similarity(affine_values):
+    """
+    Tests if a matrix keeps the shape of circles, scaling, rotating, mirroring and moving them but not
+    stretching or shearing them
+    """
+    a, b, _, d, e, _ = affine_values
+    return ((floats_are_close(a, e) and floats_are_close(b, -d)) or
+            (floats_are_close(a, -e) and floats_are_close(b, d)))
+
+
+def has_arcs(path):
+    if is_packed_path2(path):
+        return any(radius > DOUBLE_EPSILON for radius in path.values[6::EDGE_VALUES])
+    return any(edge.radius > DOUBLE_EPSILON for edge in path.list_of_edges)
+
+
+def get_radius_scale(affine_values):
+    """
+    Returns the scale of the radii of arcs moved by a matrix, 1.0 when the matrix keeps lengths
+    """
+    a, b, _, d, e, _ = affine_values
+    determinant = a * e - b * d
+    if floats_are_close(abs(determinant), 1.0):
+        return 1.0
+    return sqrt(abs(determinant))
+
+
+def transform_path2s(paths, affine_values):
+    """
+    Moves every point of Path2s in place. A point shared by edges or paths is moved once.
+    """
+    a, b, _, d, e, _ = affine_values
+    flip_arcs = a * e - b * d < 0
+    radius_scale = get_radius_scale(affine_values)
+
+    points = []
+    seen = set()
+    add_seen = seen.add
+    arcs = []
+    for path in paths:
+        for edge in path.list_of_edges:
+            for point in (edge.p1, edge.p2, edge.centre):
+                if id(point) not in seen:
+                    add_seen(id(point))
+                    points.append(point)
+            if edge.radius > DOUBLE_EPSILON:
+                arcs.append(edge)
+        path.invalidate()
+
+    new_x, new_y = transform_coordinates([point.x for point in points], [point.y for point in points],
+                                         affine_values)
+    for point, x, y in zip(points, new_x, new_y):
+        point.x = x
+        point.y = y
+
+    for edge in arcs:
+        if flip_arcs:
+            edge.clockwise = not edge.clockwise
+        if radius_scale != 1.0:
+            edge.radius *= radius_scale
+
+
+def transform_packed_paths(packed_paths, affine_values):
+    """
+    Moves the points of PackedPath2s in place, in one NumPy operation over all their values
+    """
+    a, b, _, d, e, _ = affine_values
+    flip_arcs = a * e - b * d < 0
+    radius_scale = get_radius_scale(affine_values)
+
+    if numpy is None:
+        c = affine_values[2]
+        f = affine_values[5]
+        for packed_path in packed_paths:
+            values = packed_path.values
+            for offset in range(0, len(values), EDGE_VALUES):
+                for point_offset in (offset, offset + 2, offset + 4):
+                    x = values[point_offset]
+                    y = values[point_offset + 1]
+                    x, y = a * x + b * y + c, d * x + e * y + f
+                    values[point_offset] = 0.0 if -EPSILON < x < EPSILON else x
+                    values[point_offset + 1] = 0.0 if -EPSILON < y < EPSILON else y
+                radius = values[offset + 6]
+                if radius > DOUBLE_EPSILON:
+                    if flip_arcs:
+                        packed_path.flags[offset // EDGE_VALUES] ^= CLOCKWISE
+                    if radius_scale != 1.0:
+                        values[offset + 6] = radius * radius_scale
+        return
+
+    packed_paths = [packed_path for packed_path in packed_paths if len(packed_path.values)]
+    if not packed_paths:
+        return
+    all_values = numpy.concatenate([numpy.frombuffer(packed_path.values, dtype=float)
+                                    for packed_path in packed_paths]).reshape(-1, EDGE_VALUES)
+    x_values = all_values[:, 0:6:2]
+    y_values = all_values[:, 1:6:2]
+    new_x = a * x_values + b * y_values + affine_values[2]
+    new_y = d * x_values + e * y_values + affine_values[5]
+    new_x[numpy.abs(new_x) < EPSILON] = 0.0
+    new_y[numpy.abs(new_y) < EPSILON] = 0.0
+    all_values[:, 0:6:2] = new_x
+    all_values[:, 1:6:2] = new_y
+    is_arc = all_values[:, 6] > DOUBLE_EPSILON
+    if radius_scale != 1.0:
+        all_values[is_arc, 6] *= radius_scale
+    all_flags = None
+    if flip_arcs:
+        all_flags = numpy.concatenate([numpy.frombuffer(packed_path.flags, dtype=numpy.uint8)
+                                       for packed_path in packed_paths])
+        all_flags[is_arc] ^= CLOCKWISE
+
+    start = 0
+    for packed_path in packed_paths:
+        number_of_edges = len(packed_path.flags)
+        end = start + number_of_edges
+        numpy.frombuffer(packed_path.values, dtype=float)[:] = all_values[start:end].ravel()
+        if all_flags is not None:
+            numpy.frombuffer(packed_path.flags, dtype=numpy.uint8)[:] = all_flags[start:end]
+        start = end
+
+
+def transform_paths(paths, transformation_matrix):
+    """
+    Applies an affine Matrix3 to the end points and centres of the edges of a path, or of a list of paths,
+    in one NumPy operation, or in a loop of plain float operations when NumPy is not installed.
+    The paths are changed in place and may be Path2s or PackedPath2s. No arc centre is calculated again:
+    the centres are moved with the end points, the arcs of a matrix with a negative determinant, which mirrors,
+    change direction and the radii are scaled by the square root of the size of the determinant.
+    So a matrix that stretches or shears can only be applied to paths without arcs, as the arcs would no
+    longer be circular.
+
+    :param paths: a Path2 or PackedPath2, or a list of them
+    :param transformation_matrix: the affine matrix to apply
+    :type  transformation_matrix: Matrix3
+    :return: the paths
+    :raises: ValueError: the matrix is not affine, or stretches or shears paths with arcs
+    """
+    affine_values = get_affine_values(transformation_matrix)
+    path_list = paths if isinstance(paths, (list, tuple)) else [paths]
+    if not is_similarity(affine_values) and any(has_arcs(path) for path in path_list):
+        raise ValueError('Bulk transforms can not stretch or shear arcs, the matrix must keep circles round')
+    packed_paths = [path for path in path_list if is_packed_path2(path)]
+    if packed_paths:
+        transform_packed_paths(packed_paths, affine_values)
+    if len(packed_paths) != len(path_list):
+        transform_path2s([path for path in path_list if not is_packed_path2(path)], affine_values)
+    return paths
+
+
+def offset_paths(paths, vector, point_type=None):
+    """
+    Offsets paths by a vector as Path2.offset does, mirroring them first for the point types 'mm', 'pm' and 'mp'
+
+    :param paths: a Path2 or PackedPath2, or a list of them
+    :param vector: the offset
+    :type  vector: Vector2
+    :param point_type: one of 'pp', 'mm', 'pm' or 'mp', None for 'pp'
+    :return: the paths
+    :raises: TypeError: the offset is not a Vector2
+    """
+    if not is_vector2(vector):
+        raise TypeError("Path offset must be done with a vector")
+    mirror = OFFSET_MIRRORS[(point_type or 'pp').lower()]
+    matrix = Matrix3.translation(vector)
+    if mirror is not None:
+        matrix = Matrix3(multiply_values(matrix.vals, MIRROR_VALUES[mirror]))
+    return transform_paths(paths, matrix)
+
+
+def mirror_paths(paths, axis):
+    """
+    Mirrors paths about the x axis, the y axis or the origin, as Path2.mirror_x, mirror_y and mirror_origin do
+
+    :param paths: a Path2 or PackedPath2, or a list of them
+    :param axis: 'x', 'y' or 'origin'
+    :return: the paths
+    """
+    return transform_paths(paths, Matrix3([list(row) for row in MIRROR_VALUES[axis]]))
+
+
+def rotate_paths(paths, rotation_angle, rotation_vector=None):
+    """
+    Rotates paths by an angle in degrees, about the origin as Path2.rotate does or about a point as
+    Path2.rotate_around does
+
+    :param paths: a Path2 or PackedPath2, or a list of them
+    :param rotation_angle: the angle in degrees
+    :param rotation_vector: the point to rotate about, None for the origin
+    :type  rotation_vector: Vector2
+    :return: the paths
+    """
+    matrix = Matrix3.rotation(float(rotation_angle))
+    if rotation_vector is not None:
+        values = multiply_values(matrix.vals, Matrix3.translation(Vector2(-rotation_vector.x,
+                                                                          -rotation_vector.y)).vals)
+        matrix = Matrix3(multiply_values(Matrix3.translation(rotation_vector).vals, values))
+    return transform_paths(paths, matrix)
@@ -0,0 +1,142 @@
+from math import acos, atan2, ceil, cos, sin, sqrt
+
+from geometry_utils.maths_utility import EPSILON, HALF_PI, PI, TWO_PI
+
+# The tolerance of get_arc_points when no other is given
+ARC_TOLERANCE = 0.01
+
+
+def get_chain(points, order):
+    """
+    Returns the indices of the points, taken in order, that turn counterclockwise, one half of a monotone chain
+    """
+    chain = []
+    pop = chain.pop
+    append = chain.append
+    length = 0
+    for index in order:
+        x, y = points[index]
+        while length > 1:
+            origin_x, origin_y = points[chain[-2]]
+            a_x, a_y = points[chain[-1]]
+            if (a_x - origin_x) * (y - origin_y) - (a_y - origin_y) * (x - origin_x) > 0:
+                break
+            pop()
+            length -= 1
+        append(index)
+        length += 1
+    return chain
+
+
+def get_convex_hull_indices(points):
+    """
+    Finds the convex hull of a list of (x, y) tuples with Andrew's monotone chain, in O(n log n).
+    Points on the hull between two others in a straight line and repeated points are left out.
+    The hull is counterclockwise and starts at the leftmost point, the highest of them if there are several,
+    which is where Path2.get_convex_hull always started.
+
+    :param points: the (x, y) tuples
+    :type  points: list
+    :return: the indices of the points on the hull
+    :rtype: list
+    """
+    order = sorted(range(len(points)), key=points.__getitem__)
+    if len(order) < 3:
+        return order
+
+    hull = get_chain(points, order)[:-1] + get_chain(points, reversed(order))[:-1]
+    if len(hull) < 2 or points[hull[0]] == points[hull[1]]:
+        # every point is the same point
+        return hull[:1]
+
+    # the upper chain ends on the leftmost point with the lowest y, so step back to the highest one
+    start = 0
+    leftmost_x = points[hull[0]][0]
+    while points[hull[start - 1]][0] == leftmost_x and start > -len(hull) + 1:
+        start -= 1
+    return hull[start:] + hull[:start] if start else hull
+
+
+def get_arc_points(edge, tolerance=ARC_TOLERANCE):
+    """
+    Returns points on an arc, between its end points, such that no part of the arc is further than the tolerance
+    outside the polygon through the points and the end points. The points where the arc reaches furthest along
+    the x and y axes are always included.
+
+    :param edge: the arc, or circle
+    :type  edge: Edge2
+    :param tolerance: the furthest the arc may bulge out past the polygon
+    :type  tolerance: float
+    :return: the (x, y) tuples of the points, not including the end points of the arc
+    :rtype: list
+    :raises: ValueError: the tolerance is not above 0.0
+    """
+    if tolerance <= 0.0:
+        raise ValueError('The arc tolerance must be above 0.0')
+
+    centre_x = edge.centre.x
+    centre_y = edge.centre.y
+    if edge.is_circle():
+        radius = edge.radius
+        start_angle = 0.0
+        sweep = TWO_PI
+    else:
+        # the distance to the start point, rather than the radius, for arcs too short for their radius to reach
+        radius = sqrt((edge.p1.x - centre_x) ** 2 + (edge.p1.y - centre_y) ** 2)
+        start_angle = atan2(edge.p1.y - centre_y, edge.p1.x - centre_x)
+        end_angle = atan2(edge.p2.y - centre_y, edge.p2.x - centre_x)
+        if edge.clockwise:
+            sweep = -((start_angle - end_angle) % TWO_PI)
+        else:
+            sweep = (end_angle - start_angle) % TWO_PI
+    if radius < EPSILON:
+        return []
+
+    angles = []
+    for quadrant in range(4):
+        axis_angle = quadrant * HALF_PI
+        if sweep < 0.0:
+            along = (start_angle - axis_angle) % TWO_PI
+        else:
+            along = (axis_angle - start_angle) % TWO_PI
+        if EPSILON < along < abs(sweep) - EPSILON or (sweep == TWO_PI and along <= EPSILON):
+            angles.append(axis_angle)
+
+    if tolerance < radius:
+        step = 2.0 * acos(1.0 - tolerance / radius)
+    else:
+        step = PI
+    number_of_steps = int(ceil(abs(sweep) / step))
+    for step_number in range(1, number_of_steps):
+        angles.append(start_angle + sweep * step_number / number_of_steps)
+
+    return [(centre_x + radius * cos(angle), centre_y + radius * sin(angle)) for angle in angles]
+
+
+def get_edge_coordinates(list_of_edges, include_arcs=False, arc_tolerance=ARC_TOLERANCE):
+    """
+    Returns the points of a list of edges for a convex hull, with their (x, y) tuples. The end of an edge is left out
+    when it is where the next edge starts.
+
+    :param list_of_edges: the edges
+    :type  list_of_edges: list
+    :param include_arcs: True to add the points of get_arc_points for each arc
+    :type  include_arcs: bool
+    :param arc_tolerance: the tolerance of get_arc_points
+    :type  arc_tolerance: float
+    :return: the Point2s of the edges, None for the points on arcs, and the (x, y) tuples of them
+    :rtype: tuple
+    """
+    points = []
+    coordinates = []
+    for edge, next_edge in zip(list_of_edges, list_of_edges[1:] + list_of_edges[:1]):
+        points.append(edge.p1)
+        coordinates.append((edge.p1.x, edge.p1.y))
+        if edge.p2.x != next_edge.p1.x or edge.p2.y != next_edge.p1.y:
+            points.append(edge.p2)
+            coordinates.append((edge.p2.x, edge.p2.y))
+        if include_arcs and edge.is_arc():
+            arc_points = get_arc_points(edge, arc_tolerance)
+            points.extend([None] * len(arc_points))
+            coordinates.extend(arc_points)
+    return points, coordinates
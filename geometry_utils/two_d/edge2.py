@@ -12,7 +12,37 @@ from geometry_utils.two_d.matrix3 import Matrix3
 from geometry_utils.two_d.vector2 import Vector2
 
 
-class Edge2:
+def calculate_arc_centre(p1_x, p1_y, p2_x, p2_y, radius, clockwise, large, sqrt=math.sqrt, maximum=max):
+    """
+    Solves the centre of an arc between two different points in closed form, as Ellipse does for a circle.
+    A radius too short to reach both points is grown until it does. The coordinates and radius may be NumPy arrays
+    when numpy.sqrt and numpy.fmax are given for sqrt and maximum.
+
+    :param p1_x, p1_y: the start of the arc
+    :param p2_x, p2_y: the end of the arc
+    :param radius: the radius of the arc
+    :param clockwise: True if the arc goes clockwise
+    :param large: True if the arc is the large one
+    :return: the x and y of the centre
+    :rtype: tuple
+    """
+    x_dash = (p1_x - p2_x) / 2.0
+    y_dash = (p1_y - p2_y) / 2.0
+    radius = abs(radius)
+    delta = (x_dash * x_dash) / (radius * radius) + (y_dash * y_dash) / (radius * radius)
+    radius = radius * sqrt(maximum(1.0, delta))
+    radius_squared = radius * radius
+    numerator = (radius_squared * radius_squared - radius_squared * (y_dash * y_dash) -
+                 radius_squared * (x_dash * x_dash))
+    denominator = radius_squared * (y_dash * y_dash) + radius_squared * (x_dash * x_dash)
+    root_part = sqrt(maximum(0.0, numerator / denominator))
+    if large != clockwise:
+        root_part = -root_part
+    return (root_part * ((radius * y_dash) / radius) + (p1_x + p2_x) / 2.0,
+            root_part * -((radius * x_dash) / radius) + (p1_y + p2_y) / 2.0)
+
+
+class Edge2(object):
     """
     A class to create a 2D edge
 
@@ -107,6 +137,8 @@ class Edge2:
         returns the edge transformed with the specified 3x3 matrix
     to_edge3(): Edge3
         returns a 3D edge from the 2D edge
+    clone(): Edge2
+        returns an independent copy of the 2D edge
     """
 
     def __init__(self,
@@ -192,9 +224,9 @@ class Edge2:
         if not self.is_arc():
             return Point2((self.p1.x + self.p2.x) * 0.5, (self.p1.y + self.p2.y) * 0.5)
 
-        ellipse = Ellipse(start = self.p1, end = self.p2, major_radius = self.radius, minor_radius = self.radius,
-                          clockwise = self.clockwise, large_arc = self.large, angle=0.0)
-        return ellipse.centre
+        centre_x, centre_y = calculate_arc_centre(self.p1.x, self.p1.y, self.p2.x, self.p2.y, self.radius,
+                                                  self.clockwise, self.large)
+        return Point2(centre_x, centre_y)
 
     def is_arc(self):
         """
@@ -754,6 +786,26 @@ class Edge2:
 
         return edge_3d
 
+    def clone(self):
+        """
+        Copies the 2D edge and its points without going through copy.deepcopy.
+        A centre that is the p1 or p2 object stays that object in the copy.
+
+        :return: the copied edge
+        :rtype: Edge2
+        """
+        edge = Edge2.__new__(Edge2)
+        edge.__dict__.update(self.__dict__)
+        edge.p1 = self.p1.clone()
+        edge.p2 = edge.p1 if self.p2 is self.p1 else self.p2.clone()
+        if self.centre is self.p1:
+            edge.centre = edge.p1
+        elif self.centre is self.p2:
+            edge.centre = edge.p2
+        else:
+            edge.centre = self.centre.clone()
+        return edge
+
 def is_edge2(input_variable):
     """
     Checks if the input variable is an object of Edge2
@@ -0,0 +1,125 @@
+from math import atan2
+
+from geometry_utils.two_d.vector2 import Vector2
+
+
+class OrientedBoundingBox2(object):
+    """
+    The smallest box, by area, around a convex hull. One side of the box lies along an edge of the hull.
+
+    Attributes:
+    ___________
+    U: list
+        the axes of the box, the edge of the hull along its bottom and that edge turned counterclockwise,
+        neither normalised
+    index: list
+        the indices of the hull points at the end of the bottom edge and touching the right, top and left sides
+    U0_square_length: float
+        the square of the length of the first axis
+    area: float
+        the area of the box
+
+    Methods:
+    ________
+    get_smallest_angle_to_align_box(): float
+        Returns the smallest angle in radians from the x axis to a side of the box
+    """
+
+    __slots__ = ('U', 'index', 'U0_square_length', 'area')
+
+    def __init__(self, axis_x=0.0, axis_y=0.0, index=None, area=0.0):
+        self.U = [Vector2(axis_x, axis_y), Vector2(-axis_y, axis_x)]
+        self.index = index or [0, 0, 0, 0]
+        self.U0_square_length = axis_x * axis_x + axis_y * axis_y
+        self.area = area
+
+    def get_smallest_angle_to_align_box(self):
+        """
+        Calculates the angle to the x axis of each of the four directions along the sides of the box
+
+        :return: the angle smallest in size, in radians
+        :rtype: float
+        """
+        axis_x = self.U[0].x
+        axis_y = self.U[0].y
+        smallest = None
+        for x, y in ((axis_x, axis_y), (-axis_y, axis_x), (-axis_x, -axis_y), (axis_y, -axis_x)):
+            angle = atan2(y, x)
+            if smallest is None or abs(angle) < abs(smallest):
+                smallest = angle
+        return smallest
+
+
+def get_minimum_area_box(hull):
+    """
+    Finds the smallest box around a convex hull with rotating calipers. The calipers on the right, top and left of
+    each edge only move forwards around the hull, so all the edges are tried in O(n).
+
+    :param hull: the (x, y) tuples of the hull, counterclockwise without repeated or collinear points,
+                 as get_convex_hull_indices gives them
+    :type  hull: list
+    :return: the box, with an area of 0.0 when the hull is a point or a line
+    :rtype: OrientedBoundingBox2
+    """
+    number_of_points = len(hull)
+    if number_of_points < 3:
+        if number_of_points < 2:
+            return OrientedBoundingBox2()
+        return OrientedBoundingBox2(hull[1][0] - hull[0][0], hull[1][1] - hull[0][1], [1, 1, 1, 0])
+
+    x_values = [point[0] for point in hull]
+    y_values = [point[1] for point in hull]
+    right = top = left = None
+    best = None
+    for start in range(number_of_points):
+        end = start + 1 if start + 1 < number_of_points else 0
+        axis_x = x_values[end] - x_values[start]
+        axis_y = y_values[end] - y_values[start]
+
+        if right is None:
+            right = end
+        while True:
+            after = right + 1 if right + 1 < number_of_points else 0
+            if (axis_x * x_values[after] + axis_y * y_values[after] <=
+                    axis_x * x_values[right] + axis_y * y_values[right]):
+                break
+            right = after
+
+        if top is None:
+            top = right
+        while True:
+            after = top + 1 if top + 1 < number_of_points else 0
+            if (axis_x * y_values[after] - axis_y * x_values[after] <=
+                    axis_x * y_values[top] - axis_y * x_values[top]):
+                break
+            top = after
+
+        if left is None:
+            left = top
+        while True:
+            after = left + 1 if left + 1 < number_of_points else 0
+            if (axis_x * x_values[after] + axis_y * y_values[after] >=
+                    axis_x * x_values[left] + axis_y * y_values[left]):
+                break
+            left = after
+
+        width = axis_x * (x_values[right] - x_values[left]) + axis_y * (y_values[right] - y_values[left])
+        height = axis_x * (y_values[top] - y_values[start]) - axis_y * (x_values[top] - x_values[start])
+        area = width * height / (axis_x * axis_x + axis_y * axis_y)
+        if best is None or area < best[0]:
+            best = (area, axis_x, axis_y, end, right, top, left)
+
+    area, axis_x, axis_y, end, right, top, left = best
+    return OrientedBoundingBox2(axis_x, axis_y, [end, right, top, left], area)
+
+
+def get_oriented_bounding_boxes(paths):
+    """
+    Finds the smallest box around each of a list of paths, without building a Path2 for any convex hull
+
+    :param paths: the Path2s or PackedPath2s
+    :type  paths: list
+    :return: the box of each path, with an area of 0.0 for a path that is a point or a line
+    :rtype: list
+    """
+    return [get_minimum_area_box(path.get_convex_hull_coordinates()) for path in paths]
@@ -0,0 +1,452 @@
+from array import array
+
+from geometry_utils.maths_utility import DOUBLE_EPSILON, floats_are_close
+from geometry_utils.two_d.area_properties import AreaProperties2, integrate_edges
+from geometry_utils.two_d.axis_aligned_box2 import AxisAlignedBox2
+from geometry_utils.two_d.convex_hull import ARC_TOLERANCE, get_convex_hull_indices
+from geometry_utils.two_d.edge2 import Edge2
+from geometry_utils.two_d.oriented_bounding_box import get_minimum_area_box
+from geometry_utils.two_d.path2 import Path2, is_path2
+from geometry_utils.two_d.point2 import Point2
+
+# The values of each edge in PackedPath2.values: p1 x and y, p2 x and y, centre x and y and radius
+EDGE_VALUES = 7
+
+# The bits of each edge in PackedPath2.flags
+CLOCKWISE = 1
+LARGE = 2
+CENTRE_IS_P1 = 4
+CENTRE_IS_P2 = 8
+P2_IS_P1 = 16
+
+# The edge attributes held only where they differ from their default
+SPARSE_EDGE_ATTRIBUTES = (('name', ''), ('style', ''), ('type', ''), ('left_name', ''), ('right_name', ''))
+
+
+class PackedPath2(object):
+    """
+    A 2D path held in flat arrays rather than as Edge2 and Point2 objects, for keeping large numbers of
+    paths in memory. The coordinates and radius of each edge are held in one array of doubles and the arc
+    flags in one array of bytes. The point names are held in a list, and the other names, styles and
+    weights only where they are set. PackedPath2.from_path2(path).to_path2() gives a path equal to path,
+    with the same names and with centres that are p1 or p2 in the same edges.
+
+    Attributes:
+    ___________
+    values: array
+        p1 x and y, p2 x and y, centre x and y and radius of each edge
+    flags: array
+        the clockwise, large and shared point bits of each edge
+    point_names: tuple or None
+        the name of p1 of each edge, None when none of them have a name
+    sparse: dict or None
+        for each of 'p2_name', 'name', 'style', 'type', 'left_name', 'right_name' and the weights and names
+        of the points, the edge indices where it is not the default and its value there, None when all the
+        edges have the defaults. The default name of p2 is the name of p1 of the next edge, or of the first
+        edge for the last edge.
+    fill: str
+        the color fill of the path
+    name: str
+        the name of the path
+    type: str
+        the path type
+    layers: tuple
+        the names of the layers in the path
+    closed: bool
+        the closed attribute of the path
+    attributes: dict
+        dictionary of attributes of the path
+
+    Methods:
+    ________
+    from_path2(Path2): PackedPath2
+        Returns the packed path of a Path2
+    to_path2(): Path2
+        Returns the path as a Path2
+    get_edge(int): Edge2
+        Returns an edge of the path
+    get_first_edge(): Edge2
+        Returns the first edge of the path
+    get_last_edge(): Edge2
+        Returns the last edge of the path
+    get_bounds(): AxisAlignedBox2
+        Returns 2D box containing the edges of the path
+    to_tuple_list(): list
+        Returns the start and end of each edge
+    get_list_of_points(): list
+        Returns the points of the path
+    is_circle(): bool
+        Tests if the path is a circle
+    is_incomplete_circle(): bool
+        Tests if the path is a single arc that is not a circle
+    is_quadrilateral(): bool
+        Tests if the path is four closed lines
+    get_enclosed_area(): float
+        Returns the signed area of a closed path
+    get_area_properties(): AreaProperties2
+        Returns the area, centroid and second moments of a closed path
+    get_convex_hull_coordinates(): list
+        Returns the points of the convex hull of the path
+    get_oriented_bounding_box(): OrientedBoundingBox2
+        Returns the smallest box around the path
+    """
+    __slots__ = ('values', 'flags', 'point_names', 'sparse', 'fill', 'name', 'type', 'layers', 'closed',
+                 'attributes')
+
+    def __init__(self):
+        self.values = array('d')
+        self.flags = array('B')
+        self.point_names = None
+        self.sparse = None
+
+        self.fill = ''
+        self.name = ''
+        self.type = ''
+        self.layers = ()
+        self.closed = None
+        self.attributes = {}
+
+    def __len__(self):
+        return len(self.flags)
+
+    def __eq__(self, other_path):
+        """
+        Compares the edges of the path with the edges of a Path2 or PackedPath2, as Path2 does
+
+        :param other_path: the other path
+        :return: the path equality
+        :rtype: bool
+        :raises: TypeError: wrong argument type
+        :raises: IndexError: the paths have a different number of edges
+        """
+        if not is_path2(other_path) and not is_packed_path2(other_path):
+            raise TypeError("Comparison must be done with another object of Path2 or PackedPath2")
+        if self.path_length != other_path.path_length:
+            raise IndexError("Comparison must be done with another path of equal number of edges")
+        if is_packed_path2(other_path):
+            other_path = other_path.to_path2()
+        for index, other_edge in enumerate(other_path.list_of_edges):
+            if self.get_edge(index) != other_edge:
+                return False
+        return True
+
+    def __ne__(self, other_path):
+        return not self.__eq__(other_path)
+
+    @classmethod
+    def from_path2(cls, path):
+        """
+        Packs a Path2. The coordinates and radii of its edges have to be numbers, as they are held as doubles.
+
+        :param path: the path to pack
+        :type  path: Path2
+        :return: the packed path
+        :rtype: PackedPath2
+        :raises: TypeError: a coordinate or radius is not a number
+        """
+        packed_path = cls()
+        list_of_edges = path.list_of_edges
+        number_of_edges = len(list_of_edges)
+        values = []
+        extend = values.extend
+        flags = []
+        point_names = []
+        sparse = {}
+        for index, edge in enumerate(list_of_edges):
+            p1 = edge.p1
+            p2 = edge.p2
+            centre = edge.centre
+            extend((p1.x, p1.y, p2.x, p2.y, centre.x, centre.y, edge.radius))
+            flag = (CLOCKWISE if edge.clockwise else 0) | (LARGE if edge.large else 0)
+            if centre is p1:
+                flag |= CENTRE_IS_P1
+            elif centre is p2:
+                flag |= CENTRE_IS_P2
+            if p2 is p1:
+                flag |= P2_IS_P1
+            flags.append(flag)
+            point_names.append(p1.name)
+
+            for attribute, default in SPARSE_EDGE_ATTRIBUTES:
+                value = getattr(edge, attribute)
+                if value != default:
+                    sparse.setdefault(attribute, {})[index] = value
+            if p1.w != 1:
+                sparse.setdefault('p1_w', {})[index] = p1.w
+            if p2 is not p1:
+                if p2.w != 1:
+                    sparse.setdefault('p2_w', {})[index] = p2.w
+                # the end of an edge is usually the start of the next one, or of the first one, and has its name
+                if p2.name != list_of_edges[(index + 1) % number_of_edges].p1.name:
+                    sparse.setdefault('p2_name', {})[index] = p2.name
+            if centre is not p1 and centre is not p2:
+                if centre.w != 1:
+                    sparse.setdefault('centre_w', {})[index] = centre.w
+                if centre.name != '':
+                    sparse.setdefault('centre_name', {})[index] = centre.name
+
+        # the arrays are made at their final size, rather than grown
+        packed_path.values = array('d', values)
+        packed_path.flags = array('B', flags)
+        if any(point_names):
+            packed_path.point_names = tuple(point_names)
+        if sparse:
+            packed_path.sparse = sparse
+        packed_path.fill = path.fill
+        packed_path.name = path.name
+        packed_path.type = path.type
+        packed_path.layers = tuple(path.layers)
+        packed_path.closed = path.closed
+        packed_path.attributes = dict(path.attributes)
+        return packed_path
+
+    def to_path2(self):
+        """
+        Unpacks the path, each edge getting its own points
+
+        :return: the path
+        :rtype: Path2
+        """
+        path = Path2()
+        path.list_of_edges = [self.get_edge(index) for index in range(len(self.flags))]
+        path.fill = self.fill
+        path.name = self.name
+        path.type = self.type
+        path.layers = list(self.layers)
+        path.closed = self.closed
+        path.attributes = dict(self.attributes)
+        return path
+
+    @property
+    def path_length(self):
+        """
+        Calculates the number of edges in the path
+
+        :return: number of edges in the path
+        :rtype: int
+        """
+        return len(self.flags)
+
+    def get_point_name(self, index):
+        """
+        Returns the name of p1 of an edge
+        """
+        if self.point_names is None:
+            return ''
+        return self.point_names[index]
+
+    def get_sparse(self, attribute, index, default):
+        if self.sparse is None or attribute not in self.sparse:
+            return default
+        return self.sparse[attribute].get(index, default)
+
+    def get_edge(self, index):
+        """
+        Builds an edge of the path
+
+        :param index: the index of the edge, which may be negative
+        :return: a new edge
+        :rtype: Edge2
+        """
+        if index < 0:
+            index += len(self.flags)
+        flag = self.flags[index]
+        p1_x, p1_y, p2_x, p2_y, centre_x, centre_y, radius = \
+            self.values[index * EDGE_VALUES:(index + 1) * EDGE_VALUES]
+        get_sparse = self.get_sparse
+
+        new_point = Point2.__new__
+        p1 = new_point(Point2)
+        p1.__dict__ = {'x': p1_x, 'y': p1_y, 'w': get_sparse('p1_w', index, 1), 'name': self.get_point_name(index)}
+        if flag & P2_IS_P1:
+            p2 = p1
+        else:
+            p2_name = get_sparse('p2_name', index, self.get_point_name((index + 1) % len(self.flags)))
+            p2 = new_point(Point2)
+            p2.__dict__ = {'x': p2_x, 'y': p2_y, 'w': get_sparse('p2_w', index, 1), 'name': p2_name}
+        if flag & CENTRE_IS_P1:
+            centre = p1
+        elif flag & CENTRE_IS_P2:
+            centre = p2
+        else:
+            centre = new_point(Point2)
+            centre.__dict__ = {'x': centre_x, 'y': centre_y, 'w': get_sparse('centre_w', index, 1),
+                               'name': get_sparse('centre_name', index, '')}
+
+        edge = Edge2.__new__(Edge2)
+        edge.__dict__ = {'p1': p1, 'p2': p2, 'radius': radius, 'clockwise': bool(flag & CLOCKWISE),
+                         'large': bool(flag & LARGE), 'centre': centre,
+                         'name': get_sparse('name', index, ''), 'style': get_sparse('style', index, ''),
+                         'type': get_sparse('type', index, ''), 'left_name': get_sparse('left_name', index, ''),
+                         'right_name': get_sparse('right_name', index, '')}
+        return edge
+
+    def get_first_edge(self):
+        if self.path_length >= 1:
+            return self.get_edge(0)
+        raise IndexError("Can not find the first edge of an empty list of edges")
+
+    def get_last_edge(self):
+        if self.path_length >= 1:
+            return self.get_edge(-1)
+        raise IndexError("Can not find the last edge of an empty list of edges")
+
+    def is_arc(self, index):
+        return self.values[index * EDGE_VALUES + 6] > DOUBLE_EPSILON
+
+    def points_are_equal(self, first_offset, second_offset):
+        """
+        Compares two points of the values as Point2 does
+
+        :param first_offset: the index in values of the x of the first point
+        :param second_offset: the index in values of the x of the second point
+        :rtype: bool
+        """
+        values = self.values
+        return (floats_are_close(values[first_offset], values[second_offset]) and
+                floats_are_close(values[first_offset + 1], values[second_offset + 1]))
+
+    @property
+    def is_closed(self):
+        """
+        Tests if the path is closed
+
+        :return: closeness of the path
+        :rtype:  bool
+        """
+        if self.path_length > 1:
+            return self.points_are_equal((self.path_length - 1) * EDGE_VALUES + 2, 0) and self.is_continuous
+        return False
+
+    @property
+    def is_continuous(self):
+        """
+        Tests if the path is continuous
+
+        :return:continuity of the path
+        :rtype: bool
+        """
+        if self.path_length < 2:
+            return False
+        for offset in range(0, (self.path_length - 1) * EDGE_VALUES, EDGE_VALUES):
+            if not self.points_are_equal(offset + 2, offset + EDGE_VALUES):
+                return False
+        return True
+
+    def get_bounds(self):
+        """
+        Derives the AxisAlignedBox2 containing the bounds of the path, as Path2.get_bounds does
+
+        :return:the box containing the path bounds
+        :rtype: AxisAlignedBox2
+        """
+        if self.path_length == 0:
+            return AxisAlignedBox2()
+        values = self.values
+        x_values = values[0::EDGE_VALUES] + values[2::EDGE_VALUES]
+        y_values = values[1::EDGE_VALUES] + values[3::EDGE_VALUES]
+        path_bounds = AxisAlignedBox2(Point2(min(x_values), min(y_values)), Point2(max(x_values), max(y_values)))
+        radii = values[6::EDGE_VALUES]
+        for index, radius in enumerate(radii):
+            if radius > DOUBLE_EPSILON:
+                # the extremes of an arc are found as Path2.get_bounds finds them
+                arc_path = Path2()
+                arc_path.list_of_edges = [self.get_edge(index)]
+                path_bounds.include(arc_path.get_bounds())
+        return path_bounds
+
+    def to_tuple_list(self):
+        values = self.values
+        return [((values[offset], values[offset + 1]), (values[offset + 2], values[offset + 3]))
+                for offset in range(0, len(values), EDGE_VALUES)]
+
+    def get_list_of_points(self):
+        """
+        Returns the start of each edge, and its end when it is not the start of the next edge, as
+        Path2.get_list_of_points does
+        """
+        list_of_points = []
+        path_length = self.path_length
+        for index in range(path_length):
+            edge = self.get_edge(index)
+            list_of_points.append(edge.p1)
+            next_offset = 0 if index + 1 == path_length else (index + 1) * EDGE_VALUES
+            if next_offset == 0 or not self.points_are_equal(index * EDGE_VALUES + 2, next_offset):
+                list_of_points.append(edge.p2)
+        return list_of_points
+
+    def is_circle(self):
+        return self.path_length == 1 and self.is_arc(0) and self.points_are_equal(0, 2)
+
+    def is_incomplete_circle(self):
+        return self.path_length == 1 and self.is_arc(0) and not self.points_are_equal(0, 2)
+
+    def is_quadrilateral(self):
+        if self.path_length != 4 or not self.is_closed or not self.is_continuous:
+            return False
+        return not any(self.is_arc(index) for index in range(4))
+
+    def get_enclosed_area(self):
+        """
+        Calculates the signed area of a closed path, as Path2.get_enclosed_area does
+
+        :return: the area, None when the path is not closed
+        :rtype: float
+        """
+        if not self.is_closed or self.path_length <= 0:
+            return None
+        return self.get_area_integrals()[0]
+
+    def get_area_properties(self):
+        """
+        Calculates the area, centroid and second moments of a closed path, as Path2.get_area_properties does
+
+        :return: the properties, None when the path is not closed
+        :rtype: AreaProperties2
+        """
+        if not self.is_closed and not self.is_circle():
+            return None
+        return AreaProperties2(self.get_area_integrals())
+
+    def get_area_integrals(self):
+        """
+        Integrates over the region inside the path straight from the arrays, see integrate_edges
+        """
+        values = self.values
+        flags = self.flags
+        return integrate_edges((values[offset], values[offset + 1], values[offset + 2], values[offset + 3],
+                                values[offset + 4], values[offset + 5], values[offset + 6],
+                                bool(flags[index] & CLOCKWISE))
+                               for index, offset in enumerate(range(0, len(values), EDGE_VALUES)))
+
+    def get_convex_hull_coordinates(self, include_arcs=False, arc_tolerance=ARC_TOLERANCE):
+        """
+        Finds the points of the convex hull as Path2.get_convex_hull_coordinates does
+
+        :return: the (x, y) tuples of the hull, counterclockwise from the leftmost point
+        :rtype: list
+        """
+        if include_arcs and any(self.is_arc(index) for index in range(self.path_length)):
+            return self.to_path2().get_convex_hull_coordinates(True, arc_tolerance)
+
+        values = self.values
+        starts = list(zip(values[0::EDGE_VALUES], values[1::EDGE_VALUES]))
+        ends = zip(values[2::EDGE_VALUES], values[3::EDGE_VALUES])
+        coordinates = starts + [end for end, next_start in zip(ends, starts[1:] + starts[:1]) if end != next_start]
+        return [coordinates[index] for index in get_convex_hull_indices(coordinates)]
+
+    def get_oriented_bounding_box(self):
+        """
+        Finds the smallest box around the path, as Path2.get_oriented_bounding_box does
+
+        :return: the box
+        :rtype: OrientedBoundingBox2
+        :raises: IndexError: the path has fewer than three edges
+        """
+        if self.path_length < 3:
+            raise IndexError("There must be at least three edges")
+        return get_minimum_area_box(self.get_convex_hull_coordinates())
+
+
+def is_packed_path2(input_variable):
+    return isinstance(input_variable, PackedPath2)
@@ -2,13 +2,16 @@ import copy
 import geometry_utils.three_d.path3
 
 from geometry_utils.maths_utility import is_int_or_float, is_list, floats_are_close
+from geometry_utils.two_d.area_properties import AreaProperties2, integrate_edges
 from geometry_utils.two_d.axis_aligned_box2 import AxisAlignedBox2
+from geometry_utils.two_d.convex_hull import ARC_TOLERANCE, get_convex_hull_indices, get_edge_coordinates
 from geometry_utils.two_d.edge2 import Edge2, is_edge2
+from geometry_utils.two_d.oriented_bounding_box import get_minimum_area_box
 from geometry_utils.two_d.vector2 import is_vector2, Vector2
 from geometry_utils.two_d.point2 import Point2
 
 
-class Path2:
+class Path2(object):
     """
     A class to create a 2D path
 
@@ -28,18 +31,43 @@ class Path2:
         True if the path is closed and False otherwise
     attributes: dict
         dictionary of attributes of the path 
+    version: int
+        the number of changes made to the path through its methods, the derived properties are cached against it
+    cache_properties: bool
+        True to cache the derived properties against the version, for a caller that calls invalidate() after
+        changing edges or points in place; False, the default, calculates them on every read
 
 
     Methods:
     ________
+    invalidate():
+        Marks the cached derived properties as out of date after the edges or points are changed in place
     is_closed(): bool
         Returns the result of the tests if the path is closed
     is_continuous(): bool
         Returns the result of the tests if the path is continuous
     get_path_bounds(): AxisAlignedBox2()
         Returns 2D box containing the edges of the path
+    append_continuous(Edge2): Path2
+        Appends an edge, joining it to the end of the path
+    get_convex_hull_coordinates(): list
+        Returns the points of the convex hull of the path
+    get_oriented_bounding_box(): OrientedBoundingBox2
+        Returns the smallest box around the path
+    get_area_properties(): AreaProperties2
+        Returns the area, centroid and second moments of a closed path
+    clone(): Path2
+        Returns an independent copy of the path, its edges and points
     """
 
+    # the cached derived properties, valid while the version, the list of edges and its length are unchanged
+    version = 0
+    cache_properties = False
+    _cache = None
+    _cache_stamp = None
+    # the list of edges append_continuous last joined, and the index of the open edge it left at the end
+    _joined = None
+
     def __init__(self):
         self.list_of_edges = []
 
@@ -72,6 +100,43 @@ class Path2:
             if not is_edge2(edge):
                 raise TypeError('Input has to be list of Edge2 objects')
         self.list_of_edges = list_of_edges
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Marks the cached derived properties of the path as out of date. The methods of the path call this
+        themselves, and edges added to or removed from the list of edges are noticed, but a caller that caches
+        the properties and changes edges or points in place, or moves points shared with another path, must call it.
+
+        :return: the path
+        :rtype: Path2
+        """
+        self.version += 1
+        self._cache = None
+        return self
+
+    def get_cached(self, key, calculate):
+        """
+        Returns a derived property. When cache_properties is set it is only calculated when the path has changed
+        since it was last calculated, otherwise it is calculated every time
+
+        :param key: the name of the property
+        :param calculate: the function calculating the property
+        :return: the property
+        """
+        if not self.cache_properties:
+            return calculate()
+        list_of_edges = self.list_of_edges
+        cache_stamp = self._cache_stamp
+        if (self._cache is None or cache_stamp[0] != self.version or cache_stamp[1] is not list_of_edges or
+                cache_stamp[2] != len(list_of_edges)):
+            # the list itself is kept in the stamp so its id can not be reused by another list
+            self._cache = {}
+            self._cache_stamp = (self.version, list_of_edges, len(list_of_edges))
+        cache = self._cache
+        if key not in cache:
+            cache[key] = calculate()
+        return cache[key]
 
     def get_first_edge(self):
         if self.path_length >= 1:
@@ -101,8 +166,11 @@ class Path2:
         :return: closeness of the path
         :rtype:  bool
         """
+        return self.get_cached('is_closed', self._calculate_is_closed)
+
+    def _calculate_is_closed(self):
         if self.path_length > 1:
-            return (self.list_of_edges[-1].p2 == self.list_of_edges[0].p1) and self.is_continuous
+            return (self.list_of_edges[-1].p2 == self.list_of_edges[0].p1) and self._calculate_is_continuous()
         return False
 
     @property
@@ -113,6 +181,9 @@ class Path2:
         :return:continuity of the path
         :rtype: bool
         """
+        return self.get_cached('is_continuous', self._calculate_is_continuous)
+
+    def _calculate_is_continuous(self):
         if self.path_length < 2:
             return False
         else:
@@ -128,6 +199,12 @@ class Path2:
         :return:the box containing the path bounds
         :rtype: AxisAlignedBox2
         """
+        path_bounds = self.get_cached('bounds', self._calculate_bounds)
+        if not path_bounds.is_valid():
+            return AxisAlignedBox2()
+        return AxisAlignedBox2(path_bounds.min.clone(), path_bounds.max.clone())
+
+    def _calculate_bounds(self):
         path_bounds = AxisAlignedBox2()
         for edge in self.list_of_edges:
             path_bounds.include(edge.get_edge_bounds())
@@ -176,47 +253,47 @@ class Path2:
         indices_of_edges_to_remove.sort(reverse=True)
         for index in indices_of_edges_to_remove:
             del self.list_of_edges[index]
-        return self
+        return self.invalidate()
 
     def reverse(self):
         self.list_of_edges.reverse()
         for edge in self.list_of_edges:
             edge.reverse()
-        return self
+        return self.invalidate()
 
     def mirror_x(self):
         for edge in self.list_of_edges:
             edge.mirror_x()
-        return self
+        return self.invalidate()
 
     def mirror_y(self):
         for edge in self.list_of_edges:
             edge.mirror_y()
-        return self
+        return self.invalidate()
 
     def mirror_origin(self):
         for edge in self.list_of_edges:
             edge.mirror_origin()
-        return self
+        return self.invalidate()
 
     def offset(self, vector, point_type=None):
         if is_vector2(vector):
             if point_type is None or point_type.lower() == 'pp':
                 for edge in self.list_of_edges:
                     edge.offset(vector)
-                return self
+                return self.invalidate()
             elif point_type.lower() == 'mm':
                 for edge in self.list_of_edges:
                     edge.mirror_origin().offset(vector)
-                return self
+                return self.invalidate()
             elif point_type.lower() == 'pm':
                 for edge in self.list_of_edges:
                     edge.mirror_y().offset(vector)
-                return self
+                return self.invalidate()
             elif point_type.lower() == 'mp':
                 for edge in self.list_of_edges:
                     edge.mirror_x().offset(vector)
-                return self
+                return self.invalidate()
         else:
             raise TypeError("Path offset must be done with a vector")
 
@@ -231,11 +308,12 @@ class Path2:
     def rotate(self, rotation_angle):
         for edge in self.list_of_edges:
             edge.rotate(rotation_angle)
-        return self
+        return self.invalidate()
 
     def close_path(self):
-        if self.path_length > 1 and not self.is_closed:
-            if not self.is_continuous:
+        # the repairs test the edges themselves, as a cached property misses edges changed in place
+        if self.path_length > 1 and not self._calculate_is_closed():
+            if not self._calculate_is_continuous():
                 for index, edge in enumerate(self.list_of_edges):
                     if index == 0:
                         continue
@@ -243,10 +321,11 @@ class Path2:
                         self.list_of_edges.insert(index, Edge2(self.list_of_edges[index - 1].p2, edge.p1))
             self.list_of_edges.append(Edge2(copy.deepcopy(self.list_of_edges[-1].p2),
                                             copy.deepcopy(self.list_of_edges[0].p1)))
+            self.invalidate()
         return self
 
     def make_continuous(self):
-        if self.path_length > 1 and not self.is_continuous:
+        if self.path_length > 1 and not self._calculate_is_continuous():
             for index in range(self.path_length - 1):
                 if self.list_of_edges[index].p2 != self.list_of_edges[index + 1].p1:
                     self.list_of_edges[index].p2 = copy.deepcopy(self.list_of_edges[index + 1].p1)
@@ -262,6 +341,49 @@ class Path2:
             self.update_path()
         return self
 
+    def append_continuous(self, edge):
+        """
+        Appends an edge and joins it to the path the same way as make_continuous does.
+        The edges before the open edge left by the last call are already joined, so only the edges from it on are
+        joined and have their centres calculated again, whether they were appended here or straight onto the
+        list of edges, and a path built one edge at a time takes linear rather than quadratic time.
+
+        :param edge: the edge to append
+        :type  edge: Edge2
+        :return: the path
+        :rtype: Path2
+        """
+        list_of_edges = self.list_of_edges
+        list_of_edges.append(edge)
+        last_index = len(list_of_edges) - 1
+
+        first_index = 0
+        if self._joined is not None and self._joined[0] is list_of_edges:
+            first_index = min(self._joined[1], last_index)
+        self._joined = (list_of_edges, last_index)
+        if last_index == 0:
+            return self.invalidate()
+
+        for index in range(first_index, last_index):
+            previous_edge = list_of_edges[index]
+            next_edge = list_of_edges[index + 1]
+            if previous_edge.p2 != next_edge.p1:
+                previous_edge.p2 = next_edge.p1.clone()
+                if next_edge.is_arc():
+                    previous_edge.radius = next_edge.radius
+                    previous_edge.clockwise = next_edge.clockwise
+                    previous_edge.large = next_edge.large
+
+                    next_edge.radius = 0
+                    next_edge.clockwise = False
+                    next_edge.large = False
+
+        # the open edge is calculated again even when its end matched, as it may still be the Point2(0, 0) it was
+        # made with and only match because the new edge starts at the origin
+        for index in range(first_index, last_index + 1):
+            list_of_edges[index].centre = list_of_edges[index].calculate_centre()
+        return self.invalidate()
+
     def is_circle(self):
         return self.path_length == 1 and self.list_of_edges[0].is_circle()
 
@@ -277,16 +399,32 @@ class Path2:
         return self
 
     def get_enclosed_area(self):
+        """
+        Calculates the signed area of a closed path, positive when it goes counterclockwise.
+        Arcs are integrated exactly, as get_area_properties does.
+
+        :return: the area, None when the path is not closed
+        :rtype: float
+        """
         if not self.is_closed or self.path_length <= 0:
             return None
+        return self.get_cached('area_integrals', self._calculate_area_integrals)[0]
+
+    def get_area_properties(self):
+        """
+        Calculates the area, centroid and second moments of the region inside a closed path, or a circle, in one
+        pass over the edges without copying the path or flattening its arcs
+
+        :return: the properties, None when the path is not closed
+        :rtype: AreaProperties2
+        """
+        if not self.is_closed and not self.is_circle():
+            return None
+        return AreaProperties2(self.get_cached('area_integrals', self._calculate_area_integrals))
 
-        path = copy.deepcopy(self)
-        path.remove_duplicate_edges()
-        path.remove_arcs()
-        twice_area = 0
-        for edge in path.list_of_edges:
-            twice_area += edge.p1.x * edge.p2.y - edge.p2.x * edge.p1.y
-        return twice_area * 0.5
+    def _calculate_area_integrals(self):
+        return integrate_edges((edge.p1.x, edge.p1.y, edge.p2.x, edge.p2.y, edge.centre.x, edge.centre.y, edge.radius,
+                                edge.clockwise) for edge in self.list_of_edges)
 
     def remove_arcs(self):
         index = 0
@@ -305,6 +443,7 @@ class Path2:
             del self.list_of_edges[offset_location]
             self.list_of_edges[offset_location:offset_location] = new_edge[1]
             index_offset += len(new_edge[1]) - 1
+        self.invalidate()
 
     def is_quadrilateral(self):
         if self.path_length != 4 or not self.is_closed or not self.is_continuous:
@@ -352,7 +491,7 @@ class Path2:
                 Edge2(Point2(circle_centre.x, circle_centre.y + circle_radius),  # review to remove redundant line
                       Point2(circle_centre.x, circle_centre.y + circle_radius))
             ]
-            return self
+            return self.invalidate()
 
     def get_points_orientation(self, list_of_point_indices, list_of_points):
         # https://www.geeksforgeeks.org/convex-hull-set-1-jarviss-algorithm-or-wrapping/
@@ -380,49 +519,45 @@ class Path2:
                     minimum_point_index = index
         return minimum_point_index
 
-    def get_convex_hull(self):
+    def get_convex_hull(self, include_arcs=False, arc_tolerance=ARC_TOLERANCE):
+        """
+        Finds the convex hull of the end points of the edges with a monotone chain, in O(n log n).
+        The hull is counterclockwise from the leftmost point and is made from the points of the path.
+        By default arcs are treated as straight lines. With include_arcs the points where each arc reaches furthest
+        along the axes are added, with enough points on the arc that it bulges no more than arc_tolerance
+        outside the hull.
+
+        :param include_arcs: True to include the bulges of the arcs
+        :type  include_arcs: bool
+        :param arc_tolerance: the furthest an arc may bulge outside the hull
+        :type  arc_tolerance: float
+        :return: the closed path of the hull
+        :rtype: Path2
+        :raises: IndexError: the path has fewer than three edges
+        """
         if self.path_length < 3:
             raise IndexError("There must be at least three edges")
-        convex_hull = Path2()
-        convex_hull_list_of_points = []
-        # if self.is_continuous:
-        #     convex_hull = copy.deepcopy(self)
-        #     if not self.is_closed:
-        #         convex_hull.close_path()
-        #     return convex_hull
 
-        path_points = self.get_list_of_points()
-        del path_points[-1]
-        number_of_points = len(path_points)
+        path_points, coordinates = get_edge_coordinates(self.list_of_edges, include_arcs, arc_tolerance)
 
-        leftmost_point_index = self.get_leftmost_point_index(path_points)
-
-        first_point_index = leftmost_point_index
-
-        while True:
-            convex_hull_list_of_points.append(path_points[first_point_index])
-            second_point_index = (first_point_index + 1) % number_of_points
-
-            for i in range(number_of_points):
-                if (self.get_points_orientation([first_point_index, i, second_point_index], path_points) ==
-                        "Counterclockwise"):
-                    second_point_index = i
-
-            first_point_index = second_point_index
-            if first_point_index == leftmost_point_index:
-                break
+        convex_hull_list_of_points = []
+        for index in get_convex_hull_indices(coordinates):
+            point = path_points[index]
+            if point is None:
+                point = Point2(coordinates[index][0], coordinates[index][1])
+            convex_hull_list_of_points.append(point)
 
-        for count, point in enumerate(convex_hull_list_of_points):
-            if count == len(convex_hull_list_of_points) - 1:
-                count = - 1
-            convex_hull.list_of_edges.append(Edge2(point, convex_hull_list_of_points[count + 1]))
-        convex_hull.close_path()
+        convex_hull = Path2()
+        for point, next_point in zip(convex_hull_list_of_points,
+                                     convex_hull_list_of_points[1:] + convex_hull_list_of_points[:1]):
+            convex_hull.list_of_edges.append(Edge2(point, next_point))
         return convex_hull
 
     def transform(self, transformation_matrix):
         old_area = self.get_enclosed_area()
         for edge in self.list_of_edges:
             edge.transform(transformation_matrix)
+        self.invalidate()
         new_area = self.get_enclosed_area()
 
         if old_area is not None and new_area is not None:
@@ -434,6 +569,9 @@ class Path2:
         return self
 
     def get_list_of_points(self):
+        return list(self.get_cached('list_of_points', self._calculate_list_of_points))
+
+    def _calculate_list_of_points(self):
         list_of_points = []
         for count, edge in enumerate(self.list_of_edges):
             list_of_points.append(edge.p1)
@@ -445,213 +583,34 @@ class Path2:
 
         return list_of_points
 
+    def get_convex_hull_coordinates(self, include_arcs=False, arc_tolerance=ARC_TOLERANCE):
+        """
+        Finds the points of the convex hull as get_convex_hull does, as (x, y) tuples rather than a path
+
+        :param include_arcs: True to include the bulges of the arcs
+        :type  include_arcs: bool
+        :param arc_tolerance: the furthest an arc may bulge outside the hull
+        :type  arc_tolerance: float
+        :return: the (x, y) tuples of the hull, counterclockwise from the leftmost point
+        :rtype: list
+        """
+        def calculate():
+            coordinates = get_edge_coordinates(self.list_of_edges, include_arcs, arc_tolerance)[1]
+            return [coordinates[index] for index in get_convex_hull_indices(coordinates)]
+        return list(self.get_cached(('convex_hull_coordinates', include_arcs, arc_tolerance), calculate))
+
     def get_oriented_bounding_box(self):
-        class Box:
-            def __init__(self):
-                self.U = [Vector2(), Vector2()]
-                self.index = [0, 0, 0, 0]
-                self.U0_square_length = 0.0
-                self.area = 0.0
-
-            def get_smallest_angle_to_align_box(self):
-                x_axis_1 = Vector2(self.U[0].x, self.U[0].y)
-                y_axis_1 = Vector2(self.U[1].x, self.U[1].y)
-                x_axis_1.normalise()
-                y_axis_1.normalise()
-
-                x_axis_2 = y_axis_1
-                y_axis_2 = Vector2(-x_axis_1.x, -x_axis_1.y)
-                x_axis_2.normalise()
-                y_axis_2.normalise()
-
-                x_axis_3 = y_axis_2
-                y_axis_3 = Vector2(-x_axis_2.x, -x_axis_2.y)
-                x_axis_3.normalise()
-                y_axis_3.normalise()
-
-                x_axis_4 = y_axis_3
-                y_axis_4 = x_axis_1
-                x_axis_4.normalise()
-                y_axis_4.normalise()
-
-                angles = [Vector2(1.0, 0.0).signed_angle_to(x_axis_1, True),
-                          Vector2(1.0, 0.0).signed_angle_to(x_axis_2, True),
-                          Vector2(1.0, 0.0).signed_angle_to(x_axis_3, True),
-                          Vector2(1.0, 0.0).signed_angle_to(x_axis_4, True)]
-
-                smallest = None
-                for angle in angles:
-                    if smallest is None or abs(angle) < abs(smallest):
-                        smallest = angle
-                return smallest
-
-        def smallest_box(first_point_index, last_point_index, list_of_points):
-            box = Box()
-
-            first_point = list_of_points[first_point_index]
-            last_point = list_of_points[last_point_index]
-
-            box.U[0] = last_point - first_point
-            box.U[1] = box.U[0].get_perpendicular()
-            box.U0_square_length = box.U[0].square_length()
-            box.index = [last_point_index, last_point_index, last_point_index, last_point_index]
-
-            origin = copy.deepcopy(last_point)
-            support = []
-
-            for index in range(4):
-                support.append(Point2())
-
-            index = 0
-            for point in list_of_points:
-                diff = point - origin
-                v = Point2(box.U[0].dot(diff), box.U[1].dot(diff))
-
-                if v.x > support[1].x or (v.x == support[1].x and v.y > support[1].y):
-                    box.index[1] = index
-                    support[1] = v
-
-                if v.y > support[2].y or (v.y == support[2].y and v.x < support[2].x):
-                    box.index[2] = index
-                    support[2] = v
-
-                if v.x < support[3].x or (v.x == support[3].x and v.y < support[3].y):
-                    box.index[3] = index
-                    support[3] = v
-
-                index += 1
-
-            scaled_width = support[1].x - support[3].x
-            scaled_height = support[2].y
-            box.area = (scaled_height * scaled_width) / box.U0_square_length
-
-            return box
-
-        def compute_angles(list_of_points, box, a, num_a):
-            number_of_points = len(list_of_points)
-            num_a = 0
-            k0 = 3
-            k1 = 0
-
-            while k1 < 4:
-                if box.index[k0] != box.index[k1]:
-                    d = box.U[k0 & 1].invert() if k0 & 2 else box.U[k0 & 1]
-
-                    j0 = box.index[k0]
-                    j1 = j0 + 1
-
-                    if j1 == number_of_points:
-                        j1 = 0
-
-                    e = list_of_points[j1] - list_of_points[j0]
-                    dp = d.dot(e.get_perpendicular().invert())
-                    e_square_length = e.square_length()
-                    sin_theta_square = (dp * dp) / e_square_length
-                    a[num_a] = (sin_theta_square, k0)
-                    num_a += 1
-                k0 = k1
-                k1 += 1
-
-            return num_a > 0, num_a
-
-        def sort_angles(a, num_a):
-            sort = [0, 1, 2, 3]
-            if num_a > 1:
-                if num_a == 2:
-                    if a[sort[0]][0] > a[sort[1]][0]:
-                        sort = [sort[1], sort[0], sort[2], sort[3]]
-                elif num_a == 3:
-                    if a[sort[0]][0] > a[sort[1]][0]:
-                        sort = [sort[1], sort[0], sort[2], sort[3]]
-                    if a[sort[0]][0] > a[sort[2]][0]:
-                        sort = [sort[2], sort[1], sort[0], sort[3]]
-                    if a[sort[1]][0] > a[sort[2]][0]:
-                        sort = [sort[0], sort[2], sort[1], sort[3]]
-                else:
-                    if a[sort[0]][0] > a[sort[1]][0]:
-                        sort = [sort[1], sort[0], sort[2], sort[3]]
-                    if a[sort[2]][0] > a[sort[3]][0]:
-                        sort = [sort[0], sort[1], sort[3], sort[2]]
-                    if a[sort[0]][0] > a[sort[2]][0]:
-                        sort = [sort[2], sort[1], sort[0], sort[3]]
-                    if a[sort[1]][0] > a[sort[3]][0]:
-                        sort = [sort[0], sort[3], sort[2], sort[1]]
-                    if a[sort[1]][0] > a[sort[2]][0]:
-                        sort = [sort[0], sort[2], sort[1], sort[3]]
-
-            return sort
-
-        def update_support(a, num_a, sort, list_of_points, visited, box):
-            number_of_points = len(list_of_points)
-            a_min = a[sort[0]]
-            for k in range(num_a):
-                a_var = a[sort[k]]
-                if a_var[0] == a_min[0]:
-                    box.index[a_var[1]] += 1
-                    if box.index[a_var[1]] == number_of_points:
-                        box.index[a_var[1]] = 0
-                else:
-                    break
-
-            bottom = box.index[a_min[1]]
-            if bottom in visited:
-                return False, box
-            visited.append(bottom)
-            next_index = [0, 0, 0, 0]
-            for k in range(4):
-                next_index[k] = box.index[(a_min[1] + k) % 4]
-            box.index = next_index
-
-            j1 = box.index[0]
-            j0 = j1 - 1
-            if j0 < 0:
-                j0 = number_of_points - 1
-
-            box.U[0] = list_of_points[j1] - list_of_points[j0]
-            box.U[1] = box.U[0].get_perpendicular()
-            box.U0_square_length = box.U[0].square_length()
-
-            diff = [list_of_points[box.index[1]] - list_of_points[box.index[3]],
-                    list_of_points[box.index[2]] - list_of_points[box.index[0]]]
-            box.area = (box.U[0].dot(diff[0]) * box.U[1].dot(diff[1])) / box.U0_square_length
-            return True, box
-
-        path_points = self.get_convex_hull().get_list_of_points()
-        del path_points[-1]
-        new_path_points = []
-        for point in path_points:
-            if len(new_path_points) == 0:
-                new_path_points.append(point)
-                continue
-            if point == new_path_points[-1]:
-                continue
-            new_path_points.append(point)
-
-        path_points = new_path_points
-        number_of_path_points = len(path_points)
-
-        visited = []
-
-        min_box = smallest_box(number_of_path_points - 1, 0, path_points)
-        visited.append(min_box.index[0])
-
-        box = copy.deepcopy(min_box)
-        for i in range(number_of_path_points - 1):
-            a = [None, None, None, None]
-            num_a = 0
-            res, num_a = compute_angles(path_points, box, a, num_a)
-            if not res:
-                break
-
-            sort = sort_angles(a, num_a)
-            res, box = update_support(a, num_a, sort, path_points, visited, box)
-            if not res:
-                break
-
-            if box.area < min_box.area:
-                min_box = copy.deepcopy(box)
-
-        return min_box
+        """
+        Finds the smallest box around the path, by area, with rotating calipers around its convex hull.
+        The indices of the box are indices of the points of get_convex_hull_coordinates.
+
+        :return: the box
+        :rtype: OrientedBoundingBox2
+        :raises: IndexError: the path has fewer than three edges
+        """
+        if self.path_length < 3:
+            raise IndexError("There must be at least three edges")
+        return get_minimum_area_box(self.get_convex_hull_coordinates())
 
     def flip_vertical_centre(self):
         minimum_y = min(edge.minimum_y() for edge in self.list_of_edges)
@@ -706,6 +665,23 @@ class Path2:
     def update_path(self):
         for edge in self.list_of_edges:
             edge.centre = edge.calculate_centre()
+        self.invalidate()
+
+    def clone(self):
+        """
+        Copies the path without going through copy.deepcopy.
+        Every edge gets its own points, so points shared between edges are not shared in the copy.
+
+        :return: the copied path
+        :rtype: Path2
+        """
+        path = self.__class__.__new__(self.__class__)
+        path.__dict__.update(self.__dict__)
+        path.list_of_edges = [edge.clone() for edge in self.list_of_edges]
+        path._cache = None
+        path.layers = list(self.layers)
+        path.attributes = dict(self.attributes)
+        return path
 
     def to_path3(self):
         path_3d = geometry_utils.three_d.path3.Path3()
@@ -4,7 +4,7 @@ from geometry_utils.maths_utility import are_ints_or_floats, floats_are_close, E
 from geometry_utils.two_d.vector2 import Vector2, is_vector2
 
 
-class Point2:
+class Point2(object):
     """
     A class to create a 2D point
 
@@ -56,6 +56,8 @@ class Point2:
         Returns a 3D point from the 2D point with a z coordinate value of 0.0
     accuracy_fix(): Vector2
         Converts the 2D point coordinates with very low values to 0.0
+    clone(): Point2
+        Returns an independent copy of the 2D point
     """
 
     def __init__(self, x=0.0, y=0.0, w=1):
@@ -289,6 +291,17 @@ class Point2:
             self.y = 0.0
         return self
 
+    def clone(self):
+        """
+        Copies the 2D point without going through copy.deepcopy
+
+        :return: the copied point
+        :rtype: Point2
+        """
+        point = Point2.__new__(Point2)
+        point.__dict__.update(self.__dict__)
+        return point
+
 
 def is_point2(input_variable):
     """
@@ -21,4 +21,7 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     python_requires='>=2.7',
+    extras_require={
+        'numpy': ['numpy'],
+    },
 )